@@ -3,25 +3,46 @@
 key: 브랜드 이름, value: 브랜드 ID
 동적으로 새로운 브랜드 처리 가능
 JSON 파일로 데이터 저장/불러오기 지원
+
+데이터는 처음 조회할 때 불러오며(임포트 시 파일 I/O 없음),
+새 브랜드는 brand_sql.txt 끝에 한 행만 추가합니다.
+전체 SQL 파일 재생성은 generate_sql_file()로 명시적으로 실행합니다.
 """
 
 import json
 import os
 from typing import Optional
 
+from id_sequence import get_sequence
+from sql_writer import append_sql_values, find_append_position
+
 # 브랜드 데이터 파일 경로
 DEFAULT_DATA_FILE = "brand_data.json"
 SQL_OUTPUT_FILE = "brand_sql.txt"
 
+# brands 테이블 INSERT 헤더
+BRAND_SQL_HEADER = "INSERT INTO brands (id, name, is_deleted, created_at, updated_at) VALUES"
+
+# True면 새 브랜드를 SQL 파일 끝에 한 행씩 추가, False면 매번 전체 SQL 파일 재생성
+INCREMENTAL_SQL = True
+
 # 전역 변수
 BRAND_NAME_TO_ID = {}
 BRAND_ID_TO_NAME = {}
 _current_max_id = 0
 _id_sequence = 1
+_initialized = False
+
+def _ensure_initialized():
+    """처음 사용할 때 한 번만 데이터를 불러옵니다."""
+    if not _initialized:
+        _initialize_data()
 
 def _initialize_data():
     """데이터 초기화"""
-    global BRAND_NAME_TO_ID, BRAND_ID_TO_NAME, _current_max_id, _id_sequence
+    global BRAND_NAME_TO_ID, BRAND_ID_TO_NAME, _current_max_id, _id_sequence, _initialized
+
+    _initialized = True
 
     # JSON 파일에서 불러오기 시도
     if os.path.exists(DEFAULT_DATA_FILE):
@@ -34,6 +55,11 @@ def _initialize_data():
         _id_sequence = 1
         print(f"'{DEFAULT_DATA_FILE}' 파일을 찾을 수 없습니다. 새로 생성합니다.")
 
+def format_brand_values(brand_id: int, name: str) -> str:
+    """brands 테이블의 VALUES 행을 생성합니다."""
+    escaped_name = name.replace("'", "''")
+    return f"({brand_id}, '{escaped_name}', FALSE, NOW(), NOW())"
+
 def _update_sql_file(transaction=None):
     """
     전체 브랜드 목록으로 SQL 파일을 업데이트합니다.
@@ -43,14 +69,13 @@ def _update_sql_file(transaction=None):
         transaction: FileTransaction 객체 (트랜잭션 사용 시)
     """
     try:
-        sql_content = "INSERT INTO brands (id, name, is_deleted, created_at, updated_at) VALUES"
+        sql_content = BRAND_SQL_HEADER
 
         all_brands = get_all_brands()
         sql_lines = []
 
         for name, id_val in all_brands:
-            sql_line = f"({id_val}, '{name}', FALSE, NOW(), NOW())"
-            sql_lines.append(sql_line)
+            sql_lines.append(format_brand_values(id_val, name))
 
         if sql_lines:
             sql_content += "\n" + ",\n".join(sql_lines) + ";"
@@ -70,6 +95,19 @@ def _update_sql_file(transaction=None):
     except Exception as e:
         print(f"SQL 파일 업데이트 중 오류: {e}")
 
+def _append_sql_row(brand_id: int, name: str, transaction=None):
+    """
+    새 브랜드 한 행만 SQL 파일 끝에 추가합니다.
+    SQL 파일이 아직 없으면 전체 브랜드 목록으로 새로 생성합니다.
+    """
+    offset, _ = find_append_position(SQL_OUTPUT_FILE, transaction)
+    if offset is None:
+        _update_sql_file(transaction)
+        return
+
+    append_sql_values(SQL_OUTPUT_FILE, BRAND_SQL_HEADER, [format_brand_values(brand_id, name)], transaction)
+    print(f"SQL 파일에 브랜드가 추가되었습니다: {SQL_OUTPUT_FILE} (ID: {brand_id})")
+
 def get_brand_id(brand_name: str, transaction=None) -> Optional[int]:
     """
     브랜드 이름으로 ID를 조회합니다.
@@ -84,6 +122,8 @@ def get_brand_id(brand_name: str, transaction=None) -> Optional[int]:
     """
     global _current_max_id, _id_sequence
 
+    _ensure_initialized()
+
     # 브랜드 이름 정리
     cleaned_name = brand_name.strip()
 
@@ -95,19 +135,35 @@ def get_brand_id(brand_name: str, transaction=None) -> Optional[int]:
     if cleaned_name in BRAND_NAME_TO_ID:
         return BRAND_NAME_TO_ID[cleaned_name]
 
-    # 새로운 브랜드 자동 생성
-    new_id = _id_sequence
+    # 새로운 브랜드 자동 생성 (프로세스 간에 공유되는 "brands" 시퀀스에서 ID 할당)
+    sequence = get_sequence("brands", seed=lambda: _id_sequence)
+    new_id = sequence.next()
+    previous_state = (_id_sequence, _current_max_id)
     BRAND_NAME_TO_ID[cleaned_name] = new_id
     BRAND_ID_TO_NAME[new_id] = cleaned_name
 
     # 시퀀스 업데이트
-    _id_sequence += 1
-    _current_max_id = new_id
+    _id_sequence = max(_id_sequence, new_id + 1)
+    _current_max_id = max(_current_max_id, new_id)
 
     print(f"새로운 브랜드 생성: '{cleaned_name}' -> ID: {new_id}")
 
+    if transaction:
+        # 롤백 시 메모리의 브랜드 정보도 되돌림
+        def _discard_brand():
+            global _id_sequence, _current_max_id
+            BRAND_NAME_TO_ID.pop(cleaned_name, None)
+            BRAND_ID_TO_NAME.pop(new_id, None)
+            _id_sequence, _current_max_id = previous_state
+            sequence.release(new_id)
+
+        transaction.on_rollback(_discard_brand)
+
     # SQL 파일 업데이트 (트랜잭션 또는 일반 파일 쓰기)
-    _update_sql_file(transaction)
+    if INCREMENTAL_SQL:
+        _append_sql_row(new_id, cleaned_name, transaction)
+    else:
+        _update_sql_file(transaction)
 
     # 변경사항 파일에 저장
     if transaction:
@@ -133,6 +189,7 @@ def get_brand_name(brand_id: int) -> Optional[str]:
     Returns:
         str or None: 브랜드 이름 (존재하지 않으면 None)
     """
+    _ensure_initialized()
     return BRAND_ID_TO_NAME.get(brand_id)
 
 def get_all_brands() -> list:
@@ -142,6 +199,7 @@ def get_all_brands() -> list:
     Returns:
         list of tuple: (브랜드 이름, 브랜드 ID) 리스트, ID순으로 정렬
     """
+    _ensure_initialized()
     return sorted([(name, id_val) for name, id_val in BRAND_NAME_TO_ID.items()],
                   key=lambda x: x[1])  # ID순으로 정렬
 
@@ -152,6 +210,7 @@ def get_brand_count() -> int:
     Returns:
         int: 브랜드 수
     """
+    _ensure_initialized()
     return len(BRAND_NAME_TO_ID)
 
 def get_next_brand_id() -> int:
@@ -161,6 +220,7 @@ def get_next_brand_id() -> int:
     Returns:
         int: 다음 브랜드 ID
     """
+    _ensure_initialized()
     return _id_sequence
 
 def save_to_file(filename: str = DEFAULT_DATA_FILE) -> bool:
@@ -173,6 +233,8 @@ def save_to_file(filename: str = DEFAULT_DATA_FILE) -> bool:
     Returns:
         bool: 성공 여부
     """
+    _ensure_initialized()
+
     try:
         data = {
             'brands': BRAND_NAME_TO_ID,
@@ -198,7 +260,7 @@ def load_from_file(filename: str = DEFAULT_DATA_FILE) -> bool:
     Returns:
         bool: 성공 여부
     """
-    global BRAND_NAME_TO_ID, BRAND_ID_TO_NAME, _id_sequence, _current_max_id
+    global BRAND_NAME_TO_ID, BRAND_ID_TO_NAME, _id_sequence, _current_max_id, _initialized
 
     if not os.path.exists(filename):
         print(f"파일을 찾을 수 없습니다: {filename}")
@@ -213,12 +275,10 @@ def load_from_file(filename: str = DEFAULT_DATA_FILE) -> bool:
         BRAND_ID_TO_NAME = {v: k for k, v in BRAND_NAME_TO_ID.items()}
         _id_sequence = data['next_id']
         _current_max_id = max(BRAND_ID_TO_NAME.keys()) if BRAND_ID_TO_NAME else 0
+        _initialized = True
 
         print(f"브랜드 데이터를 '{filename}' 파일에서 불러왔습니다. (총 {len(BRAND_NAME_TO_ID)}개)")
 
-        # SQL 파일 업데이트
-        _update_sql_file()
-
         return True
 
     except Exception as e:
@@ -235,6 +295,8 @@ def search_brands(keyword: str) -> list:
     Returns:
         list: 검색된 브랜드 목록 [(name, id), ...]
     """
+    _ensure_initialized()
+
     keyword = keyword.lower()
     results = []
 
@@ -271,16 +333,15 @@ def export_brands_to_txt(filename: str = "brands_export.txt") -> bool:
 
 def generate_sql_file(transaction=None):
     """
-    현재 브랜드 목록으로 SQL 파일을 생성합니다.
+    현재 브랜드 목록으로 SQL 파일 전체를 다시 생성합니다.
+    (SQL 파일이 없거나 손상되었을 때 명시적으로 실행)
 
     Args:
         transaction: FileTransaction 객체 (트랜잭션 사용 시)
     """
+    _ensure_initialized()
     _update_sql_file(transaction)
 
-# 모듈 로드 시 데이터 초기화
-_initialize_data()
-
 # 디버깅 및 테스트용
 if __name__ == "__main__":
     # 현재 상태 출력
@@ -0,0 +1,460 @@
+"""
+SQLite 카탈로그 저장소
+상품/브랜드/상품정보 제공고시/이미지/옵션을 로컬 SQLite 데이터베이스에 저장합니다.
+
+파일 저장 방식(JSON + SQL 텍스트 파일) 대신 사용할 수 있는 선택적 저장소입니다.
+상품 한 개의 모든 데이터는 하나의 SQLite 트랜잭션으로 저장되며,
+중복 상품/브랜드 조회는 인덱스를 사용합니다.
+MySQL에 넣을 INSERT ... VALUES 파일은 export_sql()로 따로 생성합니다.
+ID는 파일 저장 방식과 같은 공유 시퀀스(id_sequence)에서 받으므로 두 방식을 함께 사용해도 ID가 겹치지 않습니다.
+"""
+
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+
+from brand_mapping import BRAND_SQL_HEADER, format_brand_values
+from detailImg import DETAIL_IMAGES_SQL_HEADER, format_detail_image_values
+from main_images_mapping import MAIN_IMAGES_SQL_HEADER, format_main_image_values
+from product_mapping import PRODUCT_SQL_HEADER, format_product_values, generate_random_datetime, load_product_data
+from productDetailInfoProvided import FIELD_MAP, DETAILINFO_SQL_HEADER, format_detailinfo_values
+from product_options_mapping import OPTIONS_SQL_HEADER, build_option_row, format_option_values
+from product_record import DUPLICATE_PRODUCT_MESSAGE
+from id_sequence import get_sequence
+
+# 데이터베이스 파일 경로
+DEFAULT_DB_PATH = "catalog.db"
+
+# SQL 내보내기 디렉토리
+DEFAULT_EXPORT_DIR = "sql_export"
+
+# INSERT 문 하나에 넣을 최대 행 수 (MySQL max_allowed_packet 초과 방지)
+EXPORT_BATCH_SIZE = 1000
+
+# 기존 파일 저장 방식의 데이터 파일 (최초 생성 시 ID와 브랜드를 가져옴)
+LEGACY_BRAND_FILE = "brand_data.json"
+LEGACY_DETAILINFO_FILE = "detailinfo_data.json"
+
+DETAILINFO_COLUMNS = list(FIELD_MAP.values())
+
+# ID 시퀀스 이름 (테이블명과 같음)
+SEQUENCE_NAMES = ("products", "brands", "product_detail_info")
+
+# 기존 파일 데이터를 가져온 데이터베이스 표시 (PRAGMA user_version)
+SCHEMA_VERSION = 1
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS brands (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+-- 중복 확인용 상품명 인덱스 (기존 JSON 파일의 상품명 포함)
+CREATE TABLE IF NOT EXISTS product_names (
+    name TEXT PRIMARY KEY,
+    product_id INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS products (
+    id INTEGER PRIMARY KEY,
+    product_detail_info_id INTEGER NOT NULL,
+    brand_id INTEGER,
+    category_id INTEGER NOT NULL,
+    product_name TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS product_detail_info (
+    id INTEGER PRIMARY KEY,
+    {", ".join(f"{column} TEXT NOT NULL DEFAULT ''" for column in DETAILINFO_COLUMNS)}
+);
+
+CREATE TABLE IF NOT EXISTS product_main_images (
+    product_id INTEGER NOT NULL,
+    display_order INTEGER NOT NULL,
+    image_url TEXT NOT NULL,
+    PRIMARY KEY (product_id, display_order)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS product_detail_images (
+    product_id INTEGER NOT NULL,
+    display_order INTEGER NOT NULL,
+    image_url TEXT NOT NULL,
+    PRIMARY KEY (product_id, display_order)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS product_options (
+    product_id INTEGER NOT NULL,
+    display_order INTEGER NOT NULL,
+    option_name TEXT NOT NULL,
+    purchase_price INTEGER NOT NULL,
+    selling_price INTEGER NOT NULL,
+    current_stock INTEGER NOT NULL,
+    initial_stock INTEGER NOT NULL,
+    safety_stock INTEGER NOT NULL,
+    image_url TEXT NOT NULL,
+    is_deleted INTEGER NOT NULL,
+    PRIMARY KEY (product_id, display_order)
+) WITHOUT ROWID;
+"""
+
+
+def _load_legacy_json(file_path):
+    """기존 JSON 데이터 파일을 읽습니다. (없거나 깨진 경우 None)"""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _write_insert_file(file_path, header, rows, batch_size=EXPORT_BATCH_SIZE, terminator=";\n\n"):
+    """
+    VALUES 행을 스트리밍하여 INSERT 문 파일을 작성합니다.
+    batch_size 행마다 새 INSERT 문을 시작하며, 임시 파일에 쓴 뒤 교체합니다.
+
+    Args:
+        file_path: 출력 파일 경로
+        header: INSERT 헤더 ("... VALUES"로 끝남)
+        rows: VALUES 행 이터레이터
+        batch_size: INSERT 문 하나에 넣을 최대 행 수
+        terminator: INSERT 문 종료 문자열
+
+    Returns:
+        int: 작성한 행 수
+    """
+    temp_path = file_path + ".tmp"
+    count = 0
+
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        for values in rows:
+            if count % batch_size == 0:
+                if count:
+                    f.write(terminator)
+                f.write(header + "\n")
+            else:
+                f.write(",\n")
+            f.write(values)
+            count += 1
+
+        if count:
+            f.write(terminator)
+
+    os.replace(temp_path, file_path)
+    return count
+
+
+class CatalogStore:
+    """
+    SQLite 기반 카탈로그 저장소
+
+    사용 예:
+        with CatalogStore() as store:
+            product_id = store.save_product(record)
+            store.export_sql()
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        """
+        Args:
+            db_path: SQLite 데이터베이스 파일 경로
+        """
+        self.db_path = db_path
+        # 트랜잭션은 transaction()에서 직접 관리
+        self.conn = sqlite3.connect(db_path, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._allocated = []  # 저장 중인 상품에 할당한 ID [(시퀀스 이름, ID)] (롤백 시 반납)
+
+        # 새 데이터베이스면 기존 파일의 브랜드와 상품명을 가져옴
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            self._seed_from_legacy()
+
+        # 공유 시퀀스가 기존 JSON 파일과 이 데이터베이스에 있는 ID 다음부터 할당하도록 최솟값 반영
+        self.sequences = {}
+        for name, min_next_id in self._min_next_ids().items():
+            self.sequences[name] = get_sequence(name)
+            self.sequences[name].ensure_minimum(min_next_id)
+
+    @contextmanager
+    def transaction(self):
+        """
+        쓰기 트랜잭션 (예외 발생 시 롤백)
+        BEGIN IMMEDIATE로 시작하여 다른 프로세스와 쓰기가 겹치지 않습니다.
+        """
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        else:
+            self.conn.execute("COMMIT")
+
+    def _seed_from_legacy(self):
+        """기존 JSON 파일의 브랜드와 상품명을 가져옵니다. (최초 1회)"""
+        product_data = load_product_data()
+        brand_data = _load_legacy_json(LEGACY_BRAND_FILE) or {"brands": {}, "next_id": 1}
+
+        with self.transaction() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO brands (id, name) VALUES (?, ?)",
+                [(brand_id, name) for name, brand_id in brand_data.get("brands", {}).items()]
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO product_names (name, product_id) VALUES (?, ?)",
+                list(product_data.get("products", {}).items())
+            )
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        print(f"[CatalogStore] 기존 데이터 가져오기 완료 "
+              f"(상품명 {len(product_data.get('products', {}))}개, 브랜드 {len(brand_data.get('brands', {}))}개)")
+
+    def _min_next_ids(self):
+        """시퀀스별 다음 ID의 최솟값 (기존 JSON 파일의 next_id, 이 데이터베이스의 최대 ID + 1 중 큰 값)"""
+        legacy_next_ids = {
+            "products": load_product_data().get("next_id", 1),
+            "brands": (_load_legacy_json(LEGACY_BRAND_FILE) or {}).get("next_id", 1),
+            "product_detail_info": (_load_legacy_json(LEGACY_DETAILINFO_FILE) or {}).get("next_id", 1),
+        }
+        return {
+            name: max(legacy_next_ids[name],
+                      self.conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {name}").fetchone()[0] + 1)
+            for name in SEQUENCE_NAMES
+        }
+
+    def _next_id(self, name):
+        """공유 시퀀스에서 다음 ID를 할당합니다. (트랜잭션 안에서 호출, 롤백 시 _release_allocated()로 반납)"""
+        new_id = self.sequences[name].next()
+        self._allocated.append((name, new_id))
+        return new_id
+
+    def _release_allocated(self):
+        """롤백된 상품에 할당한 ID를 시퀀스에 반납합니다. (다음 상품이 같은 ID를 사용)"""
+        for name, released_id in reversed(self._allocated):
+            self.sequences[name].release(released_id)
+        self._allocated = []
+
+    def has_product(self, product_name):
+        """
+        이미 저장된 상품명인지 확인합니다.
+
+        Args:
+            product_name (str): 상품명
+
+        Returns:
+            bool: 존재 여부
+        """
+        row = self.conn.execute("SELECT 1 FROM product_names WHERE name = ?", (product_name,)).fetchone()
+        return row is not None
+
+    def product_names(self):
+        """
+        저장된 모든 상품명을 반환합니다. (다른 스레드에서 중복 확인용으로 미리 읽어 둘 때 사용)
+
+        Returns:
+            set: 상품명 집합
+        """
+        return {row[0] for row in self.conn.execute("SELECT name FROM product_names")}
+
+    def _get_or_create_brand(self, brand_name):
+        """브랜드 ID를 조회하고 없으면 새로 생성합니다. (트랜잭션 안에서 호출)"""
+        cleaned_name = (brand_name or "").strip()
+        if not cleaned_name:
+            return None
+
+        row = self.conn.execute("SELECT id FROM brands WHERE name = ?", (cleaned_name,)).fetchone()
+        if row:
+            return row[0]
+
+        brand_id = self._next_id("brands")
+        self.conn.execute("INSERT INTO brands (id, name) VALUES (?, ?)", (brand_id, cleaned_name))
+        print(f"[CatalogStore] 새로운 브랜드 생성: '{cleaned_name}' -> ID: {brand_id}")
+        return brand_id
+
+    def save_product(self, record):
+        """
+        상품 한 개의 모든 데이터를 하나의 트랜잭션으로 저장합니다.
+
+        Args:
+            record (dict): crawl.collect_product_record()가 반환한 상품 데이터
+                brand, category_id, product_name, main_image_urls,
+                detail_info, detail_image_urls, product_options
+
+        Returns:
+            int: 새로 생성된 제품 ID
+
+        Raises:
+            ValueError: 이미 존재하는 제품명인 경우
+        """
+        self._allocated = []
+
+        try:
+            product_id, detail_info_id = self._insert_product(record)
+        except BaseException:
+            self._release_allocated()
+            raise
+
+        self._allocated = []
+
+        print(f"[CatalogStore] 상품 저장 완료 (ID: {product_id}, 상세정보 ID: {detail_info_id})")
+        return product_id
+
+    def _insert_product(self, record):
+        """
+        save_product()의 상품 한 개 저장 트랜잭션
+
+        Returns:
+            tuple: (제품 ID, 상세정보 ID)
+        """
+        product_name = record["product_name"]
+
+        with self.transaction() as conn:
+            if self.has_product(product_name):
+                raise ValueError(f"{DUPLICATE_PRODUCT_MESSAGE} (product_name: {product_name})")
+
+            brand_id = self._get_or_create_brand(record["brand"])
+            product_id = self._next_id("products")
+            detail_info_id = self._next_id("product_detail_info")
+
+            conn.execute("INSERT INTO product_names (name, product_id) VALUES (?, ?)", (product_name, product_id))
+            conn.execute(
+                "INSERT INTO products (id, product_detail_info_id, brand_id, category_id, product_name, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (product_id, detail_info_id, brand_id, record["category_id"], product_name,
+                 generate_random_datetime())
+            )
+
+            detail_info = record.get("detail_info") or {}
+            conn.execute(
+                f"INSERT INTO product_detail_info (id, {', '.join(DETAILINFO_COLUMNS)}) "
+                f"VALUES (?, {', '.join('?' for _ in DETAILINFO_COLUMNS)})",
+                [detail_info_id] + [str(detail_info.get(key, "")) for key in FIELD_MAP]
+            )
+
+            conn.executemany(
+                "INSERT INTO product_main_images (product_id, display_order, image_url) VALUES (?, ?, ?)",
+                [(product_id, idx, url) for idx, url in enumerate(record["main_image_urls"])]
+            )
+            conn.executemany(
+                "INSERT INTO product_detail_images (product_id, display_order, image_url) VALUES (?, ?, ?)",
+                [(product_id, idx, url) for idx, url in enumerate(record["detail_image_urls"])]
+            )
+
+            option_rows = [build_option_row(option, idx) for idx, option in enumerate(record["product_options"])]
+            conn.executemany(
+                "INSERT INTO product_options (product_id, display_order, option_name, purchase_price, "
+                "selling_price, current_stock, initial_stock, safety_stock, image_url, is_deleted) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(product_id, row["display_order"], row["option_name"], row["purchase_price"],
+                  row["selling_price"], row["current_stock"], row["initial_stock"], row["safety_stock"],
+                  row["image_url"], int(row["is_deleted"])) for row in option_rows]
+            )
+
+        return product_id, detail_info_id
+
+    def counts(self):
+        """
+        테이블별 행 수를 반환합니다.
+
+        Returns:
+            dict: {테이블명: 행 수}
+        """
+        tables = ["brands", "products", "product_detail_info", "product_main_images",
+                  "product_detail_images", "product_options"]
+        return {table: self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] for table in tables}
+
+    def _iter_option_values(self):
+        cursor = self.conn.execute(
+            "SELECT product_id, display_order, option_name, purchase_price, selling_price, current_stock, "
+            "initial_stock, safety_stock, image_url, is_deleted FROM product_options "
+            "ORDER BY product_id, display_order"
+        )
+        for (product_id, display_order, option_name, purchase_price, selling_price, current_stock,
+             initial_stock, safety_stock, image_url, is_deleted) in cursor:
+            row = {
+                "option_name": option_name,
+                "purchase_price": purchase_price,
+                "selling_price": selling_price,
+                "current_stock": current_stock,
+                "initial_stock": initial_stock,
+                "safety_stock": safety_stock,
+                "image_url": image_url,
+                "display_order": display_order,
+                "is_deleted": bool(is_deleted),
+            }
+            yield format_option_values(product_id, row)
+
+    def _iter_detailinfo_values(self):
+        cursor = self.conn.execute(
+            f"SELECT id, {', '.join(DETAILINFO_COLUMNS)} FROM product_detail_info ORDER BY id"
+        )
+        for row in cursor:
+            product_info = dict(zip(FIELD_MAP.keys(), row[1:]))
+            yield format_detailinfo_values(row[0], product_info)
+
+    def export_sql(self, output_dir=DEFAULT_EXPORT_DIR, batch_size=EXPORT_BATCH_SIZE):
+        """
+        저장된 데이터를 MySQL에 넣을 INSERT ... VALUES 파일로 내보냅니다.
+        파일명과 행 형식은 기존 SQL 텍스트 파일과 같습니다.
+
+        Args:
+            output_dir: 출력 디렉토리
+            batch_size: INSERT 문 하나에 넣을 최대 행 수
+
+        Returns:
+            dict: {파일명: 작성한 행 수}
+        """
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+
+        conn = self.conn
+        exports = [
+            ("brand_sql.txt", BRAND_SQL_HEADER,
+             (format_brand_values(brand_id, name)
+              for brand_id, name in conn.execute("SELECT id, name FROM brands ORDER BY id"))),
+            ("product_data_sql.txt", PRODUCT_SQL_HEADER,
+             (format_product_values(*row) for row in conn.execute(
+                 "SELECT id, product_detail_info_id, brand_id, category_id, product_name, created_at "
+                 "FROM products ORDER BY id"))),
+            ("product_detailinfo_provided_sql.txt", DETAILINFO_SQL_HEADER, self._iter_detailinfo_values()),
+            ("product_main_images_sql.txt", MAIN_IMAGES_SQL_HEADER,
+             (format_main_image_values(*row) for row in conn.execute(
+                 "SELECT product_id, display_order, image_url FROM product_main_images "
+                 "ORDER BY product_id, display_order"))),
+            ("detail_image_urls_sql.txt", DETAIL_IMAGES_SQL_HEADER,
+             (format_detail_image_values(*row) for row in conn.execute(
+                 "SELECT product_id, display_order, image_url FROM product_detail_images "
+                 "ORDER BY product_id, display_order"))),
+            ("product_options_sql.txt", OPTIONS_SQL_HEADER, self._iter_option_values()),
+        ]
+
+        results = {}
+        for filename, header, rows in exports:
+            file_path = os.path.join(output_dir, filename)
+            results[filename] = _write_insert_file(file_path, header, rows, batch_size)
+            print(f"[CatalogStore] SQL 내보내기: {file_path} ({results[filename]}행)")
+
+        return results
+
+    def close(self):
+        """데이터베이스 연결 종료"""
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+# 디버깅 및 테스트용
+if __name__ == "__main__":
+    with CatalogStore() as store:
+        for table, count in store.counts().items():
+            print(f"  {table}: {count}개")
+
+        store.export_sql()
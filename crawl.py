@@ -1,34 +1,119 @@
 """
 상품 상세 페이지 크롤링 모듈
 트랜잭션을 적용하여 원자성을 보장합니다.
+
+상세 페이지 데이터 수집(collect_product_record)과 저장을 분리하여
+같은 수집 결과를 파일(save_product_record) 또는 SQLite 카탈로그 저장소(CatalogStore)에 저장합니다.
+
+모듈 임포트 시에는 파일 I/O를 하지 않습니다.
+파일 저장 방식으로 크롤링할 때는 시작 전에 initialize_output_files()를 호출합니다.
 """
 
 from file_transaction import FileTransaction
-from brand_mapping import get_brand_id
+from brand_mapping import get_brand_id, get_brand_count
 from category_mapping import get_category_id
 from mainImgCol import get_main_image_urls
-from main_images_mapping import update_product_main_images_sql
+from main_images_mapping import update_product_main_images_sql, create_initial_product_main_images_sql
 from productInfo import print_product_info, get_product_basic_info
-from detailImg import get_detail_image_urls
-from product_mapping import create_product_id, update_product_data_sql, create_product_id_with_transaction
-from productDetailInfoProvided import get_product_dtailinfo_provided
+from detailImg import get_detail_image_urls, append_detail_images_sql
+from product_mapping import create_product_id, update_product_data_sql, create_product_id_with_transaction, product_exists, create_initial_product_data_sql, get_product_index
+from productDetailInfoProvided import collect_product_detailinfo, append_detailinfo_sql, get_next_detailinfo_id
 from option import get_product_options, save_product_options # 민석 추가, 저장 함수 추가
-from product_options_mapping import create_product_options_sql, create_product_options_sql_with_validation
+from product_options_mapping import create_product_options_sql, create_product_options_sql_with_validation, filter_valid_options
+from page_extractor import extract_product_page, MAIN_IMAGE_COUNT
+from embedded_state import read_embedded_state, extract_product_state, merge_pages
+from product_record import check_product_options, DUPLICATE_PRODUCT_MESSAGE
 
+# True면 기본 정보/옵션/정보 제공고시를 execute_script 한 번으로 추출
+# (스크립트 추출이 실패하면 기존 요소별 추출 함수로 대체)
+USE_SCRIPT_EXTRACTION = True
 
-def crawl_product_on_detail_page(driver, transaction, product_counter):
+# True면 페이지에 포함된 상태 JSON(__NEXT_DATA__)을 먼저 읽어 옵션/이미지/정보 제공고시를 가져옴
+# (옵션 드롭다운 클릭과 메인 이미지 슬라이드 이동 생략, 빠진 항목만 스크립트/요소별 추출로 보충)
+USE_EMBEDDED_STATE = True
+
+
+def initialize_output_files():
     """
-    상품 상세 페이지에서 데이터를 크롤링하고 파일을 업데이트합니다.
-    모든 작업은 트랜잭션 내에서 수행되며, 예외 발생 시 자동으로 롤백됩니다.
+    크롤링 시작 전에 SQL 출력 파일과 매핑 데이터를 준비합니다.
+    (SQL 파일이 없으면 INSERT 헤더만 있는 파일 생성, 상품/브랜드 데이터 로드)
+    """
+    create_initial_product_data_sql()
+    create_initial_product_main_images_sql()
+    get_product_index()
+    get_brand_count()
+
+
+def _extract_page_with_script(driver):
+    """
+    스크립트 한 번으로 상세 페이지를 추출합니다.
+    실패하거나 상품명을 찾지 못하면 None을 반환합니다. (요소별 추출로 대체)
+    """
+    try:
+        page = extract_product_page(driver)
+    except Exception as e:
+        print(f"✗ 스크립트 추출 실패, 요소별 추출로 대체합니다: {e}")
+        return None
+
+    if not page["product_name"]:
+        print("✗ 스크립트 추출 결과에 상품명이 없어 요소별 추출로 대체합니다.")
+        return None
+
+    return page
+
+
+def _extract_page_from_state(driver):
+    """
+    상태 JSON에서 상세 페이지 데이터를 추출합니다.
+    상태 JSON이 없거나 상품명을 찾지 못하면 None을 반환합니다.
+    """
+    try:
+        page = extract_product_state(read_embedded_state(driver))
+    except Exception as e:
+        print(f"✗ 상태 JSON 추출 실패: {e}")
+        return None
+
+    if not page["product_name"]:
+        return None
+
+    print(f"✓ 상태 JSON 추출 완료: 메인 이미지 {len(page['main_image_urls'])}개, "
+          f"옵션 {len(page['product_options'])}개, 정보 제공고시 {len(page['detail_info'])}개 항목")
+    return page
+
+
+def _extract_page(driver):
+    """
+    상세 페이지의 기본 정보/옵션/정보 제공고시를 가능한 적은 브라우저 작업으로 추출합니다.
+    상태 JSON에 필요한 항목이 모두 있으면 스크립트 추출(옵션 드롭다운 클릭)을 건너뜁니다.
+    둘 다 실패하면 None을 반환합니다. (요소별 추출로 대체)
+    """
+    state_page = _extract_page_from_state(driver) if USE_EMBEDDED_STATE else None
+    if state_page and state_page["product_options"] and state_page["detail_info"]:
+        return state_page
+
+    script_page = _extract_page_with_script(driver) if USE_SCRIPT_EXTRACTION else None
+    if state_page and script_page:
+        return merge_pages(state_page, script_page)
+    return state_page or script_page
+
+
+def collect_product_record(driver, product_counter, is_duplicate=None):
+    """
+    상품 상세 페이지에서 데이터를 수집합니다. 파일이나 DB에는 아무것도 쓰지 않습니다.
 
     Args:
         driver: Selenium WebDriver 객체
-        transaction: FileTransaction 객체
         product_counter: 현재 상품 번호 (로깅용)
+        is_duplicate: 상품명을 받아 이미 저장된 상품인지 반환하는 함수
+                      (있으면 상세 정보 수집 전에 중복 상품을 걸러냄)
+
+    Returns:
+        dict: 상품 데이터
+              brand, category_id, product_name, main_image_urls,
+              detail_info, detail_image_urls, product_options
 
     Raises:
         ValueError: 필수 데이터가 없거나 유효하지 않은 경우
-        Exception: 크롤링 중 발생하는 모든 예외
     """
 
     print(f"\n{'=' * 60}")
@@ -39,7 +124,12 @@ def crawl_product_on_detail_page(driver, transaction, product_counter):
     # 1단계: 상품 기본 정보 수집 (병국)
     # ============================================================
     print("\n[1단계] 상품 기본 정보 수집 중...")
-    category, brand, product_name = get_product_basic_info(driver)
+    page = _extract_page(driver)
+
+    if page:
+        category, brand, product_name = page["category"], page["brand"], page["product_name"]
+    else:
+        category, brand, product_name = get_product_basic_info(driver)
 
     print(f"  - 카테고리: {category}")
     print(f"  - 브랜드: {brand}")
@@ -49,7 +139,11 @@ def crawl_product_on_detail_page(driver, transaction, product_counter):
     # 2단계: 상품 메인 이미지 수집
     # ============================================================
     print("\n[2단계] 메인 이미지 수집 중...")
-    main_image_urls = get_main_image_urls(driver, 3)
+    if page and page.get("main_image_urls"):
+        # 1단계 상태 JSON 추출 결과 사용 (슬라이드 이동 생략)
+        main_image_urls = page["main_image_urls"][:MAIN_IMAGE_COUNT]
+    else:
+        main_image_urls = get_main_image_urls(driver, MAIN_IMAGE_COUNT)
 
     # 예외 처리: 메인 이미지가 없는 경우
     if not main_image_urls:
@@ -58,13 +152,9 @@ def crawl_product_on_detail_page(driver, transaction, product_counter):
     print(f"  ✓ {len(main_image_urls)}개의 메인 이미지 수집 완료")
 
     # ============================================================
-    # 3단계: Brand ID 및 Category ID 확인
+    # 3단계: Category ID 확인 및 중복 상품 확인
     # ============================================================
-    print("\n[3단계] Brand ID 및 Category ID 확인 중...")
-
-    # brand_id 찾기 및 브랜드 SQL 파일 업데이트 (트랜잭션 적용)
-    brand_id = get_brand_id(brand, transaction)
-    print(f"  - Brand ID: {brand_id}")
+    print("\n[3단계] Category ID 및 중복 상품 확인 중...")
 
     # category_id 찾기
     category_id = get_category_id(category)
@@ -74,39 +164,40 @@ def crawl_product_on_detail_page(driver, transaction, product_counter):
     if category_id == 0:
         raise ValueError(f"Error: 상품 {product_counter} - 유효한 카테고리 ID를 찾지 못했습니다. (category: {category})")
 
-    # ============================================================
-    # 4단계: Product ID 생성
-    # ============================================================
-    print("\n[4단계] Product ID 생성 중...")
-    product_id = create_product_id_with_transaction(product_name, transaction)
-    print(f"  - Product ID: {product_id}")
-
-    # 예외 처리: product_id가 0인 경우 (이미 존재하는 상품)
-    if product_id == 0:
-        raise ValueError(f"Error: 상품 {product_counter} - 이미 존재하는 제품명입니다. (product_name: {product_name})")
+    # 예외 처리: 이미 존재하는 상품 (상세 정보 수집 전에 확인)
+    if is_duplicate and is_duplicate(product_name):
+        raise ValueError(f"Error: 상품 {product_counter} - {DUPLICATE_PRODUCT_MESSAGE} (product_name: {product_name})")
 
     # ============================================================
-    # 5단계: 상품 정보 제공 고시 수집 (소라)
+    # 4단계: 상품 정보 제공 고시 수집 (소라)
     # ============================================================
-    print("\n[5단계] 상품 정보 제공 고시 수집 중...")
-    product_detail_info, product_detail_info_id = get_product_dtailinfo_provided(
-        driver,
-        transaction,
-        filename="product_detailinfo_provided_sql.txt"
-    )
-    print(f"  ✓ 상품 정보 제공 고시 수집 완료 (ID: {product_detail_info_id})")
+    print("\n[4단계] 상품 정보 제공 고시 수집 중...")
+    if page:
+        # 1단계 스크립트 추출 결과 사용
+        detail_info = page["detail_info"]
+        if detail_info:
+            print(f"  ✓ 상품 정보 제공 고시 수집 완료")
+        else:
+            print(f"✗ 상품정보 제공고시 테이블을 찾지 못했습니다.")
+    else:
+        try:
+            detail_info = collect_product_detailinfo(driver)
+            print(f"  ✓ 상품 정보 제공 고시 수집 완료")
+        except Exception as e:
+            # 정보 제공 고시는 없어도 상품 저장은 계속 진행
+            print(f"✗ 상품정보 제공고시 수집 실패: {e}")
+            detail_info = {}
 
     # ============================================================
-    # 6단계: 상품 상세 이미지 수집 (소라)
+    # 5단계: 상품 상세 이미지 수집 (소라)
     # ============================================================
-    print("\n[6단계] 상품 상세 이미지 수집 중...")
-
-    detail_image_urls = get_detail_image_urls(
-        driver,
-        product_id,
-        transaction,
-        filename="detail_image_urls_sql.txt"
-    )
+    print("\n[5단계] 상품 상세 이미지 수집 중...")
+    # (파일 저장은 save_product_record에서 Product ID 생성 후 수행)
+    if page and page.get("detail_image_urls"):
+        # 1단계 상태 JSON 추출 결과 사용 (스크롤 생략)
+        detail_image_urls = page["detail_image_urls"]
+    else:
+        detail_image_urls = get_detail_image_urls(driver, product_id=0, transaction=None)
 
     # 예외 처리: 상세 이미지가 없는 경우
     if not detail_image_urls:
@@ -115,86 +206,183 @@ def crawl_product_on_detail_page(driver, transaction, product_counter):
     print(f"  ✓ {len(detail_image_urls)}개의 상세 이미지 수집 완료")
 
     # ============================================================
-    # 7단계: 상품 데이터 SQL 업데이트
+    # 6단계: 상품 옵션 정보 수집 (민석)
     # ============================================================
-    print("\n[7단계] 상품 데이터 SQL 업데이트 중...")
+    print("\n[6단계] 상품 옵션 정보 수집 중...")
+    product_options = page["product_options"] if page else get_product_options(driver)
 
-    # 현재 SQL 파일 읽기
-    try:
-        with open("product_data_sql.txt", "r", encoding="utf-8") as f:
-            current_sql = f.read()
-    except FileNotFoundError:
-        current_sql = "INSERT INTO products (id, product_detail_info_id, brand_id, category_id, delivery_policy_id, use_restock_noti, product_name, product_code, search_keywords, exposure_status, sale_status, description, is_cancelable, is_deleted, created_at, updated_at) VALUES"
+    check_product_options(product_options, product_counter)
 
-    # SQL 생성
-    from product_mapping import generate_random_datetime
-    created_at = generate_random_datetime()
+    print(f"  ✓ {len(product_options)}개의 옵션 수집 완료")
 
-    insert_statement = f"({product_id}, {product_detail_info_id}, {brand_id}, {category_id}, 2, FALSE, '{product_name}', 'NONE', '{product_name}', 'EXPOSURE', 'ON_SALE', '설명없음', true, false, '{created_at}', '{created_at}')"
+    return {
+        "brand": brand,
+        "category_id": category_id,
+        "product_name": product_name,
+        "main_image_urls": main_image_urls,
+        "detail_info": detail_info,
+        "detail_image_urls": detail_image_urls,
+        "product_options": product_options,
+    }
 
-    # SQL 업데이트 (트랜잭션 적용)
-    current_sql = current_sql.strip()
-    if current_sql.endswith(';'):
-        current_sql = current_sql[:-1].rstrip()
 
-    if current_sql.endswith('VALUES'):
-        new_sql = current_sql + f"\n{insert_statement};"
-    else:
-        new_sql = current_sql + f",\n{insert_statement};"
+def save_product_record(record, transaction, product_counter):
+    """
+    수집한 상품 데이터를 JSON/SQL 파일에 저장합니다.
+    모든 작업은 트랜잭션 내에서 수행되며, 예외 발생 시 자동으로 롤백됩니다.
 
-    transaction.write_file("product_data_sql.txt", new_sql)
-    print(f"  ✓ 상품 데이터 SQL 업데이트 완료 (ID: {product_id})")
+    Args:
+        record: collect_product_record()가 반환한 상품 데이터
+        transaction: FileTransaction 객체
+        product_counter: 현재 상품 번호 (로깅용)
+
+    Returns:
+        int: 새로 생성된 제품 ID
+
+    Raises:
+        ValueError: 이미 존재하는 상품인 경우
+    """
+    product_name = record["product_name"]
 
     # ============================================================
-    # 8단계: 메인 이미지 SQL 업데이트
+    # 1단계: Brand ID 확인 및 Product ID 생성
     # ============================================================
-    print("\n[8단계] 메인 이미지 SQL 업데이트 중...")
-    update_product_main_images_sql(product_id, main_image_urls, transaction)
-    print(f"  ✓ 메인 이미지 SQL 업데이트 완료")
+    print("\n[저장 1단계] Brand ID 확인 및 Product ID 생성 중...")
+
+    # brand_id 찾기 및 브랜드 SQL 파일 업데이트 (트랜잭션 적용)
+    brand_id = get_brand_id(record["brand"], transaction)
+    print(f"  - Brand ID: {brand_id}")
+
+    product_id = create_product_id_with_transaction(product_name, transaction)
+    print(f"  - Product ID: {product_id}")
+
+    # 예외 처리: product_id가 0인 경우 (이미 존재하는 상품)
+    if product_id == 0:
+        raise ValueError(f"Error: 상품 {product_counter} - {DUPLICATE_PRODUCT_MESSAGE} (product_name: {product_name})")
 
     # ============================================================
-    # 9단계: 상품 옵션 정보 수집 (민석)
+    # 2단계: 상품 정보 제공 고시 SQL 저장
     # ============================================================
-    print("\n[9단계] 상품 옵션 정보 수집 중...")
-    product_options = get_product_options(driver)
+    print("\n[저장 2단계] 상품 정보 제공 고시 SQL 저장 중...")
+    product_detail_info_id = get_next_detailinfo_id(transaction)
+    append_detailinfo_sql(
+        product_detail_info_id,
+        record["detail_info"],
+        transaction,
+        filename="product_detailinfo_provided_sql.txt"
+    )
 
-    # 예외 처리: 옵션이 없는 경우
-    if not product_options:
-        raise ValueError(f"Error: 상품 {product_counter} - 상품 옵션 배열이 비어있습니다.")
+    # ============================================================
+    # 3단계: 상품 상세 이미지 SQL 저장
+    # ============================================================
+    print("\n[저장 3단계] 상품 상세 이미지 SQL 저장 중...")
+    append_detail_images_sql(product_id, record["detail_image_urls"], transaction, filename="detail_image_urls_sql.txt")
 
-    # 옵션의 price 값 검사 -> 0 이라면 예외 발생
-    for idx, option in enumerate(product_options, start=1):
-        price = option.get("price")
-        if price == 0:
-            raise ValueError(
-                f"Error: 상품 {product_counter} - 옵션 {idx}의 price 값이 0입니다. 전체 옵션: {product_options}"
-            )
+    # ============================================================
+    # 4단계: 상품 데이터 SQL 업데이트
+    # ============================================================
+    print("\n[저장 4단계] 상품 데이터 SQL 업데이트 중...")
 
+    # SQL 파일 끝에 추가 (트랜잭션 적용)
+    update_product_data_sql(
+        product_id=product_id,
+        product_detail_info_id=product_detail_info_id,
+        brand_id=brand_id,
+        category_id=record["category_id"],
+        product_name=product_name,
+        transaction=transaction
+    )
+    print(f"  ✓ 상품 데이터 SQL 업데이트 완료 (ID: {product_id})")
 
-    print(f"  ✓ {len(product_options)}개의 옵션 수집 완료")
+    # ============================================================
+    # 5단계: 메인 이미지 SQL 업데이트
+    # ============================================================
+    print("\n[저장 5단계] 메인 이미지 SQL 업데이트 중...")
+    update_product_main_images_sql(product_id, record["main_image_urls"], transaction)
+    print(f"  ✓ 메인 이미지 SQL 업데이트 완료")
 
     # ============================================================
-    # 10단계: 옵션 SQL 생성 및 저장
+    # 6단계: 옵션 SQL 생성 및 저장
     # ============================================================
-    print("\n[10단계] 옵션 SQL 생성 중...")
+    print("\n[저장 6단계] 옵션 SQL 생성 중...")
     create_product_options_sql_with_validation(
         product_id=product_id,
-        product_options=product_options,
+        product_options=record["product_options"],
         transaction=transaction,
         filename="product_options_sql.txt"
     )
     print(f"  ✓ 옵션 SQL 생성 완료")
 
-    # ============================================================
-    # 완료
-    # ============================================================
+    _print_summary(record, product_id, product_counter)
+    return product_id
+
+
+def _print_summary(record, product_id, product_counter):
+    """상품 처리 결과 요약 출력"""
     print(f"\n{'=' * 60}")
     print(f"상품 {product_counter} 데이터 수집 완료!")
     print(f"  - Product ID: {product_id}")
-    print(f"  - 상품명: {product_name}")
-    print(f"  - 메인 이미지: {len(main_image_urls)}개")
-    print(f"  - 상세 이미지: {len(detail_image_urls)}개")
-    print(f"  - 옵션: {len(product_options)}개")
+    print(f"  - 상품명: {record['product_name']}")
+    print(f"  - 메인 이미지: {len(record['main_image_urls'])}개")
+    print(f"  - 상세 이미지: {len(record['detail_image_urls'])}개")
+    print(f"  - 옵션: {len(record['product_options'])}개")
     print(f"{'=' * 60}\n")
 
 
+def crawl_product_on_detail_page(driver, transaction, product_counter):
+    """
+    상품 상세 페이지에서 데이터를 크롤링하고 파일을 업데이트합니다.
+    모든 작업은 트랜잭션 내에서 수행되며, 예외 발생 시 자동으로 롤백됩니다.
+
+    Args:
+        driver: Selenium WebDriver 객체
+        transaction: FileTransaction 객체
+        product_counter: 현재 상품 번호 (로깅용)
+
+    Raises:
+        ValueError: 필수 데이터가 없거나 유효하지 않은 경우
+        Exception: 크롤링 중 발생하는 모든 예외
+    """
+    record = collect_product_record(driver, product_counter, is_duplicate=product_exists)
+    save_product_record(record, transaction, product_counter)
+
+
+def store_product_record(record, store, product_counter):
+    """
+    수집한 상품 데이터를 SQLite 카탈로그 저장소에 저장합니다.
+    상품 한 개의 모든 데이터는 하나의 SQLite 트랜잭션으로 저장됩니다.
+
+    Args:
+        record: collect_product_record()가 반환한 상품 데이터
+        store: CatalogStore 객체
+        product_counter: 현재 상품 번호 (로깅용)
+
+    Returns:
+        int: 새로 생성된 제품 ID
+
+    Raises:
+        ValueError: 이미 존재하는 상품인 경우
+    """
+    # 파일 저장 방식과 같은 기준으로 유효한 옵션만 저장
+    record["product_options"] = filter_valid_options(record["product_options"])
+
+    product_id = store.save_product(record)
+    _print_summary(record, product_id, product_counter)
+    return product_id
+
+
+def crawl_product_to_store(driver, store, product_counter):
+    """
+    상품 상세 페이지에서 데이터를 크롤링하여 SQLite 카탈로그 저장소에 저장합니다.
+    상품 한 개의 모든 데이터는 하나의 SQLite 트랜잭션으로 저장됩니다.
+
+    Args:
+        driver: Selenium WebDriver 객체
+        store: CatalogStore 객체
+        product_counter: 현재 상품 번호 (로깅용)
+
+    Raises:
+        ValueError: 필수 데이터가 없거나 유효하지 않은 경우 (중복 상품 포함)
+    """
+    record = collect_product_record(driver, product_counter, is_duplicate=store.has_product)
+    store_product_record(record, store, product_counter)
@@ -0,0 +1,313 @@
+"""
+크롤링 진행 상태(frontier) 저장 모듈
+목록 페이지와 상품 상세 URL의 처리 상태를 SQLite 파일에 기록하여,
+크롤러가 중간에 종료되어도 다시 실행하면 멈춘 위치부터 이어서 진행합니다.
+
+- 목록 페이지: 상품 URL을 수집한 페이지는 done, 다음 실행은 마지막 done 페이지의 다음 페이지부터 수집
+- 상품: pending(대기) → in_progress(처리 중) → done(저장 완료) / skipped(이미 저장된 상품) / failed(실패)
+  done / skipped 상품은 다시 상세 페이지를 열지 않고, failed 상품은 MAX_ATTEMPTS번 실패할 때까지만 다시 시도합니다.
+  종료 시점에 in_progress였던 상품은 다음 실행에서 pending으로 되돌립니다.
+
+목록은 시작 URL(pageIdx / rowsPerPage 제외)로 구분하고, 상품은 상품번호(goodsNo)로 구분하므로
+다른 카테고리에서 이미 저장한 상품도 다시 열지 않습니다.
+크롤러 프로세스 하나가 파일 하나를 사용하는 것을 전제로 합니다.
+"""
+
+import sqlite3
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# 데이터베이스 파일 경로
+DEFAULT_DB_PATH = "crawl_frontier.db"
+
+# 상태 값
+PENDING = "pending"
+IN_PROGRESS = "in_progress"
+DONE = "done"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+# 상품을 시도하는 최대 횟수 (이 횟수만큼 실패하면 다시 시도하지 않음)
+MAX_ATTEMPTS = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS listings (
+    listing_key TEXT PRIMARY KEY,
+    rows_per_page INTEGER,
+    complete INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS listing_pages (
+    listing_key TEXT NOT NULL,
+    page_idx INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    product_count INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (listing_key, page_idx)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS products (
+    goods_no TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    name TEXT,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID;
+
+-- 목록별 상품 순서 (같은 상품이 여러 목록에 나올 수 있음)
+CREATE TABLE IF NOT EXISTS listing_products (
+    listing_key TEXT NOT NULL,
+    goods_no TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (listing_key, goods_no)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_products_status ON products (status);
+"""
+
+
+def listing_key(start_url):
+    """목록 URL에서 페이지 파라미터(pageIdx / rowsPerPage)를 뺀 키"""
+    parts = urlsplit(start_url)
+    params = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+              if k not in ("pageIdx", "rowsPerPage")]
+    return urlunsplit(parts._replace(query=urlencode(params)))
+
+
+class CrawlFrontier:
+    """
+    목록 하나의 크롤링 진행 상태
+
+    사용 예:
+        with CrawlFrontier(start_url, rows_per_page=48) as frontier:
+            for page_idx in paginator.iter_pages(driver, frontier.next_listing_page()):
+                frontier.add_listing_page(page_idx, products, last_page=paginator.last_page)
+            for product in frontier.pending_products():
+                frontier.mark_in_progress(product["goods_no"])
+                ...
+                frontier.mark_done(product["goods_no"])
+    """
+
+    def __init__(self, start_url, rows_per_page=None, db_path=DEFAULT_DB_PATH):
+        """
+        Args:
+            start_url: 목록 페이지 URL
+            rows_per_page: 한 페이지 상품 수 (이전 실행과 다르면 목록 페이지 번호가 달라지므로 목록을 처음부터 수집)
+            db_path: SQLite 데이터베이스 파일 경로
+        """
+        self.listing_key = listing_key(start_url)
+        self.db_path = db_path
+        # 상태 변경마다 바로 커밋 (autocommit), 여러 문장은 transaction()으로 묶음
+        self.conn = sqlite3.connect(db_path, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+        with self.transaction() as conn:
+            row = conn.execute("SELECT rows_per_page FROM listings WHERE listing_key = ?",
+                               (self.listing_key,)).fetchone()
+            if row is None:
+                conn.execute("INSERT INTO listings (listing_key, rows_per_page, updated_at) VALUES (?, ?, ?)",
+                             (self.listing_key, rows_per_page, time.time()))
+            elif rows_per_page and row[0] != rows_per_page:
+                print(f"[Frontier] 페이지당 상품 수가 바뀌어({row[0]} → {rows_per_page}) 목록을 처음부터 다시 수집합니다.")
+                conn.execute("DELETE FROM listing_pages WHERE listing_key = ?", (self.listing_key,))
+                conn.execute("UPDATE listings SET rows_per_page = ?, complete = 0, updated_at = ? "
+                             "WHERE listing_key = ?", (rows_per_page, time.time(), self.listing_key))
+
+            # 이전 실행이 처리 도중 종료된 상품은 다시 대기 상태로
+            recovered = conn.execute("UPDATE products SET status = ? WHERE status = ?",
+                                     (PENDING, IN_PROGRESS)).rowcount
+
+        if recovered:
+            print(f"[Frontier] 이전 실행에서 처리 중이던 상품 {recovered}개를 대기 상태로 되돌렸습니다.")
+
+    @contextmanager
+    def transaction(self):
+        """쓰기 트랜잭션 (예외 발생 시 롤백)"""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        else:
+            self.conn.execute("COMMIT")
+
+    # ========================================
+    # 목록 페이지
+    # ========================================
+
+    @property
+    def listing_complete(self):
+        """목록의 모든 페이지에서 상품 URL을 수집했는지 여부"""
+        row = self.conn.execute("SELECT complete FROM listings WHERE listing_key = ?",
+                                (self.listing_key,)).fetchone()
+        return bool(row and row[0])
+
+    def next_listing_page(self):
+        """다음에 수집할 목록 페이지 번호 (수집한 페이지가 없으면 1)"""
+        row = self.conn.execute(
+            "SELECT MAX(page_idx) FROM listing_pages WHERE listing_key = ? AND status = ?",
+            (self.listing_key, DONE)
+        ).fetchone()
+        return (row[0] or 0) + 1
+
+    def add_listing_page(self, page_idx, products, last_page=None):
+        """
+        목록 페이지에서 수집한 상품을 대기 상태로 추가하고 페이지를 완료로 표시합니다. (하나의 트랜잭션)
+        이미 있는 상품(다른 목록에서 수집했거나 이미 처리한 상품)의 상태는 바꾸지 않습니다.
+
+        Args:
+            page_idx: 목록 페이지 번호
+            products: [{"goods_no": ..., "url": ..., "name": ...}, ...]
+            last_page: 마지막 페이지 번호 (알면 이 페이지까지 수집했을 때 목록 완료로 표시)
+
+        Returns:
+            int: 새로 추가된 상품 수
+        """
+        now = time.time()
+
+        with self.transaction() as conn:
+            position = conn.execute("SELECT COALESCE(MAX(position), 0) FROM listing_products WHERE listing_key = ?",
+                                    (self.listing_key,)).fetchone()[0]
+            added = 0
+            for product in products:
+                added += conn.execute(
+                    "INSERT OR IGNORE INTO products (goods_no, url, name, status, updated_at) VALUES (?, ?, ?, ?, ?)",
+                    (product["goods_no"], product["url"], product.get("name"), PENDING, now)
+                ).rowcount
+                position += 1
+                conn.execute(
+                    "INSERT OR IGNORE INTO listing_products (listing_key, goods_no, position) VALUES (?, ?, ?)",
+                    (self.listing_key, product["goods_no"], position)
+                )
+
+            conn.execute(
+                "INSERT OR REPLACE INTO listing_pages (listing_key, page_idx, status, product_count, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (self.listing_key, page_idx, DONE, len(products), now)
+            )
+            if last_page is not None and page_idx >= last_page:
+                conn.execute("UPDATE listings SET complete = 1, updated_at = ? WHERE listing_key = ?",
+                             (now, self.listing_key))
+
+        return added
+
+    def mark_listing_complete(self):
+        """목록을 완료로 표시합니다. (마지막 페이지 번호를 모른 채 목록 끝에 도달한 경우)"""
+        self.conn.execute("UPDATE listings SET complete = 1, updated_at = ? WHERE listing_key = ?",
+                          (time.time(), self.listing_key))
+
+    def mark_listing_page_failed(self, page_idx):
+        """목록 페이지를 실패로 기록합니다. (다음 실행에서 이 페이지부터 다시 수집)"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO listing_pages (listing_key, page_idx, status, updated_at) VALUES (?, ?, ?, ?)",
+            (self.listing_key, page_idx, FAILED, time.time())
+        )
+
+    # ========================================
+    # 상품
+    # ========================================
+
+    def pending_products(self, limit=0):
+        """
+        이 목록에서 처리할 상품 (대기 중이거나, 실패했지만 시도 횟수가 남은 상품) 목록 순서대로
+
+        Args:
+            limit: 최대 개수 (0이면 모두)
+
+        Returns:
+            list of dict: [{"goods_no": ..., "url": ..., "name": ...}, ...]
+        """
+        query = (
+            "SELECT p.goods_no, p.url, p.name FROM listing_products lp "
+            "JOIN products p ON p.goods_no = lp.goods_no "
+            "WHERE lp.listing_key = ? AND (p.status = ? OR (p.status = ? AND p.attempts < ?)) "
+            "ORDER BY lp.position"
+        )
+        params = [self.listing_key, PENDING, FAILED, MAX_ATTEMPTS]
+        if limit > 0:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        return [{"goods_no": goods_no, "url": url, "name": name}
+                for goods_no, url, name in self.conn.execute(query, params)]
+
+    def mark_in_progress(self, goods_no):
+        """상품 처리 시작"""
+        self.conn.execute(
+            "UPDATE products SET status = ?, updated_at = ? WHERE goods_no = ?",
+            (IN_PROGRESS, time.time(), goods_no)
+        )
+
+    def mark_done(self, goods_no):
+        """상품 저장 완료"""
+        self.conn.execute(
+            "UPDATE products SET status = ?, last_error = NULL, updated_at = ? WHERE goods_no = ?",
+            (DONE, time.time(), goods_no)
+        )
+
+    def mark_skipped(self, goods_no, reason=None):
+        """이미 저장된 상품이라 건너뜀 (다시 시도하지 않음)"""
+        self.conn.execute(
+            "UPDATE products SET status = ?, last_error = ?, updated_at = ? WHERE goods_no = ?",
+            (SKIPPED, str(reason) if reason is not None else None, time.time(), goods_no)
+        )
+
+    def mark_failed(self, goods_no, error=None):
+        """상품 처리 실패 (시도 횟수 증가, 시도 횟수가 남아있으면 다음 실행에서 다시 시도)"""
+        self.conn.execute(
+            "UPDATE products SET status = ?, attempts = attempts + 1, last_error = ?, updated_at = ? "
+            "WHERE goods_no = ?",
+            (FAILED, str(error) if error is not None else None, time.time(), goods_no)
+        )
+
+    def counts(self):
+        """
+        이 목록의 상태별 상품 수
+
+        Returns:
+            dict: {상태: 상품 수}
+        """
+        rows = self.conn.execute(
+            "SELECT p.status, COUNT(*) FROM listing_products lp JOIN products p ON p.goods_no = lp.goods_no "
+            "WHERE lp.listing_key = ? GROUP BY p.status", (self.listing_key,)
+        )
+        counts = {PENDING: 0, IN_PROGRESS: 0, DONE: 0, SKIPPED: 0, FAILED: 0}
+        counts.update(dict(rows))
+        return counts
+
+    def summary(self):
+        """진행 상태 요약 문자열"""
+        counts = self.counts()
+        listing = "완료" if self.listing_complete else f"{self.next_listing_page() - 1}페이지까지 수집"
+        return (f"목록 {listing}, 상품 완료 {counts[DONE]}개 / 대기 {counts[PENDING]}개 / "
+                f"건너뜀 {counts[SKIPPED]}개 / 실패 {counts[FAILED]}개")
+
+    def close(self):
+        """데이터베이스 연결 종료"""
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+# 디버깅 및 테스트용: 저장된 목록별 진행 상태 출력
+if __name__ == "__main__":
+    conn = sqlite3.connect(DEFAULT_DB_PATH)
+    conn.executescript(SCHEMA)
+    for (key,) in conn.execute("SELECT listing_key FROM listings").fetchall():
+        frontier = CrawlFrontier(key)
+        print(f"{key[:100]}...")
+        print(f"  {frontier.summary()}")
+        frontier.close()
+    conn.close()
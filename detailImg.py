@@ -1,13 +1,96 @@
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import time
+from page_wait import wait_for_element, wait_for_lazy_images, wait_for_network_idle
+
+# 상세 설명 이미지 선택자
+DETAIL_IMAGE_SELECTOR = ".speedycat-container img"
+
+# True면 속성에서 URL을 찾지 못한 이미지가 있을 때 페이지를 스크롤하여 lazy loading 이미지를 로딩
+SCROLL_FALLBACK = True
+
+# 스크롤 방식: 한 번에 스크롤할 거리 (px) / 위치마다 이미지 로딩을 기다리는 최대 시간 (초)
+SCROLL_STEP = 500
+SCROLL_PAUSE = 0.5
+
+# 모든 상세 이미지의 URL을 한 번에 읽는 스크립트 ({urls: [...], total: 이미지 요소 수})
+READ_DETAIL_IMAGES_SCRIPT = """
+var imgs = document.querySelectorAll(arguments[0]);
+var urls = [];
+imgs.forEach(function (img) {
+    var attrs = ['data-src', 'data-original', 'src'];
+    for (var i = 0; i < attrs.length; i++) {
+        var url = img.getAttribute(attrs[i]);
+        if (url && url.indexOf('data:image') !== 0) { urls.push(url); break; }
+    }
+});
+return {urls: urls, total: imgs.length};
+"""
+
+# product_detail_images 테이블 INSERT 헤더
+DETAIL_IMAGES_SQL_HEADER = "INSERT INTO product_detail_images (product_id, display_order, image_url) VALUES"
+
+
+def format_detail_image_values(product_id: int, display_order: int, image_url: str) -> str:
+    """상세 이미지 한 개의 VALUES 행을 생성합니다."""
+    return f"({product_id}, {display_order}, '{image_url}')"
+
+
+def append_detail_images_sql(product_id: int, detail_urls, transaction, filename: str):
+    """
+    상세 이미지 INSERT문을 트랜잭션으로 파일 끝에 추가합니다.
+
+    Args:
+        product_id: 상품 ID
+        detail_urls: 상세 이미지 URL 리스트
+        transaction: FileTransaction 객체
+        filename: SQL 파일명
+    """
+    sql_lines = []
+    for idx, url in enumerate(detail_urls):
+        sql_lines.append(format_detail_image_values(product_id, idx, url))
+    sql_text = DETAIL_IMAGES_SQL_HEADER + "\n"
+    sql_text += ",\n".join(sql_lines) + ";\n\n"
+
+    # 트랜잭션으로 파일에 추가
+    transaction.append_file(filename, sql_text)
+    print(f"상세 이미지 INSERT문이 '{filename}'에 트랜잭션으로 저장되었습니다.")
+
+
+def read_detail_image_urls(driver):
+    """
+    상세 설명 이미지의 URL을 스크롤 없이 스크립트 한 번으로 읽습니다.
+    (lazy loading 속성 data-src / data-original을 src보다 먼저 사용, data:image 자리표시자 제외)
+
+    Returns:
+        tuple: (URL 리스트, 전체 이미지 요소 수)
+    """
+    result = driver.execute_script(READ_DETAIL_IMAGES_SCRIPT, DETAIL_IMAGE_SELECTOR) or {}
+    return result.get("urls") or [], result.get("total") or 0
+
+
+def scroll_to_load_images(driver):
+    """
+    페이지를 조금씩 스크롤하며 lazy loading 이미지가 URL을 받도록 합니다.
+    (스크롤한 영역의 이미지가 URL을 받으면 바로 다음 위치로 이동, 최대 SCROLL_PAUSE초)
+    """
+    last_height = driver.execute_script("return document.body.scrollHeight")
+    current_pos = 0
+
+    while current_pos < last_height:
+        driver.execute_script(f"window.scrollTo(0, {current_pos});")
+        wait_for_lazy_images(driver, DETAIL_IMAGE_SELECTOR, timeout=SCROLL_PAUSE)
+        current_pos += SCROLL_STEP
+        last_height = driver.execute_script("return document.body.scrollHeight")
 
 
 def get_detail_image_urls(driver, product_id: int, transaction, filename: str = None): # transaction 인자 추가
     """
     상품 상세 이미지 가져오는 함수 (트랜잭션 적용)
+    이미지 요소의 속성에서 URL을 바로 읽고, URL이 없는 이미지가 남아있을 때만 스크롤하여 로딩합니다.
     """
+    # Selenium은 실제 크롤링 시에만 임포트 (SQL 포맷 함수만 쓰는 모듈은 Selenium 불필요)
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.common.by import By
+
     try:
         wait = WebDriverWait(driver, 10)
 
@@ -19,47 +102,28 @@ def get_detail_image_urls(driver, product_id: int, transaction, filename: str =
                 )
             )
             more_button.click()
-            time.sleep(1)
         except:
             print("더보기 버튼 없음")
 
-        # 페이지 조금씩 스크롤하며 이미지 로딩 대기
-        SCROLL_PAUSE = 0.5
-        last_height = driver.execute_script("return document.body.scrollHeight")
-        current_pos = 0
-
-        while current_pos < last_height:
-            driver.execute_script(f"window.scrollTo(0, {current_pos});")
-            time.sleep(SCROLL_PAUSE)
-            current_pos += 500  # 500px씩 스크롤
-            last_height = driver.execute_script("return document.body.scrollHeight")
-
-        # 이미지 URL 수집
-        imgs = driver.find_elements(By.CSS_SELECTOR, ".speedycat-container img")
-        detail_urls = []
-        for img in imgs:
-            for attr in ["data-src", "data-original", "src"]:
-                url = img.get_attribute(attr)
-                if url and not url.startswith("data:image"):
-                    detail_urls.append(url)
-                    break
+        # 상세 설명 이미지 요소가 나타나면 바로 속성에서 URL 읽기
+        wait_for_element(driver, DETAIL_IMAGE_SELECTOR, timeout=3)
+        detail_urls, total = read_detail_image_urls(driver)
+
+        if SCROLL_FALLBACK and (not total or len(detail_urls) < total):
+            # lazy loading 속성이 없는 이미지가 있으면 기존처럼 스크롤하여 로딩
+            print(f"URL이 없는 상세 이미지가 있어 스크롤하여 로딩합니다. ({len(detail_urls)}/{total})")
+            wait_for_network_idle(driver, timeout=3)
+            scroll_to_load_images(driver)
+            detail_urls, total = read_detail_image_urls(driver)
 
         print(f"상세 이미지 {len(detail_urls)}개 수집 완료")
 
         # INSERT문 생성 및 트랜잭션으로 파일 추가
         if detail_urls and filename:
-            sql_lines = []
-            for idx, url in enumerate(detail_urls):
-                sql_lines.append(f"({product_id}, {idx}, '{url}')")
-            sql_text = "INSERT INTO product_detail_images (product_id, display_order, image_url) VALUES\n"
-            sql_text += ",\n".join(sql_lines) + ";\n\n"
-
-            # 트랜잭션으로 파일에 추가
-            transaction.append_file(filename, sql_text)
-            print(f"상세 이미지 INSERT문이 '{filename}'에 트랜잭션으로 저장되었습니다.")
+            append_detail_images_sql(product_id, detail_urls, transaction, filename)
 
         return detail_urls if detail_urls else None
 
     except Exception as e:
         print("상세 이미지 가져오기 실패:", e)
-        return None
\ No newline at end of file
+        return None
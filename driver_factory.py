@@ -0,0 +1,247 @@
+"""
+크롤링용 브라우저 설정 모듈
+
+1. 드라이버 프로필
+   headless 여부, 페이지 로딩 전략(normal / eager / none), 창 크기, 확장 프로그램, 렌더러 프로세스 수를
+   프로필 이름 하나로 묶어 실행마다 고를 수 있습니다. (환경 변수 CRAWL_DRIVER_PROFILE)
+   페이지 준비는 page_wait의 조건 대기로 확인하므로 eager / none 전략에서도 크롤링 흐름은 같습니다.
+
+2. 리소스 차단
+   크롤링에는 이미지 URL만 필요하고 이미지 파일 자체는 필요 없으므로,
+   이미지 / 폰트 / 동영상 / 분석(트래커) 요청을 브라우저 단계에서 막아 페이지 로딩 시간과 트래픽을 줄입니다.
+   - 이미지: Chrome 설정(prefs)으로 모든 탭에서 다운로드 차단
+     (설정은 유지되는 프로필에 저장되므로 차단하지 않을 때는 허용으로 다시 설정)
+   - 폰트 / 동영상 / 트래커: CDP Network.setBlockedURLs로 URL 패턴 차단 (탭마다 적용 필요)
+     확장자는 URL 경로 끝에서만 비교하여 경로 중간이나 파라미터에 확장자가 들어간 요청은 막지 않습니다.
+   요청만 막으므로 img 요소의 src / data-src 속성은 DOM에 그대로 남아있습니다.
+"""
+
+import os
+
+# 사용할 드라이버 프로필 이름 (환경 변수 CRAWL_DRIVER_PROFILE로 실행마다 변경 가능)
+DRIVER_PROFILE = os.environ.get("CRAWL_DRIVER_PROFILE", "desktop")
+
+# 드라이버 프로필
+#   headless: 화면 없이 실행 (디스플레이 서버가 없는 서버용)
+#   page_load_strategy: normal(모든 리소스 로딩 완료) / eager(DOM 준비) / none(기다리지 않음)
+#   window_size: (가로, 세로), None이면 최대화
+#   disable_extensions: 확장 프로그램 비활성화
+#   renderer_process_limit: 렌더러 프로세스 최대 수 (None이면 Chrome 기본값)
+#   page_load_timeout: driver.get 최대 대기 시간 (초, None이면 Selenium 기본값)
+DRIVER_PROFILES = {
+    # 기존 설정 (화면 표시, 최대화, 전체 페이지 로딩)
+    "desktop": {
+        "headless": False,
+        "page_load_strategy": "normal",
+        "window_size": None,
+        "disable_extensions": False,
+        "renderer_process_limit": None,
+        "page_load_timeout": None,
+    },
+    # 화면은 표시하되 DOM이 준비되면 바로 진행
+    "fast": {
+        "headless": False,
+        "page_load_strategy": "eager",
+        "window_size": None,
+        "disable_extensions": True,
+        "renderer_process_limit": 4,
+        "page_load_timeout": 60,
+    },
+    # 서버 배포용 (디스플레이 서버 없이 실행)
+    "server": {
+        "headless": True,
+        "page_load_strategy": "eager",
+        "window_size": (1920, 1080),
+        "disable_extensions": True,
+        "renderer_process_limit": 2,
+        "page_load_timeout": 60,
+    },
+}
+
+# 실행 간에 유지할 Chrome 사용자 데이터(프로필) 디렉토리 (환경 변수 CRAWL_USER_DATA_DIR로 변경 가능)
+# 같은 디렉토리는 브라우저 하나만 사용할 수 있으므로 워커 풀의 추가 브라우저는 임시 프로필 + 세션 복원 사용
+USER_DATA_DIR = os.environ.get("CRAWL_USER_DATA_DIR", "chrome_profile")
+
+# 모든 프로필에 공통으로 적용하는 Chrome 옵션
+BASE_ARGUMENTS = (
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+)
+
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36")
+
+# True면 크롤링 드라이버에서 이미지/폰트/동영상/트래커 요청 차단
+BLOCK_RESOURCES = True
+
+# Chrome 설정: 이미지 다운로드 차단 (2 = 차단)
+BLOCK_IMAGES_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+}
+
+# Chrome 설정: 이미지 다운로드 허용 (1 = 허용, 이전 실행의 차단 설정이 프로필에 남아있을 때 해제)
+ALLOW_IMAGES_PREFS = {
+    "profile.managed_default_content_settings.images": 1,
+}
+
+
+def _extension_patterns(*extensions):
+    """확장자로 끝나는 URL 패턴 (쿼리 문자열이 붙은 URL 포함)"""
+    return tuple(pattern for ext in extensions for pattern in (f"*.{ext}", f"*.{ext}?*"))
+
+
+# CDP Network.setBlockedURLs 패턴 ('*'는 임의의 문자열, 패턴은 URL 전체와 비교)
+# 이미지는 Chrome 설정으로만 차단 ("*.png*" 같은 패턴은 상품 / 옵션 이미지 URL이 파라미터에 들어간 요청까지 막음)
+BLOCKED_URL_PATTERNS = (
+    # 폰트
+    *_extension_patterns("woff", "woff2", "ttf", "otf", "eot"),
+    # 동영상
+    *_extension_patterns("mp4", "webm", "m3u8"),
+    # 분석 / 광고 트래커
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*connect.facebook.net*", "*criteo.com*", "*criteo.net*", "*wcs.naver.net*",
+    "*clarity.ms*", "*hotjar.com*", "*appsflyer.com*", "*branch.io*",
+)
+
+
+def add_blocking_preferences(options, block=True):
+    """
+    ChromeOptions에 이미지 차단 설정을 추가합니다. (드라이버 생성 전에 호출)
+
+    Args:
+        options: uc.ChromeOptions 객체
+        block: False면 이미지 허용으로 설정 (유지되는 프로필에 남은 이전 실행의 차단 설정 해제)
+    """
+    prefs = dict(options.experimental_options.get("prefs") or {})
+    prefs.update(BLOCK_IMAGES_PREFS if block else ALLOW_IMAGES_PREFS)
+    options.add_experimental_option("prefs", prefs)
+
+
+def apply_resource_blocking(driver, patterns=BLOCKED_URL_PATTERNS):
+    """
+    현재 탭에 URL 패턴 차단을 적용합니다. (드라이버 생성 후, 새 탭을 열 때마다 호출)
+
+    Args:
+        driver: 웹드라이버
+        patterns: 차단할 URL 패턴
+
+    Returns:
+        bool: 적용 성공 여부
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+    except Exception as e:
+        print(f"✗ 리소스 차단 적용 실패 (차단 없이 진행): {e}")
+        return False
+
+    # 새 탭에도 같은 패턴을 적용할 수 있도록 드라이버에 기록
+    driver.blocked_url_patterns = tuple(patterns)
+    return True
+
+
+def prepare_new_tab(driver):
+    """
+    새로 연 탭(현재 탭)에 드라이버에 적용된 리소스 차단을 다시 적용합니다.
+    (Network.setBlockedURLs는 탭마다 따로 적용됨)
+    """
+    patterns = getattr(driver, "blocked_url_patterns", None)
+    if patterns:
+        apply_resource_blocking(driver, patterns)
+
+
+def get_driver_profile(name=None):
+    """
+    드라이버 프로필 설정을 반환합니다.
+
+    Args:
+        name: 프로필 이름 (None이면 DRIVER_PROFILE)
+
+    Returns:
+        dict: 프로필 설정 (desktop 프로필 값을 기본값으로 채움)
+
+    Raises:
+        ValueError: 없는 프로필 이름인 경우
+    """
+    name = name or DRIVER_PROFILE
+    if name not in DRIVER_PROFILES:
+        raise ValueError(f"알 수 없는 드라이버 프로필입니다: {name} (사용 가능: {', '.join(DRIVER_PROFILES)})")
+
+    profile = dict(DRIVER_PROFILES["desktop"])
+    profile.update(DRIVER_PROFILES[name])
+    profile["name"] = name
+    return profile
+
+
+def apply_driver_profile(options, profile):
+    """
+    ChromeOptions에 프로필 설정을 적용합니다. (headless는 uc.Chrome 인자로 전달)
+
+    Args:
+        options: uc.ChromeOptions 객체
+        profile: get_driver_profile()이 반환한 설정
+    """
+    options.page_load_strategy = profile["page_load_strategy"]
+
+    if profile["window_size"]:
+        width, height = profile["window_size"]
+        options.add_argument(f"--window-size={width},{height}")
+    else:
+        options.add_argument("--start-maximized")
+
+    if profile["headless"]:
+        options.add_argument("--disable-gpu")
+    if profile["disable_extensions"]:
+        options.add_argument("--disable-extensions")
+    if profile["renderer_process_limit"]:
+        options.add_argument(f"--renderer-process-limit={profile['renderer_process_limit']}")
+
+
+def create_chrome_driver(profile_name=None, version_main=None, extra_arguments=(), block_resources=None,
+                         user_data_dir=None):
+    """
+    프로필 설정으로 크롤링용 Chrome 드라이버를 생성합니다.
+
+    Args:
+        profile_name: 드라이버 프로필 이름 (None이면 DRIVER_PROFILE)
+        version_main: Chrome 주 버전 (None이면 자동 매칭)
+        extra_arguments: 추가 Chrome 옵션
+        block_resources: 리소스 차단 여부 (None이면 BLOCK_RESOURCES)
+        user_data_dir: 유지할 사용자 데이터 디렉토리 (None이면 실행마다 새 임시 프로필)
+
+    Returns:
+        uc.Chrome: 웹드라이버
+    """
+    import undetected_chromedriver as uc
+
+    profile = get_driver_profile(profile_name)
+    if block_resources is None:
+        block_resources = BLOCK_RESOURCES
+
+    options = uc.ChromeOptions()
+    for argument in BASE_ARGUMENTS + tuple(extra_arguments):
+        options.add_argument(argument)
+    options.add_argument(f"user-agent={USER_AGENT}")
+    apply_driver_profile(options, profile)
+
+    # 이미지/폰트/동영상/트래커 요청 차단 (URL 속성은 DOM에 그대로 남음)
+    # 차단하지 않을 때도 이미지 설정을 명시하여 유지되는 프로필에 이전 실행의 차단 설정이 남지 않게 함
+    add_blocking_preferences(options, block=block_resources)
+
+    print(f"Chrome 드라이버 생성 (프로필: {profile['name']}, headless: {profile['headless']}, "
+          f"로딩 전략: {profile['page_load_strategy']})")
+    if user_data_dir:
+        os.makedirs(user_data_dir, exist_ok=True)
+        user_data_dir = os.path.abspath(user_data_dir)
+        print(f"  사용자 데이터 디렉토리: {user_data_dir}")
+
+    driver = uc.Chrome(options=options, version_main=version_main, headless=profile["headless"],
+                       user_data_dir=user_data_dir, use_subprocess=True)
+
+    if profile["page_load_timeout"]:
+        driver.set_page_load_timeout(profile["page_load_timeout"])
+    if block_resources:
+        apply_resource_blocking(driver)
+
+    return driver
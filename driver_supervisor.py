@@ -0,0 +1,333 @@
+"""
+드라이버 상태 감시 및 재시작 모듈
+브라우저 하나로 몇 시간씩 크롤링하면 메모리가 조금씩 늘고 응답이 느려지다가 결국 멈추는 경우가 있습니다.
+DriverSupervisor는 상세 페이지 이동을 대신 수행하면서 다음 항목을 기록하고,
+기준을 넘으면 브라우저를 종료한 뒤 새로 띄워 같은 위치(현재 상품)부터 이어서 진행합니다.
+
+- 페이지 수: 브라우저 하나로 연 페이지가 max_pages 이상이면 재시작
+- 메모리(RSS): 브라우저 프로세스 트리의 RSS 합계가 max_rss_mb 이상이면 재시작
+- 응답 시간: 최근 페이지들의 평균 로딩 시간이 max_latency 이상이면 재시작
+- 응답 확인: 페이지 이동 실패 시 브라우저가 스크립트에 응답하지 않으면 재시작 후 같은 페이지 재시도
+
+메모리는 psutil이 설치되어 있으면 psutil로, 없으면 /proc(Linux)에서 읽습니다. (둘 다 없으면 메모리 기준 미사용)
+"""
+
+import os
+import time
+from collections import deque
+
+from page_extractor import PRODUCT_NAME_XPATH
+from page_wait import wait_for_xpath
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# 브라우저 하나로 열 최대 페이지 수 (이후 재시작)
+MAX_PAGES_PER_DRIVER = 300
+
+# 브라우저 프로세스 트리의 최대 메모리 (MB)
+MAX_RSS_MB = 2048
+
+# 최근 페이지 평균 로딩 시간 기준 (초)
+MAX_AVERAGE_LATENCY = 20
+
+# 평균 로딩 시간을 계산할 최근 페이지 수
+LATENCY_WINDOW = 20
+
+# 메모리/응답 시간을 확인하는 간격 (페이지 수)
+HEALTH_CHECK_INTERVAL = 10
+
+# 연속으로 페이지 준비에 실패하면 재시작하는 기준
+MAX_CONSECUTIVE_FAILURES = 3
+
+# 브라우저 응답 확인 실패로 재시작한 뒤 같은 페이지를 다시 시도하는 횟수
+MAX_RETRIES_PER_PAGE = 1
+
+# /proc 메모리 페이지 크기
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _child_pids_from_proc():
+    """/proc에서 {부모 pid: [자식 pid, ...]} 읽기"""
+    children = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat", "r") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # 프로세스 이름에 공백/괄호가 있을 수 있으므로 마지막 ')' 뒤에서 필드를 읽음
+        fields = stat[stat.rfind(")") + 2:].split()
+        children.setdefault(int(fields[1]), []).append(int(name))
+    return children
+
+
+def _rss_from_proc(pid):
+    try:
+        with open(f"/proc/{pid}/statm", "r") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def process_tree_rss_mb(root_pids):
+    """
+    프로세스들과 그 모든 하위 프로세스의 RSS 합계를 구합니다. (Chrome 렌더러/GPU 프로세스 포함)
+
+    Args:
+        root_pids: 최상위 프로세스 pid 목록
+
+    Returns:
+        float or None: RSS 합계 (MB), 읽을 수 없으면 None
+    """
+    root_pids = [pid for pid in root_pids if pid]
+    if not root_pids:
+        return None
+
+    pids = set()
+    if psutil is not None:
+        total = 0
+        for root_pid in root_pids:
+            try:
+                root = psutil.Process(root_pid)
+                processes = [root] + root.children(recursive=True)
+            except psutil.Error:
+                continue
+            for process in processes:
+                if process.pid in pids:
+                    continue
+                pids.add(process.pid)
+                try:
+                    total += process.memory_info().rss
+                except psutil.Error:
+                    pass
+        return total / (1024 * 1024) if pids else None
+
+    if not os.path.isdir("/proc"):
+        return None
+
+    children = _child_pids_from_proc()
+    stack = list(root_pids)
+    while stack:
+        pid = stack.pop()
+        if pid in pids or not os.path.exists(f"/proc/{pid}"):
+            continue
+        pids.add(pid)
+        stack.extend(children.get(pid, []))
+
+    if not pids:
+        return None
+    return sum(_rss_from_proc(pid) for pid in pids) / (1024 * 1024)
+
+
+def driver_process_ids(driver):
+    """드라이버의 브라우저 / chromedriver 프로세스 pid 목록 (uc.Chrome은 browser_pid로 브라우저를 따로 실행)"""
+    pids = [getattr(driver, "browser_pid", None)]
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None)
+    pids.append(getattr(process, "pid", None))
+    return [pid for pid in pids if pid]
+
+
+def is_driver_responsive(driver):
+    """브라우저가 명령에 응답하는지 확인합니다. (창이 닫혔거나 멈췄으면 False)"""
+    try:
+        return driver.execute_script("return 1;") == 1
+    except Exception:
+        return False
+
+
+class DriverSupervisor:
+    """
+    드라이버 상태를 감시하며 상세 페이지를 여는 객체
+
+    사용 예:
+        supervisor = DriverSupervisor(create_driver, driver=driver, max_pages=300)
+        for product in product_urls:
+            driver = supervisor.open_page(product["url"])
+            ...  # 반환된 드라이버로 수집 (재시작되면 새 드라이버)
+        supervisor.close()
+    """
+
+    def __init__(self, driver_factory, driver=None, max_pages=MAX_PAGES_PER_DRIVER, max_rss_mb=MAX_RSS_MB,
+                 max_latency=MAX_AVERAGE_LATENCY, latency_window=LATENCY_WINDOW,
+                 check_interval=HEALTH_CHECK_INTERVAL, before_quit=None):
+        """
+        Args:
+            driver_factory: 새 드라이버를 만드는 함수 (재시작할 때마다 호출)
+            driver: 처음 사용할 기존 드라이버 (None이면 driver_factory로 생성, 종료는 close()가 맡음)
+            max_pages: 브라우저 하나로 열 최대 페이지 수 (0이면 페이지 수로 재시작하지 않음)
+            max_rss_mb: 브라우저 프로세스 트리의 최대 메모리 (MB, 0이면 확인하지 않음)
+            max_latency: 최근 페이지 평균 로딩 시간 기준 (초, 0이면 확인하지 않음)
+            latency_window: 평균 로딩 시간을 계산할 최근 페이지 수
+            check_interval: 메모리/응답 시간을 확인하는 간격 (페이지 수)
+            before_quit: before_quit(driver), 응답하는 브라우저를 종료하기 전에 호출할 함수 (예: 세션 저장)
+        """
+        self.driver_factory = driver_factory
+        self.driver = driver if driver is not None else driver_factory()
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.max_latency = max_latency
+        self.check_interval = max(1, check_interval)
+        self.before_quit = before_quit
+
+        self.restart_count = 0
+        self.pages_loaded = 0            # 전체 페이지 수
+        self.pages_since_restart = 0     # 현재 브라우저로 연 페이지 수
+        self.consecutive_failures = 0
+        self.latencies = deque(maxlen=max(1, latency_window))
+        self.last_rss_mb = None
+
+    def average_latency(self):
+        """최근 페이지 평균 로딩 시간 (초, 기록이 없으면 None)"""
+        if not self.latencies:
+            return None
+        return sum(self.latencies) / len(self.latencies)
+
+    def rss_mb(self):
+        """현재 브라우저 프로세스 트리의 메모리 (MB, 읽을 수 없으면 None)"""
+        self.last_rss_mb = process_tree_rss_mb(driver_process_ids(self.driver))
+        return self.last_rss_mb
+
+    def restart_reason(self):
+        """
+        재시작이 필요한 이유를 반환합니다.
+
+        Returns:
+            str or None: 재시작 이유 (필요 없으면 None)
+        """
+        if self.max_pages and self.pages_since_restart >= self.max_pages:
+            return f"페이지 {self.pages_since_restart}개 처리"
+
+        if self.consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+            return f"페이지 준비 {self.consecutive_failures}회 연속 실패"
+
+        # 메모리 / 응답 시간은 check_interval 페이지마다 확인
+        if not self.pages_since_restart or self.pages_since_restart % self.check_interval:
+            return None
+
+        if self.max_rss_mb:
+            rss = self.rss_mb()
+            if rss is not None and rss >= self.max_rss_mb:
+                return f"메모리 {rss:.0f}MB 사용"
+
+        latency = self.average_latency()
+        if self.max_latency and latency is not None and len(self.latencies) == self.latencies.maxlen \
+                and latency >= self.max_latency:
+            return f"평균 로딩 시간 {latency:.1f}초"
+
+        return None
+
+    def _quit_driver(self, responsive):
+        if responsive and self.before_quit:
+            try:
+                self.before_quit(self.driver)
+            except Exception as e:
+                print(f"[Supervisor] ✗ 종료 전 처리 실패 (무시): {e}")
+        try:
+            self.driver.quit()
+        except Exception as e:
+            print(f"[Supervisor] ✗ 드라이버 종료 중 오류 (무시): {e}")
+
+    def restart(self, reason):
+        """
+        브라우저를 종료하고 새 드라이버를 만듭니다.
+
+        Args:
+            reason: 재시작 이유 (로깅용)
+
+        Returns:
+            새 웹드라이버
+        """
+        print(f"\n[Supervisor] 브라우저 재시작: {reason} "
+              f"(누적 {self.pages_loaded}페이지, 재시작 {self.restart_count + 1}회째)")
+
+        self._quit_driver(responsive=is_driver_responsive(self.driver))
+        self.driver = self.driver_factory()
+
+        self.restart_count += 1
+        self.pages_since_restart = 0
+        self.consecutive_failures = 0
+        self.latencies.clear()
+        self.last_rss_mb = None
+        print("[Supervisor] ✓ 새 브라우저 준비 완료")
+        return self.driver
+
+    def recycle_if_needed(self):
+        """재시작 기준을 넘었으면 브라우저를 재시작합니다. (현재 드라이버 반환)"""
+        reason = self.restart_reason()
+        if reason:
+            self.restart(reason)
+        return self.driver
+
+    def open_page(self, url, ready_xpath=PRODUCT_NAME_XPATH):
+        """
+        페이지로 이동하고 ready_xpath 요소가 나타날 때까지 기다립니다.
+        이동 전에 재시작 기준을 확인하고, 이동에 실패했는데 브라우저가 응답하지 않으면
+        재시작한 뒤 같은 페이지를 다시 엽니다.
+
+        Args:
+            url: 이동할 URL
+            ready_xpath: 페이지 준비를 확인할 요소 XPath
+
+        Returns:
+            페이지가 열린 웹드라이버 (재시작된 경우 새 드라이버)
+
+        Raises:
+            Exception: 브라우저는 응답하지만 페이지 이동 자체가 실패한 경우 (driver.get 예외)
+        """
+        for attempt in range(MAX_RETRIES_PER_PAGE + 1):
+            driver = self.recycle_if_needed()
+
+            started = time.monotonic()
+            error = None
+            try:
+                driver.get(url)
+                ready = wait_for_xpath(driver, ready_xpath)
+            except Exception as e:
+                error = e
+                ready = False
+
+            self.latencies.append(time.monotonic() - started)
+            self.pages_loaded += 1
+            self.pages_since_restart += 1
+
+            if ready:
+                self.consecutive_failures = 0
+                return driver
+
+            self.consecutive_failures += 1
+
+            if is_driver_responsive(driver):
+                # 브라우저는 정상 (상품이 없는 페이지 등), 페이지 문제는 호출한 쪽에서 처리
+                if error is not None:
+                    raise error
+                return driver
+
+            # 브라우저가 멈춤: 재시작 (재시도 횟수를 넘으면 다음 상품은 새 브라우저로 진행)
+            self.restart("브라우저 응답 없음")
+
+        if error is not None:
+            raise error
+        return self.driver
+
+    def close(self):
+        """
+        현재 드라이버를 종료합니다. (처음 전달받은 드라이버도 포함)
+        재시작하면 호출한 쪽의 드라이버 참조가 이미 종료된 드라이버가 되므로, 브라우저 종료는 이 메서드가 맡습니다.
+        """
+        self._quit_driver(responsive=is_driver_responsive(self.driver))
+
+    def summary(self):
+        """감시 결과 요약 문자열"""
+        latency = self.average_latency()
+        parts = [f"페이지 {self.pages_loaded}개", f"재시작 {self.restart_count}회"]
+        if latency is not None:
+            parts.append(f"최근 평균 로딩 {latency:.1f}초")
+        if self.last_rss_mb is not None:
+            parts.append(f"메모리 {self.last_rss_mb:.0f}MB")
+        return ", ".join(parts)
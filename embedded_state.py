@@ -0,0 +1,280 @@
+"""
+임베디드 페이지 상태(JSON) 추출 모듈
+상세 페이지는 Next.js로 렌더링되므로 상품 모델 전체가 <script id="__NEXT_DATA__"> 안에 JSON으로 들어있습니다.
+이 JSON을 한 번 파싱하여 카테고리/브랜드/상품명/옵션/이미지/정보 제공고시를 읽으면
+옵션 드롭다운 클릭, 메인 이미지 슬라이드 이동, 해시가 붙은 클래스명 선택자가 모두 필요 없습니다.
+
+상태 JSON의 키 이름은 페이지 배포마다 바뀔 수 있으므로 항목마다 후보 키를 순서대로 찾고,
+찾지 못한 항목은 빈 값으로 두어 호출한 쪽에서 DOM 추출로 채우도록 합니다.
+(키 후보는 아래 *_KEYS 상수에서 조정)
+"""
+
+import json
+import re
+
+from category_mapping import get_category_id
+from option_normalizer import normalize_options
+
+# 상태 JSON이 들어있는 script 태그 id
+STATE_SCRIPT_ID = "__NEXT_DATA__"
+
+# 상품 모델을 찾는 기준 키 (이 키와 상품명 키를 함께 가진 객체를 상품 모델로 판단)
+PRODUCT_MARKER_KEYS = ("goodsNo", "goodsNumber", "productId")
+
+# 항목별 후보 키 (앞에 있는 키를 먼저 사용)
+PRODUCT_NAME_KEYS = ("goodsName", "goodsNm", "productName")
+BRAND_KEYS = ("brandName", "brandNm", "onlBrandNm")
+CATEGORY_KEYS = ("dispCatNm", "lastDispCatNm", "categoryName", "catNm")
+MAIN_IMAGE_KEYS = ("goodsImageList", "imageList", "images", "thumbnailList")
+OPTION_LIST_KEYS = ("optionList", "goodsOptionList", "optList", "options", "itemList")
+OPTION_NAME_KEYS = ("optionName", "optNm", "itemNm", "goodsNm", "name")
+OPTION_PRICE_KEYS = ("finalPrice", "finalPrc", "salePrice", "salePrc", "price")
+OPTION_IMAGE_KEYS = ("imageUrl", "imgUrl", "optImgPath", "thumbnailUrl", "imgPath")
+OPTION_SOLDOUT_KEYS = ("soldOut", "soldOutYn", "isSoldOut", "soldOutFlag")
+NOTICE_LIST_KEYS = ("goodsNoticeList", "noticeList", "goodsInfoNoticeList", "notices")
+NOTICE_TITLE_KEYS = ("title", "itemNm", "noticeTitle", "name", "key")
+NOTICE_VALUE_KEYS = ("content", "itemCont", "noticeContent", "value")
+DETAIL_IMAGE_KEYS = ("detailImageList", "descImageList", "detailImages")
+DETAIL_HTML_KEYS = ("goodsDesc", "goodsDescHtml", "descHtml", "contentHtml", "description")
+IMAGE_URL_KEYS = ("url", "imageUrl", "imgUrl", "imgPath", "path", "src")
+
+# 상대 경로로 들어있는 상품 이미지의 기준 URL
+IMAGE_BASE_URL = "https://image.oliveyoung.co.kr/cfimages/cf-goods/uploads/images/thumbnails/"
+
+_STATE_SCRIPT_PATTERN = re.compile(
+    r'<script[^>]*\bid=["\']' + STATE_SCRIPT_ID + r'["\'][^>]*>(.*?)</script>', re.S | re.I
+)
+_IMG_TAG_PATTERN = re.compile(r'<img\b[^>]*>', re.I)
+_IMG_ATTR_PATTERN = re.compile(r'\b(data-src|data-original|src)\s*=\s*["\']([^"\']+)["\']', re.I)
+
+# 브라우저에서 상태 JSON 문자열을 읽는 스크립트
+READ_STATE_SCRIPT = (
+    "var el = document.getElementById(arguments[0]);"
+    "return el ? el.textContent : null;"
+)
+
+
+def parse_embedded_state(html: str):
+    """
+    HTML 문자열에서 상태 JSON을 읽습니다.
+
+    Returns:
+        dict or None: 상태 JSON (script 태그가 없거나 JSON이 아니면 None)
+    """
+    match = _STATE_SCRIPT_PATTERN.search(html or "")
+    if not match:
+        return None
+    try:
+        return json.loads(match.group(1))
+    except ValueError:
+        return None
+
+
+def read_embedded_state(driver):
+    """
+    브라우저에 열린 페이지에서 상태 JSON을 읽습니다. (execute_script 한 번)
+
+    Returns:
+        dict or None: 상태 JSON (없으면 None)
+    """
+    text = driver.execute_script(READ_STATE_SCRIPT, STATE_SCRIPT_ID)
+    if not text:
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
+
+def _iter_dicts(node):
+    """JSON 트리의 모든 객체 (깊이 우선, 문서 순서)"""
+    if isinstance(node, dict):
+        yield node
+        for value in node.values():
+            yield from _iter_dicts(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _iter_dicts(value)
+
+
+def _first(obj, keys):
+    """후보 키 중 처음으로 값이 있는 항목 (없으면 None)"""
+    for key in keys:
+        value = obj.get(key)
+        if value not in (None, "", [], {}):
+            return value
+    return None
+
+
+def _find(state, model, keys):
+    """상품 모델에서 먼저 찾고, 없으면 상태 JSON 전체에서 찾습니다."""
+    value = _first(model, keys)
+    if value is not None:
+        return value
+    for obj in _iter_dicts(state):
+        value = _first(obj, keys)
+        if value is not None:
+            return value
+    return None
+
+
+def find_product_model(state):
+    """상태 JSON에서 상품 모델 객체를 찾습니다. (없으면 None)"""
+    for obj in _iter_dicts(state):
+        if _first(obj, PRODUCT_NAME_KEYS) and any(key in obj for key in PRODUCT_MARKER_KEYS):
+            return obj
+    return None
+
+
+def _text(value):
+    if value is None or isinstance(value, (dict, list)):
+        return None
+    return " ".join(str(value).split()) or None
+
+
+def _image_url(value):
+    """문자열 또는 {url: ...} 형태의 이미지 값을 절대 URL로 변환"""
+    if isinstance(value, dict):
+        value = _first(value, IMAGE_URL_KEYS)
+    if not isinstance(value, str) or not value:
+        return None
+    if value.startswith("//"):
+        return "https:" + value
+    if value.startswith("http"):
+        return value
+    return IMAGE_BASE_URL + value.lstrip("/")
+
+
+def _is_soldout(value):
+    if isinstance(value, str):
+        return value.upper() in ("Y", "TRUE")
+    return bool(value)
+
+
+def _category(state, model):
+    """
+    카테고리명 (카테고리 매핑에 있는 이름을 우선 사용)
+    상태 JSON에는 1~3차 카테고리명이 함께 들어있을 수 있으므로 3차 카테고리를 찾습니다.
+    """
+    names = []
+    for obj in [model] + list(_iter_dicts(state)):
+        for key in CATEGORY_KEYS:
+            name = _text(obj.get(key))
+            if name and name not in names:
+                names.append(name)
+
+    for name in names:
+        if get_category_id(name):
+            return name
+    return names[0] if names else None
+
+
+def _options(state, model):
+    raw_list = _find(state, model, OPTION_LIST_KEYS)
+    if not isinstance(raw_list, list):
+        return []
+
+    raw_options = []
+    for item in raw_list:
+        if not isinstance(item, dict):
+            continue
+        price = _first(item, OPTION_PRICE_KEYS)
+        raw_options.append({
+            "name": _text(_first(item, OPTION_NAME_KEYS)),
+            "price": str(price) if price is not None else None,
+            "image_url": _image_url(_first(item, OPTION_IMAGE_KEYS)),
+            "is_soldout": _is_soldout(_first(item, OPTION_SOLDOUT_KEYS)),
+        })
+    return normalize_options(raw_options, is_multi_option=len(raw_options) > 1)
+
+
+def _detail_info(state, model):
+    notices = _find(state, model, NOTICE_LIST_KEYS)
+    if isinstance(notices, dict):
+        return {str(key): _text(value) or "" for key, value in notices.items()}
+    if not isinstance(notices, list):
+        return {}
+
+    detail_info = {}
+    for item in notices:
+        if isinstance(item, dict):
+            title = _text(_first(item, NOTICE_TITLE_KEYS))
+            if title:
+                detail_info[title] = _text(_first(item, NOTICE_VALUE_KEYS)) or ""
+    return detail_info
+
+
+def _detail_image_urls(state, model):
+    images = _find(state, model, DETAIL_IMAGE_KEYS)
+    if isinstance(images, list):
+        return [url for url in map(_image_url, images) if url]
+
+    # 상세 설명 HTML에 들어있는 이미지 (lazy loading 속성 우선)
+    html = _find(state, model, DETAIL_HTML_KEYS)
+    if not isinstance(html, str):
+        return []
+
+    urls = []
+    for tag in _IMG_TAG_PATTERN.findall(html):
+        attrs = {name.lower(): value for name, value in _IMG_ATTR_PATTERN.findall(tag)}
+        for attr in ("data-src", "data-original", "src"):
+            url = attrs.get(attr)
+            if url and not url.startswith("data:image"):
+                urls.append(_image_url(url))
+                break
+    return urls
+
+
+def extract_product_state(state) -> dict:
+    """
+    상태 JSON에서 상품 데이터를 추출합니다.
+
+    Args:
+        state: parse_embedded_state() / read_embedded_state()가 반환한 상태 JSON
+
+    Returns:
+        dict: static_extractor.extract_product_html()과 같은 형식
+              (찾지 못한 항목은 None / 빈 리스트 / 빈 딕셔너리)
+    """
+    page = {
+        "category": None,
+        "brand": None,
+        "product_name": None,
+        "main_image_urls": [],
+        "detail_image_urls": [],
+        "product_options": [],
+        "detail_info": {},
+    }
+
+    model = find_product_model(state) if state else None
+    if model is None:
+        return page
+
+    main_images = _find(state, model, MAIN_IMAGE_KEYS)
+    main_image_urls = []
+    if isinstance(main_images, list):
+        for url in map(_image_url, main_images):
+            if url and url not in main_image_urls:
+                main_image_urls.append(url)
+
+    page.update({
+        "category": _category(state, model),
+        "brand": _text(_find(state, model, BRAND_KEYS)),
+        "product_name": _text(_first(model, PRODUCT_NAME_KEYS)),
+        "main_image_urls": main_image_urls,
+        "detail_image_urls": _detail_image_urls(state, model),
+        "product_options": _options(state, model),
+        "detail_info": _detail_info(state, model),
+    })
+    return page
+
+
+def merge_pages(primary: dict, secondary: dict) -> dict:
+    """
+    두 추출 결과를 합칩니다. primary에 값이 있는 항목은 그대로 쓰고, 비어있는 항목만 secondary에서 채웁니다.
+    """
+    merged = dict(secondary)
+    for key, value in primary.items():
+        if value:
+            merged[key] = value
+    return merged
@@ -1,24 +1,361 @@
 import os
 import shutil
 import json
+import base64
+import time
+import threading
 import traceback
+from contextlib import ExitStack, contextmanager
 from datetime import datetime
 
 
+# 저널 파일 확장자
+JOURNAL_SUFFIX = ".journal"
+
+# 파일 잠금용 파일 확장자 (원본 파일이 교체되어도 같은 잠금을 사용하도록 별도 파일로 잠금)
+LOCK_SUFFIX = ".lock"
+
+# 이 프로세스에서 복구를 이미 수행한 백업 디렉토리 목록
+_recovered_dirs = set()
+
+# 이 프로세스가 가진 파일 잠금 {잠금 파일 경로: {"thread_lock", "fd", "depth"}}
+_file_locks = {}
+_file_locks_guard = threading.Lock()
+
+
+def _lock_fd(fd):
+    """파일 디스크립터에 배타적 잠금을 겁니다. (다른 프로세스가 해제할 때까지 대기)"""
+    if os.name == 'nt':
+        import msvcrt
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                # LK_LOCK은 10초 동안만 재시도하므로 잠금을 얻을 때까지 반복
+                continue
+    else:
+        import fcntl
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+
+def _unlock_fd(fd):
+    """파일 디스크립터의 잠금을 해제합니다."""
+    if os.name == 'nt':
+        import msvcrt
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+@contextmanager
+def file_lock(file_path):
+    """
+    파일에 대한 프로세스 간 배타적 잠금 (file_path + LOCK_SUFFIX 파일을 잠금)
+    같은 스레드에서는 중첩해서 잠글 수 있습니다.
+
+    Args:
+        file_path: 잠글 파일 경로 (파일이 없어도 됨)
+    """
+    lock_path = os.path.abspath(file_path) + LOCK_SUFFIX
+
+    with _file_locks_guard:
+        state = _file_locks.setdefault(lock_path, {"thread_lock": threading.RLock(), "fd": None, "depth": 0})
+
+    with state["thread_lock"]:
+        if state["depth"] == 0:
+            fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                _lock_fd(fd)
+            except BaseException:
+                os.close(fd)
+                raise
+            state["fd"] = fd
+        state["depth"] += 1
+
+        try:
+            yield
+        finally:
+            state["depth"] -= 1
+            if state["depth"] == 0:
+                fd, state["fd"] = state["fd"], None
+                try:
+                    _unlock_fd(fd)
+                finally:
+                    os.close(fd)
+
+
+def write_tail(file_path, offset, content, encoding='utf-8'):
+    """
+    파일의 offset 위치부터 content를 덮어쓰고 그 뒤의 내용은 잘라냅니다.
+    파일 앞부분은 읽거나 다시 쓰지 않으므로 비용이 파일 크기와 무관합니다.
+
+    Args:
+        file_path: 파일 경로
+        offset: 덮어쓰기를 시작할 바이트 위치
+        content: 작성할 내용
+        encoding: 인코딩
+    """
+    data = content.encode(encoding) if isinstance(content, str) else content
+
+    mode = 'r+b' if os.path.exists(file_path) else 'wb'
+    with open(file_path, mode) as f:
+        f.seek(offset)
+        f.write(data)
+        f.truncate()
+
+
+def append_at(file_path, offset, content, encoding='utf-8'):
+    """
+    커밋 시점에 정한 offset 위치(당시 파일 끝)에 content를 추가합니다. (비정상 종료 후 커밋을 마저 진행할 때 사용)
+    항상 추가 모드로 기록하므로 그 사이 다른 프로세스가 추가한 내용을 덮어쓰거나 잘라내지 않습니다.
+    - offset 위치에 이미 기록되어 있으면 아무것도 하지 않음
+    - 일부만 기록되어 있으면 나머지만 추가
+    - 그 사이 다른 프로세스가 추가했으면 현재 파일 끝에 추가
+
+    Returns:
+        int: 실제로 기록된 위치
+    """
+    data = content.encode(encoding) if isinstance(content, str) else content
+
+    with file_lock(file_path):
+        with open(file_path, 'a+b') as f:
+            size = os.fstat(f.fileno()).st_size
+            written = b""
+            if size > offset:
+                f.seek(offset)
+                written = f.read(len(data))
+
+            if size == offset + len(written) and data.startswith(written):
+                f.write(data[len(written):])
+                return offset
+            if written == data:
+                return offset
+
+            f.write(data)
+            return size
+
+
+def read_tail(file_path, size):
+    """
+    파일의 마지막 size 바이트를 읽습니다.
+
+    Returns:
+        tuple: (시작 위치, 읽은 바이트) 파일이 없으면 None
+    """
+    if not os.path.exists(file_path):
+        return None
+
+    file_size = os.path.getsize(file_path)
+    start = max(0, file_size - size)
+
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        return start, f.read()
+
+
+def fsync_file(file_path):
+    """파일 내용을 디스크에 강제로 기록합니다."""
+    if os.path.exists(file_path):
+        with open(file_path, 'ab') as f:
+            os.fsync(f.fileno())
+
+
+def _is_process_alive(pid):
+    """해당 PID의 프로세스가 아직 실행 중인지 확인합니다."""
+    if os.name == 'nt':
+        # Windows에서 os.kill(pid, 0)은 프로세스를 종료시키므로 WinAPI로 확인
+        import ctypes
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        STILL_ACTIVE = 259
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return False
+        exit_code = ctypes.c_ulong()
+        kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+        kernel32.CloseHandle(handle)
+        return exit_code.value == STILL_ACTIVE
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _read_journal(journal_path):
+    """
+    저널 파일의 기록을 읽습니다.
+    기록 도중 종료되어 잘린 마지막 줄은 무시합니다.
+    """
+    records = []
+    with open(journal_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                break
+    return records
+
+
+def _undo_records(records):
+    """저널 기록을 역순으로 되돌립니다. (롤백)"""
+    for record in reversed(records):
+        record_type = record.get("type")
+
+        if record_type == "append":
+            # 추가 기록은 커밋 기록 이후에만 파일에 반영되므로 되돌릴 내용이 없음
+            # (잘라내면 그 사이 다른 프로세스가 추가한 내용까지 지워짐)
+            continue
+
+        if record_type == "undo":
+            # 변경된 바이트 범위를 원래 내용으로 복원
+            if os.path.exists(record["path"]):
+                write_tail(record["path"], record["offset"], base64.b64decode(record["old_tail"]))
+                if record.get("original_size") is not None:
+                    print(f"[Transaction] 파일 복원: {record['path']} (길이: {record['original_size']})")
+
+        elif record_type == "stage":
+            # 커밋되지 않은 임시 파일 삭제
+            if os.path.exists(record["temp"]):
+                os.remove(record["temp"])
+
+        elif record_type == "backup":
+            # 백업 파일에서 원본 파일 복원
+            if os.path.exists(record["backup"]):
+                shutil.copy2(record["backup"], record["path"])
+                print(f"[Transaction] 파일 복원: {record['backup']} -> {record['path']}")
+                os.remove(record["backup"])
+
+        elif record_type == "new":
+            # 새로 생성된 파일 삭제
+            if os.path.exists(record["path"]):
+                os.remove(record["path"])
+                print(f"[Transaction] 새 파일 삭제: {record['path']}")
+
+
+def _publish_records(records):
+    """커밋이 기록된 저널의 변경 내용을 반영하고 백업을 정리합니다."""
+    for record in records:
+        record_type = record.get("type")
+
+        if record_type == "undo" and "new_tail" in record:
+            # 파일 끝부분 변경 (같은 내용을 다시 써도 결과가 같음)
+            write_tail(record["path"], record["offset"], base64.b64decode(record["new_tail"]))
+
+        elif record_type == "append":
+            # 파일 끝에 추가 (이미 추가되어 있으면 그대로 둠)
+            append_at(record["path"], record["offset"], base64.b64decode(record["data"]))
+
+        elif record_type == "stage":
+            # 원자적 교체 (이미 교체된 경우 임시 파일이 없음)
+            if os.path.exists(record["temp"]):
+                os.replace(record["temp"], record["path"])
+                print(f"[Transaction] 파일 교체: {record['temp']} -> {record['path']}")
+
+        elif record_type == "backup":
+            if os.path.exists(record["backup"]):
+                os.remove(record["backup"])
+                print(f"[Transaction] 백업 파일 삭제: {record['backup']}")
+
+
+def recover_transactions(backup_dir=".transaction_backup"):
+    """
+    비정상 종료된 프로세스가 남긴 저널을 찾아 복구합니다.
+    커밋 기록이 있으면 커밋을 마저 진행(roll forward)하고,
+    없으면 저널을 역순으로 재생하여 롤백합니다.
+    실행 중인 다른 프로세스의 저널은 건드리지 않습니다.
+
+    Args:
+        backup_dir: 백업/저널 파일 디렉토리
+
+    Returns:
+        int: 복구한 트랜잭션 수
+    """
+    if not os.path.isdir(backup_dir):
+        return 0
+
+    recovered = 0
+
+    for name in sorted(os.listdir(backup_dir)):
+        if not name.endswith(JOURNAL_SUFFIX):
+            continue
+
+        journal_path = os.path.join(backup_dir, name)
+
+        try:
+            records = _read_journal(journal_path)
+        except OSError as e:
+            print(f"[Transaction] 저널 읽기 실패: {journal_path} ({e})")
+            continue
+
+        header = records[0] if records and records[0].get("type") == "begin" else {}
+        pid = header.get("pid")
+
+        # 다른 프로세스가 아직 사용 중인 저널은 건너뜀
+        if pid and pid != os.getpid() and _is_process_alive(pid):
+            continue
+
+        transaction_id = header.get("transaction_id", name[:-len(JOURNAL_SUFFIX)])
+
+        if any(record.get("type") == "commit" for record in records):
+            print(f"[Transaction] 중단된 커밋 마저 진행 (ID: {transaction_id})")
+            _publish_records(records)
+        else:
+            print(f"[Transaction] 중단된 트랜잭션 롤백 (ID: {transaction_id})")
+            _undo_records(records)
+
+        os.remove(journal_path)
+        recovered += 1
+
+    # 저널 없이 남아있는 백업 파일은 복원 여부를 알 수 없으므로 알림만 출력
+    for name in os.listdir(backup_dir):
+        if name.endswith(".backup"):
+            prefix = name.split("_", 3)
+            if not os.path.exists(os.path.join(backup_dir, "_".join(prefix[:3]) + JOURNAL_SUFFIX)):
+                print(f"[Transaction] 저널 없는 백업 파일 발견 (수동 확인 필요): {name}")
+
+    return recovered
+
+
 class FileTransaction:
     """
     파일 기반 트랜잭션 관리 클래스
     여러 파일 작업을 하나의 트랜잭션으로 묶어서 원자성을 보장합니다.
+
+    저널 모드(기본값)에서는 트랜잭션 중의 모든 변경 내용을 메모리 버퍼에 모아두고
+    커밋 시점에만 디스크에 기록합니다. read_file/read_json은 버퍼를 먼저 확인하므로
+    커밋 전에 작성한 내용도 읽을 수 있고, 같은 파일을 여러 번 읽거나 쓰지 않습니다.
+
+    커밋 시에는 변경되는 바이트 범위와 원래 파일 길이만 저널에 기록한 뒤
+    파일 끝부분을 덮어쓰고, 파일 전체를 새로 쓰는 경우는 임시 파일에 작성하여
+    원자적으로 교체(rename)합니다. 파일 끝에 추가만 한 경우는 파일 잠금을 건 상태에서
+    커밋 시점의 실제 파일 끝에 추가하므로, 여러 프로세스가 같은 파일에 추가해도 서로 덮어쓰지 않습니다.
+    프로세스가 비정상 종료되어도 다음 begin() 시점에 남은 저널을 찾아 자동으로 롤백 또는 커밋을 마무리합니다.
     """
 
-    def __init__(self, backup_dir=".transaction_backup"):
+    def __init__(self, backup_dir=".transaction_backup", journal=True):
         """
         Args:
-            backup_dir: 백업 파일을 저장할 디렉토리
+            backup_dir: 백업/저널 파일을 저장할 디렉토리
+            journal: True면 저널 모드, False면 파일 전체 백업 모드
         """
         self.backup_dir = backup_dir
+        self.journal = journal
         self.backup_files = {}  # {원본_파일_경로: 백업_파일_경로}
-        self.new_files = []  # 트랜잭션 중 새로 생성된 파일 목록
+        self.new_files = []  # 트랜잭션 중 새로 생성된 파일 목록 (백업 모드)
+        self.buffers = {}  # {파일_경로: 버퍼} 저널 모드의 메모리 버퍼
+        self.journal_records = []  # 저널에 기록된 내용 (백업 모드)
+        self.journal_path = None
+        self.savepoints = []  # 메모리에만 유지되는 세이브포인트 목록
+        self.commit_callbacks = []  # 커밋 완료 후 호출할 함수 목록
+        self.rollback_callbacks = []  # 롤백 시 호출할 함수 목록 (메모리 상태 복원용)
         self.is_active = False
         self.transaction_id = None
 
@@ -27,29 +364,62 @@ class FileTransaction:
         if self.is_active:
             raise Exception("트랜잭션이 이미 시작되었습니다.")
 
+        # 백업 디렉토리 생성
+        if not os.path.exists(self.backup_dir):
+            os.makedirs(self.backup_dir)
+
+        # 이전 프로세스가 남긴 저널 복구 (프로세스당 한 번)
+        if self.backup_dir not in _recovered_dirs:
+            _recovered_dirs.add(self.backup_dir)
+            recover_transactions(self.backup_dir)
+
         self.transaction_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         self.backup_files = {}
         self.new_files = []
+        self.buffers = {}
+        self.journal_records = []
+        self.journal_path = os.path.join(self.backup_dir, f"{self.transaction_id}{JOURNAL_SUFFIX}")
+        self.savepoints = []
+        self.commit_callbacks = []
+        self.rollback_callbacks = []
         self.is_active = True
 
-        # 백업 디렉토리 생성
-        if not os.path.exists(self.backup_dir):
-            os.makedirs(self.backup_dir)
-
         print(f"[Transaction] 트랜잭션 시작 (ID: {self.transaction_id})")
 
+    def _check_active(self):
+        if not self.is_active:
+            raise Exception("트랜잭션이 시작되지 않았습니다.")
+
+    def _append_journal(self, records, sync=False):
+        """
+        저널에 기록을 추가합니다.
+        첫 기록 전에는 복구에 필요한 프로세스 정보를 먼저 남깁니다.
+        """
+        lines = []
+        if not self.journal_records:
+            lines.append({"type": "begin", "transaction_id": self.transaction_id, "pid": os.getpid()})
+        lines.extend(records)
+
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            for line in lines:
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+            f.flush()
+            if sync:
+                os.fsync(f.fileno())
+
+        self.journal_records.extend(lines)
+
     def backup_file(self, file_path):
         """
-        파일을 백업합니다.
+        파일을 백업합니다. (백업 모드)
 
         Args:
             file_path: 백업할 파일 경로
         """
-        if not self.is_active:
-            raise Exception("트랜잭션이 시작되지 않았습니다.")
+        self._check_active()
 
         # 이미 백업된 파일은 다시 백업하지 않음
-        if file_path in self.backup_files:
+        if file_path in self.backup_files or file_path in self.new_files:
             return
 
         # 파일이 존재하는 경우에만 백업
@@ -59,13 +429,146 @@ class FileTransaction:
                 f"{self.transaction_id}_{os.path.basename(file_path)}.backup"
             )
             shutil.copy2(file_path, backup_path)
+            self._append_journal([{"type": "backup", "path": file_path, "backup": backup_path}])
             self.backup_files[file_path] = backup_path
             print(f"[Transaction] 파일 백업: {file_path} -> {backup_path}")
         else:
             # 파일이 존재하지 않으면 새로 생성될 파일로 간주
+            self._append_journal([{"type": "new", "path": file_path}])
             self.new_files.append(file_path)
             print(f"[Transaction] 새 파일로 등록: {file_path}")
 
+    # ------------------------------------------------------------
+    # 메모리 버퍼 (저널 모드)
+    # 버퍼 = {"offset": 디스크 내용을 유지하는 길이, "data": offset 이후 내용,
+    #         "prefix": 읽어둔 디스크 앞부분 (offset까지, 읽지 않았으면 None),
+    #         "exists": 파일 존재 여부, "dirty": 커밋 시 기록 필요 여부,
+    #         "append": 추가만 한 경우 True (커밋 시점의 파일 끝에 data를 추가)}
+    # 버퍼는 변경하지 않고 항상 새로 만들어 교체하므로 세이브포인트는 얕은 복사로 충분합니다.
+    # ------------------------------------------------------------
+
+    @staticmethod
+    def _new_buffer(offset, data, prefix=None, dirty=True, append=False):
+        if offset == 0:
+            prefix = b""
+        return {"offset": offset, "data": data, "prefix": prefix, "exists": True,
+                "dirty": dirty, "append": append}
+
+    def _virtual_size(self, file_path):
+        """트랜잭션 안에서 보이는 파일 길이 (파일이 없으면 None)"""
+        buffer = self.buffers.get(file_path)
+        if buffer is not None:
+            return buffer["offset"] + len(buffer["data"]) if buffer["exists"] else None
+        return os.path.getsize(file_path) if os.path.exists(file_path) else None
+
+    def _buffer_write(self, file_path, offset, data, append=False):
+        """
+        offset 위치부터 data를 덮어쓰고 나머지를 잘라내는 변경을 버퍼에 반영합니다.
+        append=True(파일 끝에 추가)이고 그 전까지 추가만 했다면 위치를 커밋 시점에 다시 정합니다.
+        """
+        buffer = self.buffers.get(file_path)
+
+        if buffer is None or not buffer["exists"]:
+            if buffer is None and os.path.exists(file_path):
+                # 디스크 내용 앞부분은 그대로 두고 끝부분만 교체
+                self.buffers[file_path] = self._new_buffer(offset, data, append=append)
+            else:
+                self.buffers[file_path] = self._new_buffer(0, data, append=append)
+            return
+
+        if offset >= buffer["offset"]:
+            keep = buffer["data"][:offset - buffer["offset"]]
+            # 읽기만 했거나 추가만 한 버퍼에 추가하는 경우에만 추가로 유지
+            append = append and (buffer["append"] or not buffer["dirty"])
+            self.buffers[file_path] = self._new_buffer(buffer["offset"], keep + data, buffer["prefix"],
+                                                       append=append)
+        else:
+            prefix = buffer["prefix"][:offset] if buffer["prefix"] is not None else None
+            self.buffers[file_path] = self._new_buffer(offset, data, prefix)
+
+    def read_tail(self, file_path, size):
+        """
+        트랜잭션 안에서 보이는 파일의 마지막 size 바이트를 읽습니다.
+
+        Returns:
+            tuple: (시작 위치, 읽은 바이트) 파일이 없으면 None
+        """
+        buffer = self.buffers.get(file_path) if self.journal else None
+        if buffer is None:
+            return read_tail(file_path, size)
+        if not buffer["exists"]:
+            return None
+
+        offset, data = buffer["offset"], buffer["data"]
+        start = max(0, offset + len(data) - size)
+        if start >= offset:
+            return start, data[start - offset:]
+
+        # 버퍼 앞쪽의 디스크 내용이 일부 필요한 경우
+        if buffer["prefix"] is not None:
+            return start, buffer["prefix"][start:] + data
+        with open(file_path, 'rb') as f:
+            f.seek(start)
+            return start, f.read(offset - start) + data
+
+    def read_file(self, file_path, encoding='utf-8'):
+        """
+        트랜잭션 안에서 파일을 읽습니다.
+        커밋 전에 작성한 내용이 반영되며, 디스크에서는 파일당 한 번만 읽습니다.
+        읽은 디스크 내용은 변경되지 않은 부분으로 두므로 커밋 시 다시 쓰지 않습니다.
+
+        Args:
+            file_path: 파일 경로
+            encoding: 인코딩 (None이면 bytes 반환)
+
+        Returns:
+            str 또는 bytes: 파일 내용
+
+        Raises:
+            FileNotFoundError: 파일이 없는 경우
+        """
+        self._check_active()
+
+        if not self.journal:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            return data.decode(encoding) if encoding else data
+
+        buffer = self.buffers.get(file_path)
+
+        if buffer is None:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            buffer = self._new_buffer(len(data), b"", data, dirty=False)
+            self.buffers[file_path] = buffer
+        elif buffer["exists"] and buffer["prefix"] is None:
+            # 버퍼 앞쪽의 디스크 내용을 읽어둠
+            with open(file_path, 'rb') as f:
+                if buffer["append"]:
+                    # 추가할 내용은 커밋 시점의 파일 끝에 붙으므로 현재 파일 전체가 앞부분
+                    prefix = f.read()
+                    offset = len(prefix)
+                else:
+                    prefix = f.read(buffer["offset"])
+                    offset = buffer["offset"]
+            buffer = self._new_buffer(offset, buffer["data"], prefix, buffer["dirty"], buffer["append"])
+            self.buffers[file_path] = buffer
+
+        if not buffer["exists"]:
+            raise FileNotFoundError(f"파일이 없습니다: {file_path}")
+
+        data = buffer["prefix"] + buffer["data"]
+        return data.decode(encoding) if encoding else data
+
+    def read_json(self, file_path, encoding='utf-8'):
+        """
+        트랜잭션 안에서 JSON 파일을 읽습니다. (커밋 전 변경 내용 포함)
+
+        Raises:
+            FileNotFoundError: 파일이 없는 경우
+        """
+        return json.loads(self.read_file(file_path, encoding))
+
     def write_file(self, file_path, content, mode='w', encoding='utf-8'):
         """
         트랜잭션 내에서 파일을 작성합니다.
@@ -76,19 +579,22 @@ class FileTransaction:
             mode: 쓰기 모드 ('w', 'a', 'wb' 등)
             encoding: 인코딩 (바이너리 모드가 아닐 때만)
         """
-        if not self.is_active:
-            raise Exception("트랜잭션이 시작되지 않았습니다.")
-
-        # 파일 백업
-        self.backup_file(file_path)
+        self._check_active()
 
-        # 파일 쓰기
-        if 'b' in mode:
-            with open(file_path, mode) as f:
-                f.write(content)
+        if self.journal:
+            # 메모리 버퍼에 반영 (추가 모드는 커밋 시점의 파일 끝에 추가됨)
+            data = content if 'b' in mode else content.encode(encoding)
+            offset = (self._virtual_size(file_path) or 0) if 'a' in mode else 0
+            self._buffer_write(file_path, offset, data, append='a' in mode)
         else:
-            with open(file_path, mode, encoding=encoding) as f:
-                f.write(content)
+            # 파일 백업 후 직접 쓰기
+            self.backup_file(file_path)
+            if 'b' in mode:
+                with open(file_path, mode) as f:
+                    f.write(content)
+            else:
+                with open(file_path, mode, encoding=encoding) as f:
+                    f.write(content)
 
         print(f"[Transaction] 파일 작성: {file_path}")
 
@@ -102,15 +608,17 @@ class FileTransaction:
             indent: 들여쓰기
             encoding: 인코딩
         """
-        if not self.is_active:
-            raise Exception("트랜잭션이 시작되지 않았습니다.")
+        self._check_active()
 
-        # 파일 백업
-        self.backup_file(file_path)
+        content = json.dumps(data, ensure_ascii=False, indent=indent)
 
-        # JSON 파일 쓰기
-        with open(file_path, 'w', encoding=encoding) as f:
-            json.dump(data, f, ensure_ascii=False, indent=indent)
+        if self.journal:
+            self._buffer_write(file_path, 0, content.encode(encoding))
+        else:
+            # 파일 백업 후 직접 쓰기
+            self.backup_file(file_path)
+            with open(file_path, 'w', encoding=encoding) as f:
+                f.write(content)
 
         print(f"[Transaction] JSON 파일 작성: {file_path}")
 
@@ -125,53 +633,248 @@ class FileTransaction:
         """
         self.write_file(file_path, content, mode='a', encoding=encoding)
 
-    def commit(self):
-        """트랜잭션 커밋 (백업 파일 삭제)"""
-        if not self.is_active:
-            raise Exception("트랜잭션이 시작되지 않았습니다.")
+    def write_tail(self, file_path, offset, content, encoding='utf-8'):
+        """
+        트랜잭션 내에서 파일의 offset 위치부터 내용을 덮어씁니다.
+        SQL 파일의 마지막 세미콜론만 교체하고 새 행을 덧붙일 때 사용합니다.
 
-        # 백업 파일 삭제
-        for backup_path in self.backup_files.values():
-            if os.path.exists(backup_path):
-                os.remove(backup_path)
-                print(f"[Transaction] 백업 파일 삭제: {backup_path}")
+        Args:
+            file_path: 파일 경로
+            offset: 덮어쓰기를 시작할 바이트 위치
+            content: 작성할 내용
+            encoding: 인코딩
+        """
+        self._check_active()
 
-        print(f"[Transaction] 트랜잭션 커밋 완료 (ID: {self.transaction_id})")
+        data = content.encode(encoding) if isinstance(content, str) else content
 
-        # 상태 초기화
+        if self.journal:
+            self._buffer_write(file_path, offset, data)
+        else:
+            # 파일 백업 후 직접 쓰기
+            self.backup_file(file_path)
+            write_tail(file_path, offset, data)
+
+        print(f"[Transaction] 파일 끝부분 작성: {file_path} (offset: {offset})")
+
+    def on_commit(self, callback):
+        """
+        트랜잭션 커밋이 끝난 뒤 호출할 함수를 등록합니다.
+
+        Args:
+            callback: 인자 없는 함수
+        """
+        self._check_active()
+        self.commit_callbacks.append(callback)
+
+    def on_rollback(self, callback):
+        """
+        트랜잭션(또는 등록 이후의 세이브포인트)이 롤백될 때 호출할 함수를 등록합니다.
+        파일과 함께 메모리에 올려둔 상태(캐시, 인덱스 등)를 되돌릴 때 사용합니다.
+        나중에 등록된 함수부터 역순으로 호출됩니다.
+
+        Args:
+            callback: 인자 없는 함수
+        """
+        self._check_active()
+        self.rollback_callbacks.append(callback)
+
+    def _run_callbacks(self, callbacks):
+        """등록된 함수를 호출합니다. 오류는 출력만 하고 나머지 함수는 계속 호출합니다."""
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"[Transaction] 콜백 실행 중 오류: {e}")
+                traceback.print_exc()
+
+    def savepoint(self):
+        """
+        현재 상태를 세이브포인트로 기록합니다. (저널 모드 전용)
+        세이브포인트는 메모리에만 유지되며 디스크 I/O가 발생하지 않습니다.
+
+        Returns:
+            dict: rollback_to_savepoint/release_savepoint에 전달할 세이브포인트
+        """
+        self._check_active()
+        if not self.journal:
+            raise Exception("세이브포인트는 저널 모드에서만 사용할 수 있습니다.")
+
+        savepoint = {
+            "buffers": dict(self.buffers),
+            "commit_callbacks": len(self.commit_callbacks),
+            "rollback_callbacks": len(self.rollback_callbacks),
+        }
+        self.savepoints.append(savepoint)
+        return savepoint
+
+    def rollback_to_savepoint(self, savepoint):
+        """
+        세이브포인트 이후의 변경 내용만 되돌립니다.
+        트랜잭션은 계속 활성 상태로 유지됩니다.
+
+        Args:
+            savepoint: savepoint()가 반환한 세이브포인트
+        """
+        self._check_active()
+
+        self.buffers = dict(savepoint["buffers"])
+
+        # 세이브포인트 이후에 등록된 롤백 함수 호출 (역순)
+        rollback_callbacks = self.rollback_callbacks[savepoint["rollback_callbacks"]:]
+        del self.rollback_callbacks[savepoint["rollback_callbacks"]:]
+        del self.commit_callbacks[savepoint["commit_callbacks"]:]
+        self._run_callbacks(reversed(rollback_callbacks))
+
+        self._drop_savepoint(savepoint)
+
+        print(f"[Transaction] 세이브포인트로 롤백 (ID: {self.transaction_id})")
+
+    def release_savepoint(self, savepoint):
+        """
+        세이브포인트를 해제합니다. 변경 내용은 트랜잭션에 그대로 남습니다.
+
+        Args:
+            savepoint: savepoint()가 반환한 세이브포인트
+        """
+        self._drop_savepoint(savepoint)
+
+    def _drop_savepoint(self, savepoint):
+        """해당 세이브포인트와 그 이후의 세이브포인트를 목록에서 제거합니다."""
+        for idx, item in enumerate(self.savepoints):
+            if item is savepoint:
+                del self.savepoints[idx:]
+                return
+
+    def _reset(self):
+        """상태 초기화"""
         self.backup_files = {}
         self.new_files = []
+        self.buffers = {}
+        self.journal_records = []
+        self.journal_path = None
+        self.savepoints = []
+        self.commit_callbacks = []
+        self.rollback_callbacks = []
         self.is_active = False
         self.transaction_id = None
 
+    def _flush_buffers(self):
+        """
+        메모리 버퍼를 디스크에 기록합니다. (저널 모드 커밋)
+        1. 파일 전체를 새로 쓰는 경우 임시 파일에 작성
+        2. 추가만 한 파일은 잠금을 건 뒤 실제 파일 끝 위치를 확인
+           (그 사이 다른 프로세스가 추가한 내용을 덮어쓰지 않도록 기록이 끝날 때까지 잠금 유지)
+        3. 변경 범위(원래 내용/새 내용)와 커밋 기록을 저널에 한 번에 기록
+        4. 파일 끝부분 덮어쓰기/추가 및 임시 파일 교체
+        """
+        records = []
+        tail_files = []
+
+        with ExitStack() as locks:
+            # 여러 파일을 잠글 때 순서가 같아야 프로세스끼리 서로 기다리지 않음
+            for file_path in sorted(path for path, buffer in self.buffers.items()
+                                    if buffer["dirty"] and buffer["append"]):
+                locks.enter_context(file_lock(file_path))
+
+            for file_path, buffer in self.buffers.items():
+                if not buffer["dirty"]:
+                    continue
+
+                if buffer["append"]:
+                    # 파일 끝에 추가 - 실제 추가 위치를 기록
+                    offset = os.path.getsize(file_path) if os.path.exists(file_path) else 0
+                    records.append({
+                        "type": "append",
+                        "path": file_path,
+                        "offset": offset,
+                        "data": base64.b64encode(buffer["data"]).decode('ascii'),
+                    })
+                    tail_files.append(file_path)
+                elif buffer["offset"] > 0 and os.path.exists(file_path):
+                    # 파일 끝부분만 변경 - 원래 내용과 새 내용만 기록
+                    with open(file_path, 'rb') as f:
+                        original_size = os.fstat(f.fileno()).st_size
+                        f.seek(buffer["offset"])
+                        old_tail = f.read()
+                    records.append({
+                        "type": "undo",
+                        "path": file_path,
+                        "original_size": original_size,
+                        "offset": buffer["offset"],
+                        "old_tail": base64.b64encode(old_tail).decode('ascii'),
+                        "new_tail": base64.b64encode(buffer["data"]).decode('ascii'),
+                    })
+                    tail_files.append(file_path)
+                else:
+                    # 파일 전체 작성 - 임시 파일에 쓴 뒤 교체
+                    temp_path = f"{file_path}.{self.transaction_id}.tmp"
+                    with open(temp_path, 'wb') as f:
+                        f.write(buffer["data"])
+                        f.flush()
+                        os.fsync(f.fileno())
+                    records.append({"type": "stage", "path": file_path, "temp": temp_path})
+
+            if not records:
+                return
+
+            # 커밋 기록까지 한 번에 저널에 기록 (이후 비정상 종료 시 복구 과정에서 커밋을 마저 진행)
+            records.append({"type": "commit"})
+            self._append_journal(records, sync=True)
+
+            # 변경 내용 반영
+            _publish_records(self.journal_records)
+            for file_path in tail_files:
+                fsync_file(file_path)
+
+    def commit(self):
+        """
+        트랜잭션 커밋
+        저널 모드에서는 메모리 버퍼를 디스크에 기록하고,
+        백업 모드에서는 백업 파일을 삭제합니다.
+        """
+        self._check_active()
+
+        if self.journal:
+            self._flush_buffers()
+        elif self.journal_records:
+            # 커밋 기록 후 백업 파일 삭제
+            self._append_journal([{"type": "commit"}], sync=True)
+            _publish_records(self.journal_records)
+
+        # 저널 파일 삭제
+        if self.journal_path and os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+        print(f"[Transaction] 트랜잭션 커밋 완료 (ID: {self.transaction_id})")
+
+        # 상태 초기화 후 커밋 완료 함수 호출
+        commit_callbacks = self.commit_callbacks
+        self._reset()
+        self._run_callbacks(commit_callbacks)
+
     def rollback(self):
-        """트랜잭션 롤백 (원본 파일 복원)"""
+        """트랜잭션 롤백 (저널 모드는 버퍼 폐기, 백업 모드는 원본 파일 복원)"""
         if not self.is_active:
             print("[Transaction] 트랜잭션이 활성화되지 않음, 롤백 불필요")
             return
 
         print(f"[Transaction] 트랜잭션 롤백 시작 (ID: {self.transaction_id})")
 
-        # 백업 파일에서 원본 파일 복원
-        for original_path, backup_path in self.backup_files.items():
-            if os.path.exists(backup_path):
-                shutil.copy2(backup_path, original_path)
-                print(f"[Transaction] 파일 복원: {backup_path} -> {original_path}")
-                os.remove(backup_path)
+        # 백업 모드: 저널을 역순으로 재생하여 변경 내용 복원
+        _undo_records(self.journal_records)
+
+        # 저널 파일 삭제
+        if self.journal_path and os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
 
-        # 새로 생성된 파일 삭제
-        for new_file in self.new_files:
-            if os.path.exists(new_file):
-                os.remove(new_file)
-                print(f"[Transaction] 새 파일 삭제: {new_file}")
+        # 메모리 상태 복원 (역순)
+        self._run_callbacks(reversed(self.rollback_callbacks))
 
         print(f"[Transaction] 트랜잭션 롤백 완료 (ID: {self.transaction_id})")
 
         # 상태 초기화
-        self.backup_files = {}
-        self.new_files = []
-        self.is_active = False
-        self.transaction_id = None
+        self._reset()
 
     def __enter__(self):
         """Context manager 진입"""
@@ -191,6 +894,97 @@ class FileTransaction:
             return True
 
 
+class GroupCommit:
+    """
+    여러 상품을 하나의 FileTransaction으로 묶어 커밋하는 클래스
+    상품마다 메모리 세이브포인트를 두어 실패한 상품만 되돌리고,
+    디스크 커밋(fsync 포함)은 N개 상품 또는 T초마다 한 번만 수행합니다.
+
+    사용 예:
+        with GroupCommit(batch_size=20, interval=60) as group:
+            for ...:
+                with group.product() as transaction:
+                    crawl_product_on_detail_page(driver, transaction, counter)
+    """
+
+    def __init__(self, batch_size=20, interval=60.0, backup_dir=".transaction_backup"):
+        """
+        Args:
+            batch_size: 한 번에 커밋할 상품 수
+            interval: 마지막 커밋 이후 이 시간(초)이 지나면 상품 수와 관계없이 커밋
+            backup_dir: 저널 파일을 저장할 디렉토리
+        """
+        self.batch_size = batch_size
+        self.interval = interval
+        self.transaction = FileTransaction(backup_dir=backup_dir, journal=True)
+        self.pending_count = 0
+        self.started_at = None
+        self._after_commit = []  # 다음 디스크 커밋 후 실행할 함수
+
+    @contextmanager
+    def product(self):
+        """
+        상품 하나를 처리하는 구간입니다.
+        예외가 발생하면 이 상품의 변경 내용만 롤백하고 예외를 다시 발생시킵니다.
+        """
+        if not self.transaction.is_active:
+            self.transaction.begin()
+            self.started_at = time.time()
+
+        savepoint = self.transaction.savepoint()
+
+        try:
+            yield self.transaction
+        except BaseException:
+            self.transaction.rollback_to_savepoint(savepoint)
+            raise
+
+        self.transaction.release_savepoint(savepoint)
+        self.pending_count += 1
+
+        if (self.pending_count >= self.batch_size or
+                time.time() - self.started_at >= self.interval):
+            self.flush()
+
+    def flush(self):
+        """대기 중인 상품들을 디스크에 커밋합니다."""
+        if not self.transaction.is_active:
+            return
+
+        count = self.pending_count
+        self.transaction.commit()
+        self.pending_count = 0
+        self.started_at = None
+        print(f"[Transaction] 그룹 커밋 완료 ({count}개 상품)")
+
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            callback()
+
+    def call_after_commit(self, callback):
+        """
+        지금까지 처리한 상품이 디스크에 커밋된 뒤 callback()을 실행합니다.
+        (커밋을 기다리는 상품이 없으면 바로 실행, 크롤링 진행 상태를 커밋된 상품까지만 기록할 때 사용)
+        """
+        if self.transaction.is_active:
+            self._after_commit.append(callback)
+        else:
+            callback()
+
+    def close(self):
+        """남은 상품을 커밋하고 종료합니다."""
+        self.flush()
+
+    def __enter__(self):
+        """Context manager 진입"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager 종료 (완료된 상품은 예외가 발생해도 커밋)"""
+        self.close()
+        return False
+
+
 # 사용 예제 함수
 def example_usage():
     """FileTransaction 사용 예제"""
@@ -206,6 +1000,10 @@ def example_usage():
             transaction.write_file("test1.txt", "첫 번째 파일 내용\n")
             transaction.write_file("test2.txt", "두 번째 파일 내용\n")
 
+            # 커밋 전에도 작성한 내용을 읽을 수 있음 (디스크에는 아직 기록되지 않음)
+            transaction.append_file("test2.txt", "추가 내용\n")
+            print(f"커밋 전 읽기: {transaction.read_file('test2.txt')!r}")
+
             # JSON 작성
             transaction.write_json("test_data.json", {
                 "name": "테스트 제품",
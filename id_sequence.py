@@ -0,0 +1,173 @@
+"""
+ID 시퀀스 할당 모듈
+상품/브랜드/상품정보 제공고시 ID를 SQLite 파일에 저장된 시퀀스에서 블록 단위로 할당받습니다.
+
+각 프로세스는 BEGIN IMMEDIATE 트랜잭션으로 ID 블록(기본 1000개)을 임대하고,
+블록 안에서는 파일 I/O 없이 메모리에서 ID를 나눠줍니다.
+여러 크롤러 프로세스를 동시에 실행해도 서로 다른 블록을 받으므로 ID가 겹치지 않습니다.
+프로세스 종료 시 다른 프로세스가 그 뒤 블록을 임대하지 않았다면 남은 ID를 반납합니다.
+"""
+
+import atexit
+import sqlite3
+
+# 시퀀스 데이터베이스 파일 경로
+DEFAULT_DB_PATH = "id_sequences.db"
+
+# 한 번에 임대할 ID 수
+DEFAULT_BLOCK_SIZE = 1000
+
+# 다른 프로세스가 블록을 임대 중일 때 기다리는 최대 시간 (초)
+LOCK_TIMEOUT = 30
+
+
+class IdSequence:
+    """
+    블록 임대 방식의 ID 시퀀스
+
+    사용 예:
+        sequence = IdSequence("products", seed=lambda: 715)
+        new_id = sequence.next()
+    """
+
+    def __init__(self, name, seed=None, block_size=DEFAULT_BLOCK_SIZE, db_path=DEFAULT_DB_PATH):
+        """
+        Args:
+            name: 시퀀스 이름 (예: "products")
+            seed: 다음 ID의 최솟값을 반환하는 함수 (기존 JSON 파일의 next_id 등)
+                  블록을 임대할 때마다 확인하여 시퀀스가 이 값보다 작으면 올려줍니다.
+            block_size: 한 번에 임대할 ID 수
+            db_path: 시퀀스 데이터베이스 파일 경로
+        """
+        self.name = name
+        self.seed = seed
+        self.block_size = block_size
+        self.db_path = db_path
+        self.cursor = 0  # 다음에 나눠줄 ID
+        self.block_start = 0  # 임대한 블록의 시작 ID
+        self.block_end = 0  # 임대한 블록의 끝 (미포함)
+        self.minimum = 1  # ensure_minimum()으로 올린 다음 ID의 최솟값
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=LOCK_TIMEOUT, isolation_level=None)
+        conn.execute("CREATE TABLE IF NOT EXISTS sequences (name TEXT PRIMARY KEY, next_id INTEGER NOT NULL)")
+        return conn
+
+    def _lease(self):
+        """새 ID 블록을 임대합니다."""
+        minimum = max(self.seed() if self.seed else 1, self.minimum)
+
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT next_id FROM sequences WHERE name = ?", (self.name,)).fetchone()
+            start = max(row[0], minimum) if row else minimum
+            conn.execute(
+                "INSERT OR REPLACE INTO sequences (name, next_id) VALUES (?, ?)",
+                (self.name, start + self.block_size)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+        self.cursor = self.block_start = start
+        self.block_end = start + self.block_size
+        print(f"[IdSequence] '{self.name}' ID 블록 임대: {start} ~ {self.block_end - 1}")
+
+    def next(self):
+        """
+        다음 ID를 할당합니다.
+
+        Returns:
+            int: 새 ID
+        """
+        if self.cursor >= self.block_end:
+            self._lease()
+
+        new_id = self.cursor
+        self.cursor += 1
+        return new_id
+
+    def ensure_minimum(self, minimum):
+        """
+        다음 ID가 minimum 이상이 되도록 합니다. (이미 만들어진 시퀀스에 다른 저장소의 최솟값을 반영할 때 사용)
+        임대한 블록에 남은 ID가 minimum보다 작으면 버리고 다음 할당 때 새 블록을 임대합니다.
+
+        Args:
+            minimum: 다음 ID의 최솟값
+        """
+        self.minimum = max(self.minimum, minimum)
+        if self.cursor < self.minimum:
+            self.block_end = self.cursor
+
+    def release(self, released_id):
+        """
+        마지막으로 할당한 ID를 반납합니다. (트랜잭션 롤백 시 같은 ID를 다시 사용)
+        가장 최근 ID가 아니면 무시합니다.
+
+        Args:
+            released_id: 반납할 ID
+        """
+        if released_id == self.cursor - 1 and released_id >= self.block_start:
+            self.cursor = released_id
+
+    def close(self):
+        """
+        사용하지 않은 ID를 시퀀스에 반납합니다.
+        그 사이 다른 프로세스가 다음 블록을 임대했다면 반납하지 않습니다. (빈 번호로 남음)
+        """
+        if self.cursor >= self.block_end:
+            return
+
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE sequences SET next_id = ? WHERE name = ? AND next_id = ?",
+                (self.cursor, self.name, self.block_end)
+            )
+        finally:
+            conn.close()
+
+        self.block_end = self.cursor
+
+
+# 프로세스 전체에서 공유하는 시퀀스 {이름: IdSequence}
+_sequences = {}
+
+
+def get_sequence(name, seed=None, db_path=DEFAULT_DB_PATH):
+    """
+    이름에 해당하는 시퀀스를 반환합니다. (프로세스당 하나, 종료 시 남은 ID 반납)
+
+    Args:
+        name: 시퀀스 이름
+        seed: 다음 ID의 최솟값을 반환하는 함수 (처음 만들 때만 사용)
+        db_path: 시퀀스 데이터베이스 파일 경로
+
+    Returns:
+        IdSequence: 시퀀스 객체
+    """
+    sequence = _sequences.get(name)
+
+    if sequence is None:
+        sequence = IdSequence(name, seed=seed, db_path=db_path)
+        _sequences[name] = sequence
+        atexit.register(sequence.close)
+
+    return sequence
+
+
+# 디버깅 및 테스트용
+if __name__ == "__main__":
+    test_sequence = IdSequence("test", block_size=5, db_path="id_sequences_test.db")
+    ids = [test_sequence.next() for _ in range(7)]
+    print(f"할당된 ID: {ids}")
+
+    test_sequence.release(ids[-1])
+    print(f"반납 후 다음 ID: {test_sequence.next()}")
+
+    test_sequence.close()
@@ -0,0 +1,180 @@
+"""
+상품 목록 페이지네이션 모듈
+페이지 버튼을 찾아 클릭하는 대신 목록 URL의 pageIdx / rowsPerPage 파라미터로 페이지 URL을 직접 만듭니다.
+
+전체 상품 수를 첫 페이지에서 읽어 마지막 페이지를 계산하므로,
+모든 페이지 URL을 미리 만들어 여러 워커에 나눠줄 수 있습니다.
+"""
+
+import math
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from page_wait import wait_for_xpath
+
+# 한 페이지에 표시할 상품 수 (올리브영 목록은 24 / 36 / 48 지원)
+DEFAULT_ROWS_PER_PAGE = 48
+
+# 목록 페이지의 상품 행 XPath (이 요소가 나타나면 페이지 로딩 완료로 판단)
+PRODUCT_LIST_XPATH = '//*[@id="Contents"]/ul[2]'
+
+# 목록 페이지의 상품 링크 배열을 만드는 스크립트 식 (//*[@id="Contents"]/ul[2~]/li/div/a, 첫 번째 ul은 상품 행이 아님)
+# 상품 URL 수집과 페이지 상품 수 계산이 같은 범위를 사용하도록 공유
+PRODUCT_LINKS_JS = (
+    "Array.prototype.slice.call(document.querySelectorAll('#Contents > ul'), 1).reduce(function (links, row) {"
+    " return links.concat(Array.prototype.slice.call(row.querySelectorAll(':scope > li > div > a')));"
+    " }, [])"
+)
+
+# 목록 페이지의 전체 상품 수 문구 (예: "총 123개의 상품이 등록되어 있습니다.")
+TOTAL_COUNT_PATTERN = re.compile(r'([\d,]+)\s*개의\s*상품')
+
+
+class ListingPaginator:
+    """
+    URL 파라미터 기반 목록 페이지네이터
+
+    사용 예:
+        paginator = ListingPaginator(start_url, rows_per_page=48)
+        for page_idx in paginator.iter_pages(driver):
+            ...  # driver에 page_idx 페이지가 열려있음
+    """
+
+    def __init__(self, start_url: str, rows_per_page: int = DEFAULT_ROWS_PER_PAGE):
+        """
+        Args:
+            start_url: 목록 페이지 URL (카테고리 / 정렬 / 브랜드 필터 파라미터 포함)
+            rows_per_page: 한 페이지에 표시할 상품 수
+        """
+        self.start_url = start_url
+        self.rows_per_page = rows_per_page
+        self.total_count = None  # 전체 상품 수 (첫 페이지를 읽은 뒤 설정)
+        self.reached_end = False  # iter_pages()가 목록 끝(마지막 페이지 / 상품이 적거나 없는 페이지)에서 멈췄는지 여부
+
+    def page_url(self, page_idx: int) -> str:
+        """
+        page_idx 페이지의 목록 URL을 만듭니다. (다른 파라미터는 그대로 유지)
+
+        Args:
+            page_idx: 페이지 번호 (1부터 시작)
+
+        Returns:
+            str: 목록 페이지 URL
+        """
+        parts = urlsplit(self.start_url)
+        params = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                  if k not in ("pageIdx", "rowsPerPage")]
+        params += [("pageIdx", str(page_idx)), ("rowsPerPage", str(self.rows_per_page))]
+        return urlunsplit(parts._replace(query=urlencode(params)))
+
+    @property
+    def last_page(self):
+        """마지막 페이지 번호 (전체 상품 수를 모르면 None)"""
+        if self.total_count is None:
+            return None
+        return max(1, math.ceil(self.total_count / self.rows_per_page))
+
+    def page_urls(self):
+        """
+        모든 페이지 URL 리스트 (워커에 나눠줄 때 사용, 전체 상품 수를 읽은 뒤에만 가능)
+
+        Returns:
+            list of str: 1페이지부터 마지막 페이지까지의 URL
+        """
+        if self.last_page is None:
+            raise ValueError("전체 상품 수를 알 수 없습니다. 먼저 open_page()로 첫 페이지를 여세요.")
+        return [self.page_url(page_idx) for page_idx in range(1, self.last_page + 1)]
+
+    def read_total_count(self, driver):
+        """
+        현재 목록 페이지에서 전체 상품 수를 읽습니다.
+
+        Returns:
+            int or None: 전체 상품 수 (문구를 찾지 못하면 None)
+        """
+        text = driver.execute_script(
+            "var el = document.getElementById('Contents');"
+            "return el ? el.innerText : document.body.innerText;"
+        )
+        match = TOTAL_COUNT_PATTERN.search(text or "")
+        if not match:
+            return None
+        return int(match.group(1).replace(",", ""))
+
+    def count_products(self, driver) -> int:
+        """현재 목록 페이지의 상품 링크 수 (상품 URL 수집과 같은 범위)"""
+        return driver.execute_script(f"return {PRODUCT_LINKS_JS}.length;") or 0
+
+    def is_empty_page(self, driver) -> bool:
+        """현재 페이지가 상품이 하나도 없는 목록 페이지인지 여부 (목록 끝을 넘어간 페이지)"""
+        has_contents = driver.execute_script("return document.getElementById('Contents') !== null;")
+        return bool(has_contents) and self.count_products(driver) == 0
+
+    def open_page(self, driver, page_idx: int, timeout: float = 10) -> bool:
+        """
+        page_idx 페이지로 이동하고 상품 목록이 나타날 때까지 기다립니다.
+        처음 연 페이지에서 전체 상품 수를 읽어 둡니다.
+
+        Returns:
+            bool: 상품 목록이 나타났는지 여부
+        """
+        url = self.page_url(page_idx)
+        if driver.current_url != url:
+            driver.get(url)
+        loaded = wait_for_xpath(driver, PRODUCT_LIST_XPATH, timeout)
+
+        if loaded and self.total_count is None:
+            self.total_count = self.read_total_count(driver)
+            if self.total_count is not None:
+                print(f"전체 상품 수: {self.total_count}개 ({self.rows_per_page}개씩 {self.last_page}페이지)")
+
+        return loaded
+
+    def has_page(self, page_idx: int, previous_page_count: int = None) -> bool:
+        """
+        page_idx 페이지가 존재하는지 확인합니다.
+        전체 상품 수를 모르면 이전 페이지가 가득 찼는지로 판단합니다.
+
+        Args:
+            page_idx: 확인할 페이지 번호
+            previous_page_count: 이전 페이지의 상품 수
+        """
+        if self.last_page is not None:
+            return page_idx <= self.last_page
+        if previous_page_count is None:
+            return page_idx == 1
+        return previous_page_count >= self.rows_per_page
+
+    def iter_pages(self, driver, start_page: int = 1, timeout: float = 10):
+        """
+        목록 페이지를 순서대로 열면서 페이지 번호를 돌려줍니다.
+        목록 끝에 도달해서 멈추면 reached_end가 True가 됩니다. (페이지 로딩 실패로 멈추면 False)
+
+        Args:
+            driver: 웹드라이버
+            start_page: 시작 페이지 번호
+            timeout: 페이지 로딩 최대 대기 시간 (초)
+
+        Yields:
+            int: driver에 열려있는 페이지 번호
+        """
+        page_idx = start_page
+        previous_count = None
+        self.reached_end = False
+
+        while page_idx == start_page or self.has_page(page_idx, previous_count):
+            if not self.open_page(driver, page_idx, timeout):
+                if page_idx > 1 and self.is_empty_page(driver):
+                    print(f"{page_idx}페이지에 상품이 없습니다. 목록 끝으로 판단합니다.")
+                    self.reached_end = True
+                else:
+                    print(f"✗ {page_idx}페이지 상품 목록이 나타나지 않았습니다. 페이지 이동 중단.")
+                return
+
+            yield page_idx
+
+            # 전체 상품 수를 모르면 현재 페이지가 가득 찼는지로 다음 페이지 여부 판단
+            previous_count = self.count_products(driver) if self.last_page is None else None
+            page_idx += 1
+
+        self.reached_end = True
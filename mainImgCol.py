@@ -1,13 +1,14 @@
 # mainImgCol.py (수정 버전 - swiper-slide-active 클래스 사용)
 
-from selenium.webdriver.chrome.webdriver import WebDriver
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import StaleElementReferenceException, NoSuchElementException
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from __future__ import annotations
+
 import time
-from typing import List
+from typing import List, TYPE_CHECKING
 import re
+from page_wait import wait_for_image_src, wait_for_slide_change, get_active_slide_index, wait_until
+
+if TYPE_CHECKING:
+    from selenium.webdriver.chrome.webdriver import WebDriver
 
 
 def clean_image_url(url: str) -> str:
@@ -26,6 +27,10 @@ def get_active_image_element(driver: WebDriver):
     """
     현재 활성화된 슬라이드의 이미지 요소를 찾습니다.
     """
+    # selenium.webdriver는 임포트 비용이 커서 실제 크롤링 시에만 불러옴
+    from selenium.webdriver.common.by import By
+    from selenium.common.exceptions import NoSuchElementException
+
     try:
         # 방법 1: swiper-slide-active 클래스를 가진 슬라이드에서 이미지 찾기
         active_slide = driver.find_element(By.CSS_SELECTOR, '.swiper-slide-active')
@@ -56,30 +61,110 @@ def wait_for_image_change(driver: WebDriver, previous_src: str, timeout: int = 5
     """
     이미지가 변경될 때까지 기다립니다.
     """
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        try:
-            current_element = get_active_image_element(driver)
-            current_src = current_element.get_attribute('src') or current_element.get_attribute('data-src')
+    def image_changed():
+        current_element = get_active_image_element(driver)
+        current_src = current_element.get_attribute('src') or current_element.get_attribute('data-src')
+        return current_src and current_src != previous_src
+
+    return bool(wait_until(image_changed, timeout))
+
+
+# 메인 이미지 슬라이더의 모든 슬라이드를 한 번에 읽는 스크립트
+# (활성 슬라이드가 속한 swiper-wrapper 기준, [data-swiper-slide-index, src, data-src, alt] 리스트 반환)
+READ_SLIDES_SCRIPT = """
+var active = document.querySelector('.swiper-slide-active');
+var wrapper = (active && active.closest('.swiper-wrapper')) || document.querySelector('.swiper-wrapper');
+if (!wrapper) return [];
+return Array.prototype.map.call(wrapper.querySelectorAll('.swiper-slide'), function (slide) {
+    var img = slide.querySelector('img');
+    return [slide.getAttribute('data-swiper-slide-index'),
+            img ? img.getAttribute('src') : null,
+            img ? img.getAttribute('data-src') : null,
+            img ? img.getAttribute('alt') : null];
+});
+"""
+
+
+def slide_image_src(src, data_src=None, alt=None):
+    """
+    슬라이드 이미지의 URL을 고릅니다.
+    lazy loading 슬라이드의 src는 data:image 자리표시자이므로 건너뛰고 data-src를 사용하며,
+    둘 다 없으면 URL 형태의 alt를 사용합니다.
 
-            if current_src and current_src != previous_src:
-                return True
-        except:
-            pass
-        time.sleep(0.5)
-    return False
+    Returns:
+        str or None: 이미지 URL (없으면 None)
+    """
+    for url in (src, data_src):
+        if url and not url.startswith('data:'):
+            return url
+    if (alt or '').startswith('http'):
+        return alt
+    return None
 
 
 def get_main_image_urls(driver: WebDriver, num_images: int = 3) -> List[str]:
+    """
+    현재 상세 페이지에서 메인 이미지 슬라이더의 이미지 URL을 지정된 개수만큼 수집합니다.
+    슬라이드를 넘기지 않고 모든 슬라이드를 스크립트 한 번으로 읽습니다.
+    loop 모드에서 복제된 슬라이드는 data-swiper-slide-index로 제거하고 인덱스 순서로 반환합니다.
+    (슬라이드를 읽지 못하면 get_main_image_urls_by_sliding으로 대체)
+    """
+    print(f"이미지 URL 수집 시작... (목표: {num_images}개)")
+    wait_for_image_src(driver, '.swiper-slide-active img')  # 슬라이더가 준비되면 바로 진행
+
+    try:
+        slides = driver.execute_script(READ_SLIDES_SCRIPT) or []
+    except Exception as e:
+        print(f"슬라이드 일괄 수집 실패: {e}")
+        slides = []
+
+    # data-swiper-slide-index 기준 중복 제거 (인덱스가 없는 슬라이드는 위치 순서 사용)
+    slide_urls = {}
+    for position, (slide_index, *attributes) in enumerate(slides):
+        order = int(slide_index) if slide_index and slide_index.isdigit() else len(slides) + position
+        img_src = slide_image_src(*attributes)
+        if img_src and order not in slide_urls:
+            slide_urls[order] = img_src
+
+    image_urls = []
+    for order in sorted(slide_urls):
+        img_src = slide_urls[order]
+        if img_src.startswith('//'):
+            img_src = 'https:' + img_src
+        if not img_src.startswith('http'):
+            continue
+
+        cleaned_url = clean_image_url(img_src)
+        if cleaned_url not in image_urls:
+            image_urls.append(cleaned_url)
+        if len(image_urls) >= num_images:
+            break
+
+    if not image_urls:
+        print("슬라이드에서 이미지 URL을 찾지 못해 슬라이드 이동 방식으로 수집합니다.")
+        return get_main_image_urls_by_sliding(driver, num_images)
+
+    print(f"총 {len(image_urls)}개의 이미지 URL 수집 완료. (슬라이드 {len(slides)}개)")
+    for idx, url in enumerate(image_urls, 1):
+        print(f"{idx}. {url}")
+
+    return image_urls
+
+
+def get_main_image_urls_by_sliding(driver: WebDriver, num_images: int = 3) -> List[str]:
     """
     현재 상세 페이지에서 메인 이미지 슬라이더의 이미지 URL을 지정된 개수만큼 수집합니다.
     swiper-slide-active 클래스를 사용하여 현재 보이는 이미지를 정확히 찾습니다.
+    (슬라이드를 하나씩 넘기며 수집하는 기존 방식)
     """
+    # selenium.webdriver는 임포트 비용이 커서 실제 크롤링 시에만 불러옴
+    from selenium.webdriver.common.by import By
+    from selenium.common.exceptions import StaleElementReferenceException, NoSuchElementException
+
     image_urls = []  # 순서대로 URL 저장
 
     # 상세 페이지 로딩 대기
-    print(f"이미지 URL 수집 시작... (목표: {num_images}개)")
-    time.sleep(4)  # 페이지 로딩을 위한 충분한 대기
+    wait_for_image_src(driver, '.swiper-slide-active img')  # 활성 슬라이드 이미지가 준비되면 바로 진행
 
     # 먼저 첫 번째 이미지(인덱스 0)로 이동 시도
     try:
@@ -88,15 +173,14 @@ def get_main_image_urls(driver: WebDriver, num_images: int = 3) -> List[str]:
         prev_button = driver.find_element(By.CSS_SELECTOR, '.swiper-button-prev')
         for _ in range(10):  # 최대 10번 클릭
             try:
-                driver.execute_script("arguments[0].click();", prev_button)
-                time.sleep(0.5)
-
                 # 현재 활성 슬라이드 인덱스 확인
-                active_slide = driver.find_element(By.CSS_SELECTOR, '.swiper-slide-active')
-                slide_index = active_slide.get_attribute('data-swiper-slide-index')
+                slide_index = get_active_slide_index(driver)
                 if slide_index == '0':
                     print("첫 번째 이미지(인덱스 0)로 이동 성공")
                     break
+
+                driver.execute_script("arguments[0].click();", prev_button)
+                wait_for_slide_change(driver, slide_index)
             except:
                 pass
     except Exception as e:
@@ -162,26 +246,27 @@ def get_main_image_urls(driver: WebDriver, num_images: int = 3) -> List[str]:
                     # 현재 이미지 URL 저장 (변경 확인용)
                     previous_src = img_src
 
+                    previous_index = get_active_slide_index(driver)
+
                     # JavaScript를 사용하여 강제 클릭
                     driver.execute_script("arguments[0].click();", next_button)
                     print("  다음 버튼 클릭")
 
-                    # 이미지 변경 대기
+                    # 슬라이드 및 이미지 변경 대기
+                    wait_for_slide_change(driver, previous_index)
                     if wait_for_image_change(driver, previous_src, 3):
                         print("  이미지 변경 확인됨")
                     else:
                         print("  이미지 변경되지 않음 (동일 이미지일 수 있음)")
 
-                    # 추가 대기
-                    time.sleep(1)
-
                 except NoSuchElementException:
                     print("  다음 버튼을 찾을 수 없습니다.")
                     # 버튼이 없으면 키보드 이벤트로 대체
                     from selenium.webdriver.common.keys import Keys
                     body = driver.find_element(By.TAG_NAME, 'body')
+                    previous_index = get_active_slide_index(driver)
                     body.send_keys(Keys.ARROW_RIGHT)
-                    time.sleep(2)
+                    wait_for_slide_change(driver, previous_index)
                     print("  오른쪽 화살표 키 입력")
 
                 except Exception as e:
@@ -192,14 +277,13 @@ def get_main_image_urls(driver: WebDriver, num_images: int = 3) -> List[str]:
             print(f"  이미지 요소를 찾을 수 없음: {e}")
             # 빈 문자열 추가
             image_urls.append("")
-            time.sleep(1)
 
         except StaleElementReferenceException:
             # 요소가 새로고침되어 발생하는 오류
             print(f"  요소 참조 오류 발생. 재시도합니다.")
 
-            # 잠시 대기 후 다시 시도
-            time.sleep(1.5)
+            # 활성 이미지가 다시 준비되면 재시도
+            wait_for_image_src(driver, '.swiper-slide-active img', timeout=3)
 
             try:
                 image_element = get_active_image_element(driver)
@@ -226,7 +310,6 @@ def get_main_image_urls(driver: WebDriver, num_images: int = 3) -> List[str]:
             print(f"  예상치 못한 에러 발생: {type(e).__name__}: {str(e)}")
             # 빈 문자열 추가
             image_urls.append("")
-            time.sleep(1)
 
     print(f"\n총 {len(image_urls)}개의 이미지 URL 수집 완료.")
 
@@ -266,6 +349,9 @@ def get_all_image_urls_at_once(driver: WebDriver) -> List[str]:
     """
     페이지의 모든 이미지 URL을 한번에 가져옵니다.
     """
+    # selenium.webdriver는 임포트 비용이 커서 실제 크롤링 시에만 불러옴
+    from selenium.webdriver.common.by import By
+
     print("모든 이미지 URL 한번에 수집...")
 
     image_urls = []
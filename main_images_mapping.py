@@ -1,21 +1,25 @@
 import os
+from sql_writer import append_sql_values
 
 # SQL 파일 경로
 SQL_FILE_PATH = "product_main_images_sql.txt"
 
+# product_main_images 테이블 INSERT 헤더
+MAIN_IMAGES_SQL_HEADER = "INSERT INTO product_main_images (product_id, image_type, display_order, image_url) VALUES"
+
 
 def create_initial_product_main_images_sql(transaction=None): # transaction 인자 추가
     """
     초기 product_main_images_sql.txt 파일을 생성하거나 초기화합니다.
+    (임포트 시에는 실행되지 않으며, 크롤링 시작 전 crawl.initialize_output_files()에서 호출)
     """
-    initial_sql = "INSERT INTO product_main_images (product_id, image_type, display_order, image_url) VALUES"
+    initial_sql = MAIN_IMAGES_SQL_HEADER
 
     if transaction:
         # 트랜잭션이 있을 경우 파일을 읽고/쓰기
         try:
-            # 파일을 읽어서 내용 확인 (백업을 위해)
-            with open(SQL_FILE_PATH, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # 커밋 전 변경 내용까지 포함하여 확인
+            content = transaction.read_file(SQL_FILE_PATH)
             if not content.strip():
                 transaction.write_file(SQL_FILE_PATH, initial_sql)
         except FileNotFoundError:
@@ -34,9 +38,22 @@ def create_initial_product_main_images_sql(transaction=None): # transaction 인
                 f.write(initial_sql)
 
 
+def format_main_image_values(product_id, display_order, image_url):
+    """
+    메인 이미지 한 개의 VALUES 행을 생성합니다.
+    첫 번째 이미지(display_order 0)는 THUMBNAIL, 나머지는 GALLERY입니다.
+    """
+    image_type = 'THUMBNAIL' if display_order == 0 else 'GALLERY'
+
+    # SQL 이스케이프
+    escaped_image_url = image_url.replace("'", "''")
+
+    return f"({product_id}, '{image_type}', {display_order}, '{escaped_image_url}')"
+
+
 def update_product_main_images_sql(product_id, main_image_urls, transaction): # transaction 인자 추가
     """
-    product_main_images_sql.txt 파일에 제품 이미지 INSERT 문을 트랜잭션으로 추가합니다.
+    product_main_images_sql.txt 파일 끝에 제품 이미지 INSERT 값을 트랜잭션으로 추가합니다.
 
     Args:
         product_id (int): 제품 ID
@@ -46,54 +63,13 @@ def update_product_main_images_sql(product_id, main_image_urls, transaction): #
     if not main_image_urls or len(main_image_urls) == 0:
         return []
 
-    # SQL 파일 내용 읽기 (트랜잭션에 의해 백업됨)
-    try:
-        with open(SQL_FILE_PATH, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except FileNotFoundError:
-        content = "INSERT INTO product_main_images (product_id, image_type, display_order, image_url) VALUES"
-
-    # 내용 정리
-    content = content.strip()
-
-    # 마지막 세미콜론 제거
-    if content.endswith(';'):
-        content = content[:-1].rstrip()
-
     # INSERT 문 생성
     insert_statements = []
 
     for idx, image_url in enumerate(main_image_urls):
-        display_order = idx
-        image_type = 'THUMBNAIL' if display_order == 0 else 'GALLERY'
-
-        # SQL 이스케이프
-        escaped_image_url = image_url.replace("'", "''")
-
-        insert_statement = f"({product_id}, '{image_type}', {display_order}, '{escaped_image_url}')"
-        insert_statements.append(insert_statement)
-
-    # VALUES로 끝나는지 확인 (첫 데이터 추가)
-    if content.endswith('VALUES'):
-        new_content = content
-        for i, stmt in enumerate(insert_statements):
-            if i == 0:
-                new_content += f"\n{stmt}"
-            else:
-                new_content += f",\n{stmt}"
-        new_content += ";"
-    else:
-        # 기존 데이터가 있으므로 콤마 추가 후 새 데이터 추가
-        new_content = content
-        for stmt in insert_statements:
-            new_content += f",\n{stmt}"
-        new_content += ";"
+        insert_statements.append(format_main_image_values(product_id, idx, image_url))
 
-    # 트랜잭션을 사용하여 SQL 파일 저장
-    transaction.write_file(SQL_FILE_PATH, new_content)
+    # 트랜잭션을 사용하여 SQL 파일 끝에 추가
+    append_sql_values(SQL_FILE_PATH, MAIN_IMAGES_SQL_HEADER, insert_statements, transaction)
 
     return insert_statements
-
-
-# 모듈 임포트 시 초기 SQL 파일 생성 (트랜잭션 없이)
-create_initial_product_main_images_sql()
\ No newline at end of file
@@ -1,59 +1,25 @@
-from selenium.webdriver.chrome.webdriver import WebDriver
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import time
-from typing import List, Dict
-import re
-
-
-# ===============================================
-# 보조 함수: URL 정제
-# ===============================================
-
-def clean_image_url(url: str) -> str:
-    """
-    이미지 URL에서 불필요한 쿼리 파라미터를 제거합니다.
-    """
-    if not url:
-        return url
-
-    # &QT, &SF, &sharpen 등의 파라미터 제거
-    cleaned = re.sub(r'[?&](QT|SF|sharpen)=[^&]*', '', url)
-    return cleaned
-
-
-# ===============================================
-# 복수 옵션 수집을 위한 상수 정의
-# ===============================================
-
-# 옵션 버튼 (드롭다운 열기)
-OPTION_BUTTON_SELECTOR = "#main > div.page_product-details-wrapper___t38G > div > div.page_right-section__Plw5V > div > div.PurchaseBottom_purchase-bottom__C_GnK > div.PurchaseBottom_purchase-bottom-contents__ztB1w > div.OptionSelector_option-selector__6Z4Bu > div.option-wrapper > div > div > button"
-
-# 옵션 리스트 전체 컨테이너 (ul)
-OPTION_LIST_CONTAINER_SELECTOR = "ul.OptionSelector_option-list__9iV9W"
-
-# 개별 옵션 아이템 (li) - 전체 리스트에서 반복 선택
-OPTION_ITEM_SELECTOR = "li.OptionSelector_option-item__yMYbC"
-
-# 각 옵션 아이템 내부의 세부 요소들 (상대 경로)
-OPTION_IMG_RELATIVE = "img"
-OPTION_NAME_RELATIVE = "span.OptionSelector_option-item-tit__8zEjW"
-OPTION_PRICE_RELATIVE = "span.OptionSelector_option-item-price__QiVwN"
-
-# ===============================================
-# 단일 옵션(기본 상품 정보)을 위한 상수 정의
-# ===============================================
-
-# 상품명
-MAIN_PRODUCT_NAME_SELECTOR = "#main > div.page_product-details-wrapper___t38G > div > div.page_right-section__Plw5V > div > div.GoodsDetailInfo_goods-info__NvhCW > div.GoodsDetailInfo_title-area__unu7g > h3"
+from __future__ import annotations
 
-# 상품 가격
-MAIN_PRODUCT_PRICE_SELECTOR = "#main > div.page_product-details-wrapper___t38G > div > div.page_right-section__Plw5V > div > div.GoodsDetailInfo_goods-info__NvhCW > div.GoodsDetailInfo_price-area__RE0Gc.GoodsDetailInfo_margin-top__41aCw > div > div > span > span:nth-child(1)"
-
-# 메인 이미지 썸네일
-MAIN_THUMBNAIL_IMAGE_SELECTOR = "#main > div.page_product-details-wrapper___t38G > div > div.page_left-section__qXr0Q > div.GoodsDetailCarousel_visual-container__1kSZN > div > div > div.swiper-wrapper > div.swiper-slide.swiper-slide-active > div > img"
+from typing import List, Dict, TYPE_CHECKING
+import re
+from page_wait import wait_for_element
+
+# 선택자 상수와 URL 정리 함수는 page_selectors에 정의 (브라우저 없이 쓰는 모듈과 공유)
+from page_selectors import (
+    clean_image_url,
+    OPTION_BUTTON_SELECTOR,
+    OPTION_LIST_CONTAINER_SELECTOR,
+    OPTION_ITEM_SELECTOR,
+    OPTION_IMG_RELATIVE,
+    OPTION_NAME_RELATIVE,
+    OPTION_PRICE_RELATIVE,
+    MAIN_PRODUCT_NAME_SELECTOR,
+    MAIN_PRODUCT_PRICE_SELECTOR,
+    MAIN_THUMBNAIL_IMAGE_SELECTOR,
+)
+
+if TYPE_CHECKING:
+    from selenium.webdriver.chrome.webdriver import WebDriver
 
 
 # ===============================================
@@ -65,6 +31,12 @@ def get_product_options(driver: WebDriver) -> List[Dict]:
     상품 상세 페이지에서 모든 옵션의 이미지 URL, 옵션명, 옵션 가격을 수집합니다.
     옵션이 없을 경우 (단일 옵션 상품), 메인 상품 정보를 가져와 단일 옵션으로 구성합니다.
     """
+    # selenium.webdriver는 임포트 비용이 커서 실제 크롤링 시에만 불러옴
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
     options_data = []
     option_button = None
     is_multi_option = False
@@ -81,7 +53,8 @@ def get_product_options(driver: WebDriver) -> List[Dict]:
         WebDriverWait(driver, 3).until(
             EC.presence_of_element_located((By.CSS_SELECTOR, OPTION_LIST_CONTAINER_SELECTOR))
         )
-        time.sleep(1)
+        # 옵션 항목이 채워질 때까지 대기
+        wait_for_element(driver, f"{OPTION_LIST_CONTAINER_SELECTOR} {OPTION_ITEM_SELECTOR}", timeout=3)
         is_multi_option = True
 
     except (NoSuchElementException, TimeoutException):
@@ -215,7 +188,6 @@ def get_product_options(driver: WebDriver) -> List[Dict]:
     try:
         if is_multi_option and option_button and option_button.is_displayed():
             driver.execute_script("arguments[0].click();", option_button)
-            time.sleep(0.5)
             print("✓ 옵션 드롭다운 닫기 성공.")
     except Exception:
         pass
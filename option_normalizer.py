@@ -0,0 +1,44 @@
+"""
+옵션 데이터 정리 모듈
+스크립트 추출(page_extractor), 정적 HTML 추출(static_extractor), 임베디드 상태 추출(embedded_state)이
+읽어온 옵션 값을 option.get_product_options()와 같은 형식으로 맞춥니다.
+
+Selenium을 임포트하지 않으므로 브라우저 없이 임포트 / 테스트할 수 있습니다.
+"""
+
+import re
+
+from page_selectors import clean_image_url
+
+
+def normalize_image_url(img_src, default):
+    """option.get_product_options와 같은 방식으로 이미지 URL 정리"""
+    if img_src:
+        if img_src.startswith('//'):
+            img_src = 'https:' + img_src
+        if img_src.startswith('http'):
+            return clean_image_url(img_src)
+    return default
+
+
+def normalize_options(raw_options, is_multi_option):
+    """
+    추출한 옵션 값 리스트를 option.get_product_options()와 같은 형식으로 변환합니다.
+    (값을 찾지 못한 항목은 기존 함수와 같은 기본값 사용)
+    """
+    if is_multi_option:
+        defaults = {'name': '옵션명 추출 실패', 'price': '가격 추출 실패', 'image_url': '이미지 요소 없음'}
+    else:
+        defaults = {'name': '단일 상품명', 'price': '0', 'image_url': 'URL 추출 실패'}
+
+    options = []
+    for idx, raw in enumerate(raw_options):
+        price_text = raw.get('price')
+        options.append({
+            'index': idx + 1,
+            'name': raw.get('name') or defaults['name'],
+            'price': re.sub(r'[^\d]', '', price_text) if price_text else defaults['price'],
+            'image_url': normalize_image_url(raw.get('image_url'), defaults['image_url']),
+            'is_soldout': bool(raw.get('is_soldout')),
+        })
+    return options
@@ -0,0 +1,184 @@
+"""
+상품 상세 페이지 일괄 추출 모듈
+execute_async_script 한 번으로 카테고리/브랜드/상품명, 옵션, 상품정보 제공고시를 함께 가져옵니다.
+
+productInfo / option / productDetailInfoProvided는 요소마다 find_element, .text, get_attribute를
+호출하므로 상품 한 개에 chromedriver 왕복이 수백 번 발생합니다.
+이 모듈은 같은 선택자를 브라우저 안에서 한꺼번에 평가하여 JSON 객체 하나로 반환합니다.
+(옵션 드롭다운과 정보 제공고시 아코디언을 여는 대기도 브라우저 안에서 처리)
+"""
+
+from option_normalizer import normalize_options
+from page_selectors import (
+    CATEGORY_XPATH,
+    BRAND_LINK_XPATH,
+    BRAND_BUTTON_XPATH,
+    PRODUCT_NAME_XPATH,
+    DETAILINFO_BUTTON_XPATH,
+    DETAILINFO_TABLE_SELECTOR,
+    OPTION_BUTTON_SELECTOR,
+    OPTION_LIST_CONTAINER_SELECTOR,
+    OPTION_ITEM_SELECTOR,
+    OPTION_IMG_RELATIVE,
+    OPTION_NAME_RELATIVE,
+    OPTION_PRICE_RELATIVE,
+    MAIN_PRODUCT_NAME_SELECTOR,
+    MAIN_PRODUCT_PRICE_SELECTOR,
+    MAIN_THUMBNAIL_IMAGE_SELECTOR,
+)
+
+# 수집할 메인 이미지 수
+MAIN_IMAGE_COUNT = 3
+
+# 옵션 드롭다운 / 정보 제공고시 테이블이 나타날 때까지 기다리는 최대 시간 (밀리초)
+WAIT_TIMEOUT_MS = 3000
+
+EXTRACT_PRODUCT_SCRIPT = """
+var s = arguments[0];
+var timeoutMs = arguments[1];
+var done = arguments[arguments.length - 1];
+
+function text(el) {
+    if (!el) return null;
+    var t = (el.innerText || el.textContent || '').trim();
+    return t || null;
+}
+function byXPath(xpath) {
+    return document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+function imgSrc(img) {
+    if (!img) return null;
+    return img.getAttribute('src') || img.getAttribute('data-src');
+}
+function waitFor(find, callback) {
+    var start = Date.now();
+    (function poll() {
+        var el = find();
+        if (el || Date.now() - start >= timeoutMs) { callback(el); return; }
+        setTimeout(poll, 100);
+    })();
+}
+
+var result = {
+    category: text(byXPath(s.category)),
+    brand: text(byXPath(s.brand_link)) || text(byXPath(s.brand_button)),
+    product_name: text(byXPath(s.product_name)),
+    is_multi_option: false,
+    options: [],
+    detail_info: {}
+};
+
+function collectDetailInfo() {
+    var button = byXPath(s.detailinfo_button);
+    if (!button) { done(result); return; }
+    button.scrollIntoView(true);
+    button.click();
+    waitFor(function () { return document.querySelector(s.detailinfo_table); }, function (table) {
+        if (table) {
+            table.querySelectorAll('tr').forEach(function (row) {
+                var th = row.querySelector('th'), td = row.querySelector('td');
+                if (th && td) result.detail_info[text(th) || ''] = text(td) || '';
+            });
+        }
+        done(result);
+    });
+}
+
+function collectSingleOption() {
+    result.options.push({
+        name: text(document.querySelector(s.main_name)),
+        price: text(document.querySelector(s.main_price)),
+        image_url: imgSrc(document.querySelector(s.main_thumbnail)),
+        is_soldout: false
+    });
+}
+
+try {
+    var optionButton = document.querySelector(s.option_button);
+    if (!optionButton) {
+        collectSingleOption();
+        collectDetailInfo();
+    } else {
+        optionButton.click();
+        waitFor(function () { return document.querySelector(s.option_list); }, function (list) {
+            try {
+                if (list) {
+                    result.is_multi_option = true;
+                    list.querySelectorAll(s.option_item).forEach(function (item) {
+                        result.options.push({
+                            name: text(item.querySelector(s.option_name)),
+                            price: text(item.querySelector(s.option_price)),
+                            image_url: imgSrc(item.querySelector(s.option_img)),
+                            is_soldout: (item.getAttribute('class') || '').indexOf('is-soldout') !== -1
+                        });
+                    });
+                    // 옵션 드롭다운 닫기
+                    optionButton.click();
+                } else {
+                    collectSingleOption();
+                }
+                collectDetailInfo();
+            } catch (e) {
+                done({error: String(e)});
+            }
+        });
+    }
+} catch (e) {
+    done({error: String(e)});
+}
+"""
+
+
+def _selectors() -> dict:
+    """스크립트에 넘길 선택자 (기존 모듈의 상수를 그대로 사용)"""
+    return {
+        "category": CATEGORY_XPATH,
+        "brand_link": BRAND_LINK_XPATH,
+        "brand_button": BRAND_BUTTON_XPATH,
+        "product_name": PRODUCT_NAME_XPATH,
+        "option_button": OPTION_BUTTON_SELECTOR,
+        "option_list": OPTION_LIST_CONTAINER_SELECTOR,
+        "option_item": OPTION_ITEM_SELECTOR,
+        "option_img": OPTION_IMG_RELATIVE,
+        "option_name": OPTION_NAME_RELATIVE,
+        "option_price": OPTION_PRICE_RELATIVE,
+        "main_name": MAIN_PRODUCT_NAME_SELECTOR,
+        "main_price": MAIN_PRODUCT_PRICE_SELECTOR,
+        "main_thumbnail": MAIN_THUMBNAIL_IMAGE_SELECTOR,
+        "detailinfo_button": DETAILINFO_BUTTON_XPATH,
+        "detailinfo_table": DETAILINFO_TABLE_SELECTOR,
+    }
+
+
+def extract_product_page(driver, timeout_ms: int = WAIT_TIMEOUT_MS) -> dict:
+    """
+    상품 상세 페이지의 기본 정보, 옵션, 상품정보 제공고시를 스크립트 한 번으로 추출합니다.
+
+    Args:
+        driver: Selenium WebDriver 객체
+        timeout_ms: 옵션 드롭다운 / 정보 제공고시 테이블 대기 시간 (밀리초)
+
+    Returns:
+        dict: category, brand, product_name (없으면 None),
+              product_options (option.get_product_options()와 같은 형식),
+              detail_info ({항목명: 값}, 없으면 빈 딕셔너리)
+
+    Raises:
+        RuntimeError: 스크립트 실행 중 페이지에서 오류가 발생한 경우
+    """
+    data = driver.execute_async_script(EXTRACT_PRODUCT_SCRIPT, _selectors(), timeout_ms)
+
+    if not data or data.get("error"):
+        raise RuntimeError(f"상세 페이지 스크립트 추출 실패: {data.get('error') if data else '결과 없음'}")
+
+    product_options = normalize_options(data.get("options") or [], data.get("is_multi_option", False))
+
+    print(f"✓ 스크립트 추출 완료: 옵션 {len(product_options)}개, 정보 제공고시 {len(data.get('detail_info') or {})}개 항목")
+
+    return {
+        "category": data.get("category"),
+        "brand": data.get("brand"),
+        "product_name": data.get("product_name"),
+        "product_options": product_options,
+        "detail_info": data.get("detail_info") or {},
+    }
@@ -0,0 +1,192 @@
+"""
+상세 페이지 수집기(fetcher) 모듈
+상세 페이지 URL을 받아 collect_product_record()와 같은 형식의 상품 데이터를 반환합니다.
+
+- SeleniumFetcher: 브라우저로 페이지를 열어 수집 (기존 방식)
+- HttpFetcher: HTTP로 HTML만 받아 static_extractor로 파싱 (브라우저 없이 수십 배 빠름)
+- FallbackFetcher: HttpFetcher를 먼저 시도하고, 정적 HTML에 필요한 항목이 없으면 브라우저로 수집
+
+모든 수집기는 fetch(url, product_counter, is_duplicate)를 제공하며
+수집할 수 없으면 None을, 검증에 실패하면 ValueError를 발생시킵니다. (저장은 하지 않음)
+
+브라우저 수집 모듈(crawl)은 SeleniumFetcher가 실제로 수집할 때만 임포트하므로
+HttpFetcher는 Selenium이 설치되지 않은 환경에서도 사용할 수 있습니다.
+"""
+
+import gzip
+import urllib.request
+
+from page_selectors import PRODUCT_NAME_XPATH
+from page_wait import wait_for_xpath
+from product_record import build_product_record
+from static_extractor import extract_product_html, missing_fields
+
+# HTTP 요청 최대 대기 시간 (초)
+HTTP_TIMEOUT = 10
+
+# 브라우저(create_driver)와 같은 User-Agent
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9",
+    "Accept-Encoding": "gzip",
+}
+
+
+class SeleniumFetcher:
+    """브라우저로 상세 페이지를 열어 수집하는 수집기"""
+
+    name = "browser"
+
+    def __init__(self, driver):
+        """
+        Args:
+            driver: 웹드라이버
+        """
+        self.driver = driver
+
+    def fetch(self, url, product_counter, is_duplicate=None):
+        """
+        상세 페이지를 열고 상품 데이터를 수집합니다.
+
+        Returns:
+            dict: collect_product_record()가 반환한 상품 데이터
+
+        Raises:
+            ValueError: 필수 데이터가 없거나 유효하지 않은 경우
+        """
+        from crawl import collect_product_record
+
+        self.driver.get(url)
+        wait_for_xpath(self.driver, PRODUCT_NAME_XPATH)
+        return collect_product_record(self.driver, product_counter, is_duplicate=is_duplicate)
+
+
+class HttpFetcher:
+    """HTTP로 받은 정적 HTML에서 수집하는 수집기 (자바스크립트 실행 없음)"""
+
+    name = "http"
+
+    def __init__(self, timeout=HTTP_TIMEOUT, headers=None):
+        """
+        Args:
+            timeout: HTTP 요청 최대 대기 시간 (초)
+            headers: 요청 헤더 (기본값 HTTP_HEADERS)
+        """
+        self.timeout = timeout
+        self.headers = dict(headers or HTTP_HEADERS)
+
+    def get_html(self, url):
+        """
+        URL의 HTML을 받아옵니다.
+
+        Raises:
+            urllib.error.URLError: 요청이 실패한 경우 (Cloudflare 차단 등 HTTP 오류 포함)
+        """
+        request = urllib.request.Request(url, headers=self.headers)
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            body = response.read()
+            if response.headers.get("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            charset = response.headers.get_content_charset() or "utf-8"
+
+        return body.decode(charset, errors="replace")
+
+    def parse(self, html, product_counter, is_duplicate=None):
+        """
+        HTML에서 상품 데이터를 추출합니다. (저장해 둔 HTML 파일 확인에도 사용)
+
+        Returns:
+            dict or None: 상품 데이터 (정적 HTML에 필요한 항목이 없으면 None)
+
+        Raises:
+            ValueError: 필수 데이터가 유효하지 않은 경우
+        """
+        page = extract_product_html(html)
+
+        missing = missing_fields(page)
+        if missing:
+            print(f"  정적 HTML에 없는 항목: {', '.join(missing)}")
+            return None
+
+        record = build_product_record(page, product_counter, is_duplicate=is_duplicate)
+        print(f"✓ 정적 HTML 추출 완료: 메인 이미지 {len(record['main_image_urls'])}개, "
+              f"상세 이미지 {len(record['detail_image_urls'])}개, 옵션 {len(record['product_options'])}개")
+        return record
+
+    def fetch(self, url, product_counter, is_duplicate=None):
+        """
+        상세 페이지 HTML을 받아 상품 데이터를 추출합니다.
+
+        Returns:
+            dict or None: 상품 데이터 (정적 HTML에 필요한 항목이 없으면 None)
+
+        Raises:
+            ValueError: 필수 데이터가 유효하지 않은 경우
+        """
+        return self.parse(self.get_html(url), product_counter, is_duplicate=is_duplicate)
+
+
+class FallbackFetcher:
+    """
+    primary 수집기를 먼저 시도하고 결과가 없으면 fallback 수집기로 수집합니다.
+
+    사용 예:
+        fetcher = FallbackFetcher(HttpFetcher(), SeleniumFetcher(driver))
+        record = fetcher.fetch(url, product_counter, is_duplicate=product_exists)
+    """
+
+    def __init__(self, primary, fallback):
+        """
+        Args:
+            primary: 먼저 시도할 수집기 (예: HttpFetcher)
+            fallback: primary가 실패했을 때 사용할 수집기 (예: SeleniumFetcher)
+        """
+        self.primary = primary
+        self.fallback = fallback
+        self.counts = {primary.name: 0, fallback.name: 0}  # 수집기별 수집 성공 수
+
+    def fetch(self, url, product_counter, is_duplicate=None):
+        """
+        상품 데이터를 수집합니다.
+        primary의 검증 오류(ValueError: 중복 상품 등)는 브라우저로도 같으므로 그대로 발생시킵니다.
+
+        Returns:
+            dict or None: 상품 데이터
+        """
+        try:
+            record = self.primary.fetch(url, product_counter, is_duplicate=is_duplicate)
+        except ValueError:
+            raise
+        except Exception as e:
+            print(f"  {self.primary.name} 수집 실패: {e}")
+            record = None
+
+        if record is not None:
+            self.counts[self.primary.name] += 1
+            return record
+
+        print(f"  → {self.fallback.name} 수집으로 대체합니다.")
+        record = self.fallback.fetch(url, product_counter, is_duplicate=is_duplicate)
+        if record is not None:
+            self.counts[self.fallback.name] += 1
+        return record
+
+
+# 테스트용 코드 (저장해 둔 상세 페이지 HTML을 브라우저 없이 파싱)
+if __name__ == "__main__":
+    import json
+    import sys
+
+    if len(sys.argv) < 2:
+        print("사용법: python page_fetcher.py <저장한 상세 페이지 HTML 파일>")
+        sys.exit(1)
+
+    with open(sys.argv[1], "r", encoding="utf-8") as f:
+        record = HttpFetcher().parse(f.read(), product_counter=1)
+
+    if record is None:
+        print("✗ 정적 HTML만으로는 수집할 수 없습니다. (브라우저 수집 필요)")
+    else:
+        print(json.dumps(record, ensure_ascii=False, indent=2))
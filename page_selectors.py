@@ -0,0 +1,72 @@
+"""
+상세 페이지 선택자 / URL 정리 상수 모듈
+Selenium 수집 모듈(option, page_extractor)과 브라우저 없이 HTML을 읽는 static_extractor가
+같은 선택자를 사용하도록 한 곳에 모아둡니다.
+
+이 모듈은 Selenium을 임포트하지 않으므로 브라우저가 설치되지 않은 환경(HTTP 수집, 테스트)에서도 사용할 수 있습니다.
+"""
+
+import re
+
+
+# ===============================================
+# 보조 함수: URL 정제
+# ===============================================
+
+def clean_image_url(url: str) -> str:
+    """
+    이미지 URL에서 불필요한 쿼리 파라미터를 제거합니다.
+    """
+    if not url:
+        return url
+
+    # &QT, &SF, &sharpen 등의 파라미터 제거
+    cleaned = re.sub(r'[?&](QT|SF|sharpen)=[^&]*', '', url)
+    return cleaned
+
+
+# ===============================================
+# 복수 옵션 수집을 위한 상수 정의
+# ===============================================
+
+# 옵션 버튼 (드롭다운 열기)
+OPTION_BUTTON_SELECTOR = "#main > div.page_product-details-wrapper___t38G > div > div.page_right-section__Plw5V > div > div.PurchaseBottom_purchase-bottom__C_GnK > div.PurchaseBottom_purchase-bottom-contents__ztB1w > div.OptionSelector_option-selector__6Z4Bu > div.option-wrapper > div > div > button"
+
+# 옵션 리스트 전체 컨테이너 (ul)
+OPTION_LIST_CONTAINER_SELECTOR = "ul.OptionSelector_option-list__9iV9W"
+
+# 개별 옵션 아이템 (li) - 전체 리스트에서 반복 선택
+OPTION_ITEM_SELECTOR = "li.OptionSelector_option-item__yMYbC"
+
+# 각 옵션 아이템 내부의 세부 요소들 (상대 경로)
+OPTION_IMG_RELATIVE = "img"
+OPTION_NAME_RELATIVE = "span.OptionSelector_option-item-tit__8zEjW"
+OPTION_PRICE_RELATIVE = "span.OptionSelector_option-item-price__QiVwN"
+
+# ===============================================
+# 단일 옵션(기본 상품 정보)을 위한 상수 정의
+# ===============================================
+
+# 상품명
+MAIN_PRODUCT_NAME_SELECTOR = "#main > div.page_product-details-wrapper___t38G > div > div.page_right-section__Plw5V > div > div.GoodsDetailInfo_goods-info__NvhCW > div.GoodsDetailInfo_title-area__unu7g > h3"
+
+# 상품 가격
+MAIN_PRODUCT_PRICE_SELECTOR = "#main > div.page_product-details-wrapper___t38G > div > div.page_right-section__Plw5V > div > div.GoodsDetailInfo_goods-info__NvhCW > div.GoodsDetailInfo_price-area__RE0Gc.GoodsDetailInfo_margin-top__41aCw > div > div > span > span:nth-child(1)"
+
+# 메인 이미지 썸네일
+MAIN_THUMBNAIL_IMAGE_SELECTOR = "#main > div.page_product-details-wrapper___t38G > div > div.page_left-section__qXr0Q > div.GoodsDetailCarousel_visual-container__1kSZN > div > div > div.swiper-wrapper > div.swiper-slide.swiper-slide-active > div > img"
+
+
+# ===============================================
+# 상세 페이지 공통 XPath / 선택자
+# ===============================================
+
+# productInfo.get_product_basic_info와 같은 XPath
+CATEGORY_XPATH = '//*[@id="main"]/div[1]/div/a[3]'
+BRAND_LINK_XPATH = '//*[@id="main"]/div[2]/div/div[2]/div/div[1]/div[1]/a'
+BRAND_BUTTON_XPATH = '//*[@id="main"]/div[2]/div/div[2]/div/div[1]/div[1]/button'
+PRODUCT_NAME_XPATH = '//*[@id="main"]/div[2]/div/div[2]/div/div[1]/div[2]/h3'
+
+# productDetailInfoProvided.collect_product_detailinfo와 같은 선택자
+DETAILINFO_BUTTON_XPATH = '//*[@id="tab-panels"]/section/ul/li[1]/button/span'
+DETAILINFO_TABLE_SELECTOR = "div.Accordion_content__aIya4 table.Accordion_table__mcFPq"
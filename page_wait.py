@@ -0,0 +1,180 @@
+"""
+페이지 대기 모듈
+고정된 time.sleep 대신 DOM 상태를 짧은 간격으로 확인하여 조건이 충족되는 즉시 진행합니다.
+
+모든 대기 함수는 조건이 충족되면 True(또는 조건 함수의 반환값)를,
+시간 안에 충족되지 않으면 False를 반환합니다. (예외를 발생시키지 않고 호출한 쪽에서 계속 진행)
+조건 확인은 execute_script로 하므로 Selenium 모듈을 임포트하지 않습니다.
+"""
+
+import time
+
+# 기본 최대 대기 시간 (초)
+DEFAULT_TIMEOUT = 10
+
+# 조건 확인 간격 (초)
+POLL_INTERVAL = 0.1
+
+# 네트워크 유휴 판단 기준: 이 시간(밀리초) 동안 새 리소스 요청이 없으면 유휴 상태
+NETWORK_IDLE_MS = 500
+
+
+def wait_until(condition, timeout: float = DEFAULT_TIMEOUT, poll_interval: float = POLL_INTERVAL,
+               description: str = None):
+    """
+    condition()이 참 값을 반환할 때까지 기다립니다.
+    condition() 실행 중 발생한 예외는 조건 미충족으로 간주합니다.
+
+    Args:
+        condition: 인자 없는 함수 (참 값을 반환하면 대기 종료)
+        timeout: 최대 대기 시간 (초)
+        poll_interval: 확인 간격 (초)
+        description: 시간 초과 시 출력할 설명
+
+    Returns:
+        condition()의 반환값 (시간 초과 시 False)
+    """
+    deadline = time.monotonic() + timeout
+
+    while True:
+        try:
+            result = condition()
+            if result:
+                return result
+        except Exception:
+            pass
+
+        if time.monotonic() >= deadline:
+            if description:
+                print(f"  대기 시간 초과 ({timeout}초): {description}")
+            return False
+
+        time.sleep(poll_interval)
+
+
+def wait_for_document_ready(driver, timeout: float = DEFAULT_TIMEOUT) -> bool:
+    """document.readyState가 complete가 될 때까지 기다립니다."""
+    return wait_until(
+        lambda: driver.execute_script("return document.readyState") == "complete",
+        timeout, description="문서 로딩 완료"
+    )
+
+
+def wait_for_element(driver, css_selector: str, timeout: float = DEFAULT_TIMEOUT) -> bool:
+    """CSS 선택자에 해당하는 요소가 나타날 때까지 기다립니다."""
+    return wait_until(
+        lambda: driver.execute_script("return !!document.querySelector(arguments[0]);", css_selector),
+        timeout, description=f"요소 {css_selector}"
+    )
+
+
+def wait_for_xpath(driver, xpath: str, timeout: float = DEFAULT_TIMEOUT) -> bool:
+    """XPath에 해당하는 요소가 나타날 때까지 기다립니다."""
+    script = (
+        "return !!document.evaluate(arguments[0], document, null, "
+        "XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;"
+    )
+    return wait_until(
+        lambda: driver.execute_script(script, xpath),
+        timeout, description=f"요소 {xpath}"
+    )
+
+
+def wait_for_text(driver, xpath: str, timeout: float = DEFAULT_TIMEOUT):
+    """
+    XPath 요소에 텍스트가 채워질 때까지 기다립니다.
+
+    Returns:
+        str or False: 요소의 텍스트 (시간 초과 시 False)
+    """
+    script = (
+        "var el = document.evaluate(arguments[0], document, null, "
+        "XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;"
+        "return el ? (el.textContent || '').trim() : null;"
+    )
+    return wait_until(
+        lambda: driver.execute_script(script, xpath),
+        timeout, description=f"텍스트 {xpath}"
+    )
+
+
+def wait_for_url_change(driver, previous_url: str, timeout: float = DEFAULT_TIMEOUT) -> bool:
+    """현재 URL이 previous_url과 달라질 때까지 기다립니다."""
+    return wait_until(
+        lambda: driver.current_url != previous_url,
+        timeout, description="URL 변경"
+    )
+
+
+def get_active_slide_index(driver):
+    """현재 활성 슬라이드의 data-swiper-slide-index 값 (없으면 None)"""
+    return driver.execute_script(
+        "var el = document.querySelector('.swiper-slide-active');"
+        "return el ? el.getAttribute('data-swiper-slide-index') : null;"
+    )
+
+
+def wait_for_slide_change(driver, previous_index, timeout: float = 3) -> bool:
+    """활성 슬라이드 인덱스가 previous_index와 달라질 때까지 기다립니다."""
+    return wait_until(
+        lambda: get_active_slide_index(driver) not in (None, previous_index),
+        timeout, description="슬라이드 변경"
+    )
+
+
+def wait_for_image_src(driver, css_selector: str, timeout: float = DEFAULT_TIMEOUT):
+    """
+    이미지 요소의 src(또는 data-src)가 채워질 때까지 기다립니다. (data:image 자리표시자 제외)
+
+    Returns:
+        str or False: 이미지 URL (시간 초과 시 False)
+    """
+    script = (
+        "var img = document.querySelector(arguments[0]);"
+        "if (!img) return null;"
+        "var src = img.getAttribute('src') || img.getAttribute('data-src');"
+        "return src && src.indexOf('data:image') !== 0 ? src : null;"
+    )
+    return wait_until(
+        lambda: driver.execute_script(script, css_selector),
+        timeout, description=f"이미지 {css_selector}"
+    )
+
+
+def wait_for_lazy_images(driver, css_selector: str, timeout: float = 2) -> bool:
+    """
+    현재 화면까지 스크롤된 영역의 이미지(css_selector)가 모두 URL을 받을 때까지 기다립니다.
+    (lazy loading 이미지의 src가 자리표시자에서 실제 URL로 바뀌었는지 확인)
+    """
+    script = """
+        var bottom = window.scrollY + window.innerHeight;
+        var pending = 0;
+        document.querySelectorAll(arguments[0]).forEach(function (img) {
+            var top = img.getBoundingClientRect().top + window.scrollY;
+            if (top > bottom) return;
+            var src = img.getAttribute('data-src') || img.getAttribute('data-original') || img.getAttribute('src');
+            if (!src || src.indexOf('data:image') === 0) pending++;
+        });
+        return pending === 0;
+    """
+    return wait_until(
+        lambda: driver.execute_script(script, css_selector),
+        timeout
+    )
+
+
+def wait_for_network_idle(driver, idle_ms: int = NETWORK_IDLE_MS, timeout: float = DEFAULT_TIMEOUT) -> bool:
+    """
+    idle_ms 동안 새 리소스 요청이 시작되지 않을 때까지 기다립니다.
+    (Performance API의 마지막 리소스 시작 시각 기준)
+    """
+    script = """
+        var entries = performance.getEntriesByType('resource');
+        var last = entries.length ? entries[entries.length - 1] : null;
+        var lastActivity = last ? Math.max(last.startTime, last.responseEnd) : 0;
+        return performance.now() - lastActivity >= arguments[0];
+    """
+    return wait_until(
+        lambda: driver.execute_script(script, idle_ms),
+        timeout, description="네트워크 유휴"
+    )
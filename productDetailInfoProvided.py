@@ -1,10 +1,9 @@
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import time
 import os
 import re
 import json
+from sql_writer import append_sql_values
+from id_sequence import get_sequence
+from page_wait import wait_for_element
 
 FIELD_MAP = {
     "내용물의 용량 또는 중량": "capacity",
@@ -114,26 +113,128 @@ def save_detailinfo_data(data, transaction=None):
     print(f"[INFO] '{filename}' 파일 업데이트: {data}")
 
 
-def get_next_detailinfo_id(transaction=None):
-    """다음 detailinfo ID를 가져오고 데이터 업데이트"""
-    # 데이터 로드
+def advance_detailinfo_next_id(detailinfo_id):
+    """
+    저장된 detailinfo ID 다음으로 detailinfo_data.json의 next_id를 올립니다.
+    (시퀀스 파일 id_sequences.db가 없어져도 JSON의 next_id부터 이어서 할당)
+
+    Args:
+        detailinfo_id: 커밋된 detailinfo ID
+    """
     data = load_detailinfo_data()
+    if data["next_id"] > detailinfo_id:
+        return
 
-    # 현재 next_id 가져오기
-    current_next_id = data["next_id"]
+    data["last_id"] = detailinfo_id
+    data["next_id"] = detailinfo_id + 1
+    save_detailinfo_data(data)
 
-    print(f"[INFO] 할당할 ID: {current_next_id}")
 
-    # 데이터 업데이트: last_id = 현재 next_id, next_id = next_id + 1
-    data["last_id"] = current_next_id
-    data["next_id"] = current_next_id + 1
+def get_next_detailinfo_id(transaction=None):
+    """
+    다음 detailinfo ID를 할당합니다.
+    프로세스 간에 공유되는 "product_detail_info" 시퀀스에서 받으며,
+    detailinfo_data.json의 next_id는 시퀀스의 최솟값으로 사용하고 커밋 후에 올립니다.
+
+    Args:
+        transaction: FileTransaction 객체 (롤백 시 ID 반납, 커밋 후 next_id 갱신)
+    """
+    sequence = get_sequence("product_detail_info", seed=lambda: load_detailinfo_data()["next_id"])
+    current_next_id = sequence.next()
 
-    # 저장
-    save_detailinfo_data(data, transaction)
+    if transaction:
+        transaction.on_rollback(lambda: sequence.release(current_next_id))
+        transaction.on_commit(lambda: advance_detailinfo_next_id(current_next_id))
+    else:
+        advance_detailinfo_next_id(current_next_id)
+
+    print(f"[INFO] 할당할 ID: {current_next_id}")
 
     return current_next_id
 
 
+# product_detail_info 테이블 INSERT 헤더
+DETAILINFO_SQL_HEADER = (
+    f"INSERT INTO product_detail_info (id, {', '.join(FIELD_MAP.values())}, created_at, updated_at) VALUES"
+)
+
+
+def collect_product_detailinfo(driver) -> dict:
+    """
+    상품정보 제공고시 테이블을 열어 항목을 수집합니다. (파일 저장 없음)
+
+    Args:
+        driver: Selenium WebDriver
+
+    Returns:
+        dict: {항목명: 값}
+    """
+    # Selenium은 실제 크롤링 시에만 임포트 (SQL 포맷 함수만 쓰는 모듈은 Selenium 불필요)
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    # 웹 요소 찾기 및 클릭
+    wait = WebDriverWait(driver, 10)
+    button = wait.until(
+        EC.presence_of_element_located(
+            (By.XPATH, '//*[@id="tab-panels"]/section/ul/li[1]/button/span')
+        )
+    )
+
+    driver.execute_script("arguments[0].scrollIntoView(true);", button)
+    driver.execute_script("arguments[0].click();", button)
+
+    # 테이블이 펼쳐질 때까지 대기
+    table_selector = "div.Accordion_content__aIya4 table.Accordion_table__mcFPq"
+    wait_for_element(driver, table_selector, timeout=3)
+
+    # 테이블 데이터 수집
+    table = driver.find_element(By.CSS_SELECTOR, table_selector)
+    rows = table.find_elements(By.TAG_NAME, "tr")
+    product_info = {}
+
+    for row in rows:
+        try:
+            key = row.find_element(By.TAG_NAME, "th").text.strip()
+            value = row.find_element(By.TAG_NAME, "td").text.strip()
+            product_info[key] = value
+        except:
+            continue
+
+    print(f"상품정보 제공고시 {len(product_info)}개 항목 수집 완료")
+    return product_info
+
+
+def format_detailinfo_values(product_detail_info_id: int, product_info: dict) -> str:
+    """상품정보 제공고시 한 건의 VALUES 행을 생성합니다. (FIELD_MAP 컬럼 순서)"""
+    ordered_values = []
+    for key, column in FIELD_MAP.items():
+        value = product_info.get(key, "")
+        ordered_values.append(f"'{escape_sql(str(value))}'")
+
+    values = ', '.join(ordered_values)
+    return f"({product_detail_info_id}, {values}, NOW(), NOW())"
+
+
+def append_detailinfo_sql(product_detail_info_id: int, product_info: dict, transaction=None, filename: str = None):
+    """
+    상품정보 제공고시 VALUES 행을 SQL 파일 끝에 추가합니다.
+    파일 저장 중 오류는 출력만 하고 다시 발생시키지 않습니다.
+    """
+    values_sql = format_detailinfo_values(product_detail_info_id, product_info)
+    print(f"[DEBUG] 생성된 SQL: {values_sql}")
+
+    try:
+        append_sql_values(filename, DETAILINFO_SQL_HEADER, [values_sql], transaction)
+        print(f"✓ 레코드 저장 완료 (ID: {product_detail_info_id})")
+
+    except Exception as file_error:
+        print(f"✗ 파일 저장 중 오류 발생: {file_error}")
+        import traceback
+        traceback.print_exc()
+
+
 def get_product_dtailinfo_provided(driver, transaction=None, filename: str = None):
     """
     상품정보 제공고시 테이블을 가져오는 함수
@@ -153,123 +254,11 @@ def get_product_dtailinfo_provided(driver, transaction=None, filename: str = Non
     print(f"[INFO] 생성된 상세정보 ID: {product_detail_info_id}")
 
     try:
-        # 웹 요소 찾기 및 클릭
-        wait = WebDriverWait(driver, 10)
-        button = wait.until(
-            EC.presence_of_element_located(
-                (By.XPATH, '//*[@id="tab-panels"]/section/ul/li[1]/button/span')
-            )
-        )
-
-        driver.execute_script("arguments[0].scrollIntoView(true);", button)
-        time.sleep(0.5)
-        driver.execute_script("arguments[0].click();", button)
-        time.sleep(1)
-
-        # 테이블 데이터 수집
-        table = driver.find_element(By.CSS_SELECTOR, "div.Accordion_content__aIya4 table.Accordion_table__mcFPq")
-        rows = table.find_elements(By.TAG_NAME, "tr")
-        product_info = {}
-
-        for row in rows:
-            try:
-                key = row.find_element(By.TAG_NAME, "th").text.strip()
-                value = row.find_element(By.TAG_NAME, "td").text.strip()
-                product_info[key] = value
-            except:
-                continue
-
-        print(f"상품정보 제공고시 {len(product_info)}개 항목 수집 완료")
-
-        # SQL 값 준비
-        ordered_values = []
-        for key, column in FIELD_MAP.items():
-            value = product_info.get(key, "")
-            ordered_values.append(f"'{escape_sql(str(value))}'")
-
-        columns = ', '.join(FIELD_MAP.values())
-        values = ', '.join(ordered_values)
-
-        # SQL 문 생성
-        values_sql = f"({product_detail_info_id}, {values}, NOW(), NOW())"
-
-        # SQL 문장 전체
-        full_sql = f"INSERT INTO product_detail_info (id, {columns}, created_at, updated_at)\nVALUES\n{values_sql});"
-
-        print(f"[DEBUG] 생성된 SQL: {full_sql}")
+        product_info = collect_product_detailinfo(driver)
 
-        # 6. 파일 저장
+        # 파일 저장 (기존 INSERT문 끝에 VALUES만 추가)
         if filename:
-            try:
-                # 파일 존재 여부 및 내용 확인
-                file_exists = False
-                existing_content = ""
-
-                if transaction:
-                    # 트랜잭션 모드일 때는 실제 파일을 읽어봅니다
-                    try:
-                        with open(filename, 'r', encoding='utf-8') as f:
-                            existing_content = f.read()
-                        file_exists = True
-                        print(f"[DEBUG] 트랜잭션 모드: 파일 존재함, 길이: {len(existing_content)}")
-                    except FileNotFoundError:
-                        file_exists = False
-                        print("[DEBUG] 트랜잭션 모드: 파일 없음")
-                else:
-                    # 일반 모드일 때는 직접 확인
-                    file_exists = os.path.exists(filename)
-                    if file_exists and os.path.getsize(filename) > 0:
-                        with open(filename, 'r', encoding='utf-8') as f:
-                            existing_content = f.read()
-                        print(f"[DEBUG] 일반 모드: 파일 존재함, 길이: {len(existing_content)}")
-                    else:
-                        file_exists = False
-                        print("[DEBUG] 일반 모드: 파일 없거나 비어있음")
-
-                if not file_exists or existing_content.strip() == "":
-                    # 첫 번째 레코드: INSERT 문 전체 작성
-                    if transaction:
-                        transaction.write_file(filename, full_sql)
-                    else:
-                        with open(filename, "w", encoding='utf-8') as f:
-                            f.write(full_sql)
-                    print(f"✓ 첫 번째 레코드 저장 완료 (ID: {product_detail_info_id})")
-                else:
-                    # 기존 파일이 있으면 VALUES만 추가
-                    content = existing_content.strip()
-
-                    # 마지막 문자 상태에 따라 처리
-                    if content.endswith(');'):
-                        # 정상 종료된 경우: );를 ),로 교체
-                        content = content[:-2] + '),'
-                    elif content.endswith(';'):
-                        # 세미콜론만 있는 경우: ;를 ,로 교체
-                        content = content[:-1] + ','
-                    elif content.endswith(')'):
-                        # 괄호만 있는 경우: 콤마 추가
-                        content = content + ','
-                    elif content.endswith(','):
-                        # 이미 콤마로 끝난 경우: 그대로 사용
-                        pass
-                    else:
-                        # 예상치 못한 형식: 콤마 추가
-                        content = content + ','
-
-                        # 새로운 VALUES 추가 (항상 );로 종료)
-                    new_content = content + f"\n{values_sql};"
-
-                    if transaction:
-                        transaction.write_file(filename, new_content)
-                    else:
-                        with open(filename, "w", encoding='utf-8') as f:
-                            f.write(new_content)
-
-                    print(f"✓ 추가 레코드 저장 완료 (ID: {product_detail_info_id})")
-
-            except Exception as file_error:
-                print(f"✗ 파일 저장 중 오류 발생: {file_error}")
-                import traceback
-                traceback.print_exc()
+            append_detailinfo_sql(product_detail_info_id, product_info, transaction, filename)
 
         return product_info, product_detail_info_id
 
@@ -277,4 +266,4 @@ def get_product_dtailinfo_provided(driver, transaction=None, filename: str = Non
         print(f"✗ 상품정보 제공고시 수집 실패: {e}")
         import traceback
         traceback.print_exc()
-        return {}, product_detail_info_id
\ No newline at end of file
+        return {}, product_detail_info_id
@@ -1,9 +1,11 @@
 # productInfo.py (간단한 버전)
 
-from selenium.webdriver.chrome.webdriver import WebDriver
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
-from typing import Tuple, Optional
+from __future__ import annotations
+
+from typing import Tuple, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
 
 
 # def get_product_basic_info(driver: WebDriver) -> Tuple[Optional[str], Optional[str], Optional[str]]:
@@ -50,11 +52,6 @@ from typing import Tuple, Optional
 #         print(f"상품 정보 추출 중 오류 발생: {e}")
 #         return None, None, None
 
-from typing import Optional, Tuple
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
-
 def get_product_basic_info(driver: WebDriver) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """
     상품 상세페이지에서 카테고리, 브랜드, 상품명 정보만 추출합니다.
@@ -63,6 +60,10 @@ def get_product_basic_info(driver: WebDriver) -> Tuple[Optional[str], Optional[s
         tuple: (카테고리, 브랜드, 상품명)
                정보를 찾지 못한 경우 해당 항목은 None 반환
     """
+    # selenium.webdriver는 임포트 비용이 커서 실제 크롤링 시에만 불러옴
+    from selenium.webdriver.common.by import By
+    from selenium.common.exceptions import NoSuchElementException
+
     category = None
     brand = None
     product_name = None
@@ -2,14 +2,235 @@ import json
 import random
 import os
 from datetime import datetime, timedelta
+from sql_writer import append_sql_values
+from id_sequence import get_sequence
+from file_transaction import file_lock
 
 # JSON 파일 경로
 JSON_FILE_PATH = "product_data.json"
 SQL_FILE_PATH = "product_data_sql.txt"
 
+# 상품명 인덱스 로그 경로 (product_data.json 스냅샷 이후 추가된 상품, JSON Lines)
+LOG_FILE_PATH = "product_data.log"
+
+# 로그가 이 줄 수 이상 쌓이면 스냅샷으로 합침
+COMPACT_THRESHOLD = 1000
+
+# products 테이블 INSERT 헤더
+PRODUCT_SQL_HEADER = "INSERT INTO products (id, product_detail_info_id, brand_id, category_id, delivery_policy_id, use_restock_noti, product_name, product_code, search_keywords, exposure_status, sale_status, description, is_cancelable, is_deleted, created_at, updated_at) VALUES"
+
+
+class ProductIndex:
+    """
+    상품명 -> 제품 ID 인덱스 (프로세스당 한 번만 로드)
+
+    product_data.json 스냅샷과 product_data.log 추가 전용 로그(JSON Lines)로 저장합니다.
+    새 상품은 로그에 한 줄만 추가하므로 전체 상품 목록을 다시 쓰지 않으며,
+    로그가 COMPACT_THRESHOLD 줄 이상 쌓이면 커밋 후 스냅샷으로 합칩니다.
+    로그 추가와 압축은 같은 파일 잠금(file_lock(log_path))을 사용하므로
+    여러 프로세스가 함께 추가해도 서로 덮어쓰거나 압축 중에 유실되지 않습니다.
+    트랜잭션이 롤백되면 on_rollback 콜백으로 메모리 인덱스도 함께 되돌립니다.
+    """
+
+    def __init__(self, snapshot_path=JSON_FILE_PATH, log_path=LOG_FILE_PATH):
+        """
+        Args:
+            snapshot_path: 스냅샷 JSON 파일 경로 ({"products": {...}, "next_id": n})
+            log_path: 추가 전용 로그 파일 경로
+        """
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path
+        self.products = {}  # {상품명: 제품 ID}
+        self.next_id = 1
+        self.log_offset = 0  # 로그에서 읽은 바이트 수
+        self.log_entries = 0  # 스냅샷 이후 로그에 쌓인 상품 수
+        self.log_inode = None  # 로그 파일이 교체(압축)되었는지 확인용
+        self.snapshot_inode = None  # 스냅샷이 교체(다른 프로세스가 압축)되었는지 확인용
+
+    def load(self):
+        """스냅샷을 읽고 로그를 처음부터 재생합니다."""
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                self.snapshot_inode = os.fstat(f.fileno()).st_ino
+        except FileNotFoundError:
+            # 파일이 없을 경우 기본 구조 생성
+            data = {"products": {}, "next_id": 1}
+            self.snapshot_inode = None
+
+        self.products = data["products"]
+        self.next_id = data["next_id"]
+        self.log_offset = 0
+        self.log_entries = 0
+        self.log_inode = None
+        self.refresh()
+
+    def refresh(self):
+        """
+        로그에 새로 추가된 부분만 이어서 읽습니다.
+        (커밋된 내용 또는 다른 프로세스가 추가한 상품)
+        """
+        # 다른 프로세스가 스냅샷으로 합쳤으면 처음부터 다시 로드
+        # (로그를 읽기 전에 합쳐졌으면 로그 파일 교체만으로는 알 수 없음)
+        try:
+            snapshot_inode = os.stat(self.snapshot_path).st_ino
+        except FileNotFoundError:
+            snapshot_inode = None
+        if snapshot_inode != self.snapshot_inode:
+            self.load()
+            return
+
+        try:
+            stat = os.stat(self.log_path)
+        except FileNotFoundError:
+            if self.log_offset:
+                self.load()
+            return
+
+        if self.log_inode is None:
+            self.log_inode = stat.st_ino
+        elif stat.st_ino != self.log_inode or stat.st_size < self.log_offset:
+            # 로그가 스냅샷으로 합쳐졌거나 줄어듦 - 처음부터 다시 로드
+            self.load()
+            return
+
+        if stat.st_size == self.log_offset:
+            return
+
+        with open(self.log_path, 'rb') as f:
+            f.seek(self.log_offset)
+            chunk = f.read(stat.st_size - self.log_offset)
+
+        # 마지막 줄이 완전히 기록되지 않았으면 다음에 다시 읽음
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line.decode('utf-8'))
+            self.products[entry["name"]] = entry["id"]
+            self.next_id = max(self.next_id, entry["id"] + 1)
+            self.log_entries += 1
+
+        self.log_offset += end
+
+    def contains(self, product_name):
+        """이미 존재하는 제품명인지 확인합니다. (커밋 전 상품 포함)"""
+        return product_name in self.products
+
+    def allocate(self, product_name, transaction=None):
+        """
+        새 제품 ID를 할당하고 로그에 한 줄을 추가합니다.
+        ID는 프로세스 간에 공유되는 "products" 시퀀스에서 받습니다.
+
+        Args:
+            product_name (str): 제품명
+            transaction: FileTransaction 객체 (없으면 로그 파일에 직접 추가)
+
+        Returns:
+            int: 새로 생성된 제품 ID
+        """
+        sequence = get_sequence("products", seed=lambda: self.next_id)
+        new_id = sequence.next()
+        self.products[product_name] = new_id
+        self.next_id = max(self.next_id, new_id + 1)
+
+        line = json.dumps({"name": product_name, "id": new_id}, ensure_ascii=False) + "\n"
+
+        if transaction:
+            # 커밋 시점에 로그 잠금을 건 상태에서 실제 파일 끝에 추가됨
+            transaction.append_file(self.log_path, line)
+            transaction.on_rollback(lambda: self._discard(product_name, new_id))
+            transaction.on_commit(self.maybe_compact)
+        else:
+            with file_lock(self.log_path):
+                with open(self.log_path, 'a', encoding='utf-8') as f:
+                    f.write(line)
+            self.maybe_compact()
+
+        return new_id
+
+    def _discard(self, product_name, product_id):
+        """롤백된 상품을 인덱스에서 제거하고 ID를 시퀀스에 반납합니다."""
+        if self.products.get(product_name) == product_id:
+            del self.products[product_name]
+        if self.next_id == product_id + 1:
+            self.next_id = product_id
+        get_sequence("products").release(product_id)
+
+    def maybe_compact(self):
+        """로그가 COMPACT_THRESHOLD 줄 이상 쌓였으면 스냅샷으로 합칩니다."""
+        self.refresh()
+        if self.log_entries >= COMPACT_THRESHOLD:
+            self.compact()
+
+    def compact(self, data=None):
+        """
+        현재 인덱스(또는 주어진 데이터)를 스냅샷으로 저장하고 로그를 비웁니다.
+        스냅샷을 먼저 교체하므로 중간에 중단되어도 로그 재생 결과는 같습니다.
+        로그 잠금을 건 상태에서 다른 프로세스가 추가한 상품까지 읽은 뒤 합치므로
+        압축 중에 추가된 상품이 유실되지 않습니다.
+        진행 중인 트랜잭션이 없을 때만 호출해야 합니다.
+
+        Args:
+            data: 저장할 데이터 ({"products": {...}, "next_id": n}, 없으면 현재 인덱스)
+        """
+        with file_lock(self.log_path):
+            if data is None:
+                self.refresh()
+                data = {"products": self.products, "next_id": self.next_id}
+
+            temp_path = self.snapshot_path + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.snapshot_path)
+
+            # 빈 로그로 교체 (다른 프로세스는 inode 변경으로 감지)
+            temp_path = self.log_path + ".tmp"
+            open(temp_path, 'w').close()
+            os.replace(temp_path, self.log_path)
+
+            print(f"[ProductIndex] 스냅샷 저장: {self.snapshot_path} (총 {len(data['products'])}개, 로그 {self.log_entries}줄 병합)")
+            self.load()
+
+
+# 프로세스 전체에서 공유하는 상품명 인덱스
+_product_index = None
+
+
+def get_product_index():
+    """
+    상품명 인덱스를 반환합니다. 처음 호출할 때만 파일에서 로드하고,
+    이후에는 로그에 새로 추가된 부분만 읽습니다.
+    """
+    global _product_index
+
+    if _product_index is None:
+        _product_index = ProductIndex()
+        _product_index.load()
+    else:
+        _product_index.refresh()
+
+    return _product_index
+
+
+def product_exists(product_name):
+    """
+    이미 존재하는 제품명인지 확인합니다. (진행 중인 트랜잭션의 상품 포함)
+
+    Args:
+        product_name (str): 제품명
+
+    Returns:
+        bool: 존재 여부
+    """
+    return get_product_index().contains(product_name)
+
+
 def create_product_id_with_transaction(product_name, transaction):
     """
-    새로운 제품 ID를 생성하고 JSON 파일에 트랜잭션으로 기록합니다.
+    새로운 제품 ID를 생성하고 상품명 로그에 트랜잭션으로 기록합니다.
 
     Args:
         product_name (str): 제품명
@@ -18,39 +239,33 @@ def create_product_id_with_transaction(product_name, transaction):
     Returns:
         int: 새로 생성된 제품 ID 또는 0(중복된 경우)
     """
-    # JSON 데이터 로드
-    data = load_product_data()
+    index = get_product_index()
 
     # 이미 존재하는 제품명인지 확인
-    if product_name in data["products"]:
+    if index.contains(product_name):
         return 0
 
-    # 새 ID 할당
-    new_id = data["next_id"]
-    data["products"][product_name] = new_id
+    # 새 ID 할당 (로그 한 줄 추가, 롤백 시 인덱스에서도 제거)
+    return index.allocate(product_name, transaction)
 
-    # next_id 증가
-    data["next_id"] += 1
 
-    # JSON 파일 저장 (트랜잭션 적용)
-    transaction.write_json(JSON_FILE_PATH, data)
+def load_product_data(transaction=None):
+    """
+    제품 데이터를 반환합니다. (스냅샷 + 로그, 진행 중인 트랜잭션의 상품 포함)
 
-    return new_id
+    Args:
+        transaction: 이전 버전과의 호환용 (인덱스에 커밋 전 상품이 이미 반영되어 있음)
 
-def load_product_data():
-    """JSON 파일에서 제품 데이터를 로드합니다."""
-    try:
-        with open(JSON_FILE_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        # 파일이 없을 경우 기본 구조 생성
-        return {"products": {}, "next_id": 1}
+    Returns:
+        dict: {"products": {상품명: ID}, "next_id": 다음 ID}
+    """
+    index = get_product_index()
+    return {"products": dict(index.products), "next_id": index.next_id}
 
 
 def save_product_data(data):
-    """JSON 파일에 제품 데이터를 저장합니다."""
-    with open(JSON_FILE_PATH, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    """제품 데이터를 스냅샷 파일에 저장하고 로그를 비웁니다."""
+    get_product_index().compact(data)
 
 
 def create_product_id(product_name):
@@ -63,24 +278,14 @@ def create_product_id(product_name):
     Returns:
         int: 새로 생성된 제품 ID 또는 0(중복된 경우)
     """
-    # JSON 데이터 로드
-    data = load_product_data()
+    index = get_product_index()
 
     # 이미 존재하는 제품명인지 확인
-    if product_name in data["products"]:
+    if index.contains(product_name):
         return 0
 
-    # 새 ID 할당
-    new_id = data["next_id"]
-    data["products"][product_name] = new_id
-
-    # next_id 증가
-    data["next_id"] += 1
-
-    # JSON 파일 저장
-    save_product_data(data)
-
-    return new_id
+    # 새 ID 할당 (로그 파일에 직접 추가)
+    return index.allocate(product_name)
 
 
 def generate_random_datetime():
@@ -109,34 +314,41 @@ def create_initial_product_data_sql():
     """
     초기 product_data_sql.txt 파일을 생성합니다.
     파일이 이미 존재하면 아무 작업도 하지 않습니다.
+    (임포트 시에는 실행되지 않으며, 크롤링 시작 전 crawl.initialize_output_files()에서 호출)
     """
     try:
         with open(SQL_FILE_PATH, 'r', encoding='utf-8') as f:
             content = f.read()
             if not content.strip():  # 빈 파일인 경우
-                initial_sql = """INSERT INTO products (id, product_detail_info_id, brand_id, category_id, \
-                                                       delivery_policy_id, use_restock_noti, product_name, product_code, \
-                                                       search_keywords, exposure_status, sale_status, description, \
-                                                       is_cancelable, is_deleted, created_at, updated_at) \
-                                 VALUES \
-                              """
                 with open(SQL_FILE_PATH, 'w', encoding='utf-8') as f_write:
-                    f_write.write(initial_sql)
+                    f_write.write(PRODUCT_SQL_HEADER)
     except FileNotFoundError:
         # 파일이 없을 경우 생성
-        initial_sql = """INSERT INTO products (id, product_detail_info_id, brand_id, category_id, delivery_policy_id, \
-                                               use_restooti, product_name, product_code, search_keywords, \
-                                               exposure_status, sale_status, description, is_cancelable, is_deleted, \
-                                               created_at, updated_at) \
-                         VALUES \
-                      """
         with open(SQL_FILE_PATH, 'w', encoding='utf-8') as f:
-            f.write(initial_sql)
+            f.write(PRODUCT_SQL_HEADER)
+
+
+def format_product_values(product_id, product_detail_info_id, brand_id, category_id, product_name, created_at):
+    """
+    products 테이블의 VALUES 행을 생성합니다.
 
+    Args:
+        created_at (str): 'YYYY-MM-DD HH:MM:SS' 형식의 생성 시각 (updated_at도 같은 값)
 
-def update_product_data_sql(product_id, product_detail_info_id, brand_id, category_id, product_name):
+    Returns:
+        str: 괄호로 감싸진 VALUES 행
     """
-    product_data_sql.txt 파일에 INSERT 문을 추가합니다. (수정된 버전)
+    # SQL 이스케이프
+    escaped_name = product_name.replace("'", "''")
+
+    return f"({product_id}, {product_detail_info_id}, {brand_id}, {category_id}, 2, FALSE, '{escaped_name}', 'NONE', '{escaped_name}', 'EXPOSURE', 'ON_SALE', '설명없음', true, false, '{created_at}', '{created_at}')"
+
+
+def update_product_data_sql(product_id, product_detail_info_id, brand_id, category_id, product_name,
+                            transaction=None):
+    """
+    product_data_sql.txt 파일 끝에 INSERT 값을 추가합니다.
+    기존 파일 내용은 다시 읽거나 쓰지 않습니다.
 
     Args:
         product_id (int): 제품 ID
@@ -144,6 +356,7 @@ def update_product_data_sql(product_id, product_detail_info_id, brand_id, catego
         brand_id (int): 브랜드 ID
         category_id (int): 카테고리 ID
         product_name (str): 제품명
+        transaction: FileTransaction 객체 (없으면 파일에 직접 작성)
 
     Returns:
         str: 생성된 INSERT 문
@@ -152,49 +365,17 @@ def update_product_data_sql(product_id, product_detail_info_id, brand_id, catego
     created_at = generate_random_datetime()
 
     # INSERT 문 생성 (괄호로 감싸진 값들)
-    insert_statement = f"({product_id}, {product_detail_info_id}, {brand_id}, {category_id}, 2, FALSE, '{product_name}', 'NONE', '{product_name}', 'EXPOSURE', 'ON_SALE', '설명없음', true, false, '{created_at}', '{created_at}')"
-
-    # SQL 파일 읽기
-    try:
-        with open(SQL_FILE_PATH, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except FileNotFoundError:
-        # 파일이 없을 경우 초기 내용 생성
-        content = """INSERT INTO products (id, product_detail_info_id, brand_id, category_id, delivery_policy_id, \
-                                           use_restock_noti, product_name, product_code, search_keywords, \
-                                           exposure_status, sale_status, description, is_cancelable, is_deleted, \
-                                           created_at, updated_at) \
-                     VALUES"""
-
-    # 내용 정리
-    content = content.strip()
-
-    # 마지막 문자 확인 및 처리
-    if content.endswith(';'):
-        # 세미콜론으로 끝나면 제거 (VALUES; 또는 데이터행); 모두 처리)
-        content = content[:-1].rstrip()
-
-    # VALUES로 끝나는지 확인 (첫 데이터 추가)
-    if content.endswith('VALUES'):
-        # 첫 데이터이므로 줄바꿈 후 추가하고 세미콜론으로 마무리
-        new_content = content + f"\n{insert_statement};"
-    else:
-        # 기존 데이터가 있으므로 콤마 추가 후 새 데이터 추가
-        new_content = content + f",\n{insert_statement};"
+    insert_statement = format_product_values(product_id, product_detail_info_id, brand_id, category_id,
+                                             product_name, created_at)
 
-    # SQL 파일 저장
-    with open(SQL_FILE_PATH, 'w', encoding='utf-8') as f:
-        f.write(new_content)
+    # SQL 파일 끝에 추가
+    append_sql_values(SQL_FILE_PATH, PRODUCT_SQL_HEADER, [insert_statement], transaction)
 
     return insert_statement
 
 
 
 
-# 모듈 임포트 시 초기 SQL 파일 생성
-create_initial_product_data_sql()
-
-
 # 테스트 함수
 def test_sql_update():
     """SQL 업데이트 기능 테스트"""
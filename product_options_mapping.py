@@ -1,13 +1,23 @@
 import random
-import os
 from typing import List, Dict
+from sql_writer import append_sql_values
+
+# product_options 테이블 INSERT 헤더
+OPTIONS_SQL_HEADER = (
+    "INSERT INTO product_options\n"
+    "(product_id, option_name, purchase_price, selling_price,\n"
+    " current_stock, initial_stock, safety_stock,\n"
+    " image_url, display_order,\n"
+    " is_deleted, created_at, updated_at)\n"
+    "VALUES"
+)
 
 
 def create_product_options_sql(product_id: int, product_options: List[Dict], transaction,
                                filename: str = "product_options_sql.txt") -> bool:
     """
     수집된 상품 옵션 정보를 product_options 테이블 INSERT문에 VALUES만 추가합니다.
-    기존 INSERT문이 있으면 마지막 세미콜론을 쉼표로 변경하고 새 데이터를 추가합니다.
+    기존 INSERT문이 있으면 파일 끝의 세미콜론만 쉼표로 변경하고 새 데이터를 덧붙입니다.
 
     Args:
         product_id: 상품 ID
@@ -24,12 +34,6 @@ def create_product_options_sql(product_id: int, product_options: List[Dict], tra
         return False
 
     try:
-        # 기존 파일 내용 읽기
-        file_content = ""
-        if os.path.exists(filename):
-            with open(filename, 'r', encoding='utf-8') as f:
-                file_content = f.read()
-
         # 새로운 VALUES 생성
         sql_values = []
         for idx, option in enumerate(product_options):
@@ -56,30 +60,8 @@ def create_product_options_sql(product_id: int, product_options: List[Dict], tra
             )
             sql_values.append(sql_value)
 
-        # 기존 파일이 있고 INSERT문이 있는 경우
-        if file_content and "INSERT INTO product_options" in file_content:
-            # 마지막 세미콜론을 쉼표로 변경
-            if file_content.rstrip().endswith(';'):
-                file_content = file_content.rstrip()[:-1] + ','
-
-            # 새 VALUES 추가
-            new_content = file_content + "\n" + ",\n".join(sql_values) + ";\n\n"
-
-            # 전체 파일 덮어쓰기
-            transaction.write_file(filename, new_content)
-        else:
-            # 파일이 없거나 INSERT문이 없는 경우 - 새로 생성
-            sql_text = ""
-            sql_text += "INSERT INTO product_options\n"
-            sql_text += "(product_id, option_name, purchase_price, selling_price,\n"
-            sql_text += " current_stock, initial_stock, safety_stock,\n"
-            sql_text += " image_url, display_order,\n"
-            sql_text += " is_deleted, created_at, updated_at)\n"
-            sql_text += "VALUES\n"
-            sql_text += ",\n".join(sql_values)
-            sql_text += ";\n\n"
-
-            transaction.write_file(filename, sql_text)
+        # 기존 INSERT문 끝에 VALUES 추가 (파일이 없으면 새로 생성)
+        append_sql_values(filename, OPTIONS_SQL_HEADER, sql_values, transaction, terminator=";\n\n")
 
         print(f"✓ Product ID {product_id}의 옵션 {len(product_options)}개가 '{filename}'에 추가되었습니다.")
         return True
@@ -89,6 +71,81 @@ def create_product_options_sql(product_id: int, product_options: List[Dict], tra
         return False
 
 
+def filter_valid_options(product_options: List[Dict]) -> List[Dict]:
+    """
+    이름과 가격이 정상적으로 추출된 옵션만 남깁니다.
+
+    Args:
+        product_options: get_product_options()에서 반환된 옵션 리스트
+
+    Returns:
+        list: 유효한 옵션 리스트
+    """
+    valid_options = []
+    for option in product_options:
+        if (option.get('name') and
+                option.get('name') != '옵션명 추출 실패' and
+                option.get('price') and
+                option.get('price') != '가격 추출 실패'):
+            valid_options.append(option)
+        else:
+            print(f"⚠ 유효하지 않은 옵션 스킵: {option.get('name', 'N/A')}")
+    return valid_options
+
+
+def build_option_row(option: Dict, display_order: int) -> Dict:
+    """
+    옵션 한 개를 product_options 행 데이터로 변환합니다.
+    가격/재고 값은 이 시점에 한 번만 정해지며, 품절 옵션은 현재 재고가 0입니다.
+
+    Args:
+        option: 옵션 정보 (name, price, image_url, is_soldout)
+        display_order: 표시 순서
+
+    Returns:
+        dict: product_options 컬럼 값 (문자열은 이스케이프 전 원본)
+    """
+    try:
+        selling_price = int(option.get('price', '0'))
+    except (ValueError, TypeError):
+        selling_price = 0
+
+    is_soldout = option.get('is_soldout', False)
+
+    if is_soldout:
+        current_stock = 0
+        initial_stock = random.randint(50, 100)
+    else:
+        current_stock = random.randint(50, 150)
+        initial_stock = current_stock + random.randint(0, 50)
+
+    return {
+        "option_name": option.get('name', '옵션명 없음'),
+        "purchase_price": selling_price // 2,
+        "selling_price": selling_price,
+        "current_stock": current_stock,
+        "initial_stock": initial_stock,
+        "safety_stock": 10,
+        "image_url": option.get('image_url', ''),
+        "display_order": display_order,
+        "is_deleted": bool(is_soldout),
+    }
+
+
+def format_option_values(product_id: int, row: Dict) -> str:
+    """build_option_row()로 만든 행 데이터를 VALUES 행으로 변환합니다."""
+    option_name = row["option_name"].replace("'", "''")
+    image_url = row["image_url"].replace("'", "''")
+    is_deleted = 'true' if row["is_deleted"] else 'false'
+
+    return (
+        f"({product_id}, '{option_name}', {row['purchase_price']}, {row['selling_price']}, "
+        f"{row['current_stock']}, {row['initial_stock']}, {row['safety_stock']}, "
+        f"'{image_url}', {row['display_order']}, "
+        f"{is_deleted}, NOW(), NOW())"
+    )
+
+
 def create_product_options_sql_with_validation(product_id: int, product_options: List[Dict], transaction,
                                                filename: str = "product_options_sql.txt") -> bool:
     """
@@ -109,87 +166,27 @@ def create_product_options_sql_with_validation(product_id: int, product_options:
         return False
 
     # 유효한 옵션만 필터링
-    valid_options = []
-    for option in product_options:
-        if (option.get('name') and
-                option.get('name') != '옵션명 추출 실패' and
-                option.get('price') and
-                option.get('price') != '가격 추출 실패'):
-            valid_options.append(option)
-        else:
-            print(f"⚠ 유효하지 않은 옵션 스킵: {option.get('name', 'N/A')}")
+    valid_options = filter_valid_options(product_options)
 
     if not valid_options:
         print("✗ 유효한 옵션이 없습니다.")
         return False
 
     try:
-        # 기존 파일 내용 읽기
-        file_content = ""
-        if os.path.exists(filename):
-            with open(filename, 'r', encoding='utf-8') as f:
-                file_content = f.read()
-
         # 새로운 VALUES 생성
         sql_values = []
         debug_lines = []
 
         for idx, option in enumerate(valid_options):
-            option_name = option.get('name', '옵션명 없음').replace("'", "''")
-
-            try:
-                selling_price = int(option.get('price', '0'))
-            except (ValueError, TypeError):
-                selling_price = 0
-
-            purchase_price = selling_price // 2
-
-            if option.get('is_soldout', False):
-                current_stock = 0
-                initial_stock = random.randint(50, 100)
-            else:
-                current_stock = random.randint(50, 150)
-                initial_stock = current_stock + random.randint(0, 50)
-
-            safety_stock = 10
-            image_url = option.get('image_url', '').replace("'", "''")
-            display_order = idx
-            is_deleted = 'true' if option.get('is_soldout', False) else 'false'
-
-            sql_value = (
-                f"({product_id}, '{option_name}', {purchase_price}, {selling_price}, "
-                f"{current_stock}, {initial_stock}, {safety_stock}, "
-                f"'{image_url}', {display_order}, "
-                f"{is_deleted}, NOW(), NOW())"
+            row = build_option_row(option, idx)
+            sql_values.append(format_option_values(product_id, row))
+            debug_lines.append(
+                f"  [{idx}] {row['option_name']}: {row['selling_price']}원, 재고: {row['current_stock']}, "
+                f"품절: {'true' if row['is_deleted'] else 'false'}"
             )
 
-            sql_values.append(sql_value)
-            debug_lines.append(f"  [{idx}] {option_name}: {selling_price}원, 재고: {current_stock}, 품절: {is_deleted}")
-
-        # 기존 파일이 있고 INSERT문이 있는 경우
-        if file_content and "INSERT INTO product_options" in file_content:
-            # 마지막 세미콜론을 쉼표로 변경
-            if file_content.rstrip().endswith(';'):
-                file_content = file_content.rstrip()[:-1] + ','
-
-            # 새 VALUES 추가
-            new_content = file_content + "\n" + ",\n".join(sql_values) + ";\n\n"
-
-            # 전체 파일 덮어쓰기
-            transaction.write_file(filename, new_content)
-        else:
-            # 파일이 없거나 INSERT문이 없는 경우 - 새로 생성
-            sql_text = ""
-            sql_text += "INSERT INTO product_options\n"
-            sql_text += "(product_id, option_name, purchase_price, selling_price,\n"
-            sql_text += " current_stock, initial_stock, safety_stock,\n"
-            sql_text += " image_url, display_order,\n"
-            sql_text += " is_deleted, created_at, updated_at)\n"
-            sql_text += "VALUES\n"
-            sql_text += ",\n".join(sql_values)
-            sql_text += ";\n\n"
-
-            transaction.write_file(filename, sql_text)
+        # 기존 INSERT문 끝에 VALUES 추가 (파일이 없으면 새로 생성)
+        append_sql_values(filename, OPTIONS_SQL_HEADER, sql_values, transaction, terminator=";\n\n")
 
         # 디버깅 출력
         for line in debug_lines:
@@ -202,4 +199,4 @@ def create_product_options_sql_with_validation(product_id: int, product_options:
         print(f"✗ 옵션 SQL 생성 중 오류 발생: {e}")
         import traceback
         traceback.print_exc()
-        return False
\ No newline at end of file
+        return False
@@ -0,0 +1,74 @@
+"""
+상품 데이터 검사 모듈
+추출한 상세 페이지 데이터를 저장 전에 검사하고 collect_product_record() 형식으로 변환합니다.
+
+브라우저 수집(crawl)과 HTTP 수집(page_fetcher)이 같은 검사를 사용하며,
+Selenium을 임포트하지 않으므로 브라우저 없이 임포트 / 테스트할 수 있습니다.
+"""
+
+from category_mapping import get_category_id
+
+# 중복 상품 오류 문구 (저장 단계의 중복 확인도 같은 문구 사용, 진행 상태에서 실패가 아닌 건너뜀으로 기록)
+DUPLICATE_PRODUCT_MESSAGE = "이미 존재하는 제품명입니다."
+
+
+def is_duplicate_product_error(error):
+    """이미 저장된 상품이라 발생한 ValueError인지 여부"""
+    return isinstance(error, ValueError) and DUPLICATE_PRODUCT_MESSAGE in str(error)
+
+
+def check_product_options(product_options, product_counter):
+    """옵션 배열 검사 (비어있거나 price가 0인 옵션이 있으면 ValueError)"""
+    # 예외 처리: 옵션이 없는 경우
+    if not product_options:
+        raise ValueError(f"Error: 상품 {product_counter} - 상품 옵션 배열이 비어있습니다.")
+
+    # 옵션의 price 값 검사 -> 0 이라면 예외 발생
+    for idx, option in enumerate(product_options, start=1):
+        price = option.get("price")
+        if price == 0:
+            raise ValueError(
+                f"Error: 상품 {product_counter} - 옵션 {idx}의 price 값이 0입니다. 전체 옵션: {product_options}"
+            )
+
+
+def build_product_record(page, product_counter, is_duplicate=None):
+    """
+    브라우저 없이 추출한 상세 페이지 데이터를 collect_product_record()와 같은 형식으로 검사/변환합니다.
+
+    Args:
+        page: category, brand, product_name, main_image_urls,
+              detail_info, detail_image_urls, product_options를 담은 딕셔너리
+        product_counter: 현재 상품 번호 (로깅용)
+        is_duplicate: 상품명을 받아 이미 저장된 상품인지 반환하는 함수
+
+    Returns:
+        dict: collect_product_record()와 같은 형식의 상품 데이터
+
+    Raises:
+        ValueError: 필수 데이터가 없거나 유효하지 않은 경우
+    """
+    if not page["main_image_urls"]:
+        raise ValueError(f"Error: 상품 {product_counter} - 메인 이미지 URL 배열이 비어있습니다.")
+
+    category_id = get_category_id(page["category"])
+    if category_id == 0:
+        raise ValueError(f"Error: 상품 {product_counter} - 유효한 카테고리 ID를 찾지 못했습니다. (category: {page['category']})")
+
+    if is_duplicate and is_duplicate(page["product_name"]):
+        raise ValueError(f"Error: 상품 {product_counter} - {DUPLICATE_PRODUCT_MESSAGE} (product_name: {page['product_name']})")
+
+    if not page["detail_image_urls"]:
+        raise ValueError(f"Error: 상품 {product_counter} - 상세 이미지 URL 배열이 비어있습니다.")
+
+    check_product_options(page["product_options"], product_counter)
+
+    return {
+        "brand": page["brand"],
+        "category_id": category_id,
+        "product_name": page["product_name"],
+        "main_image_urls": page["main_image_urls"],
+        "detail_info": page["detail_info"] or {},
+        "detail_image_urls": page["detail_image_urls"],
+        "product_options": page["product_options"],
+    }
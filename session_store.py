@@ -0,0 +1,159 @@
+"""
+브라우저 세션 저장/복원 모듈
+Cloudflare 확인을 통과한 세션의 쿠키와 localStorage를 파일에 저장해 두고,
+새 브라우저(다음 실행, 워커 풀의 다른 워커)에 복원하여 확인 대기 없이 바로 크롤링을 시작합니다.
+
+- 쿠키: CDP Network.setCookies로 페이지 이동 없이 복원
+- localStorage: 해당 사이트의 첫 문서가 열릴 때 스크립트로 복원 (Page.addScriptToEvaluateOnNewDocument)
+
+세션 파일은 사이트(origin)별로 저장하며, 오래된 세션은 복원하지 않습니다.
+"""
+
+import json
+import os
+import time
+from urllib.parse import urlsplit
+
+# 세션 저장 파일
+SESSION_FILE = "browser_session.json"
+
+# 이 시간(초)보다 오래된 세션은 복원하지 않음 (Cloudflare 통과 쿠키의 유효 기간 고려)
+SESSION_MAX_AGE = 6 * 60 * 60
+
+# localStorage 전체를 읽는 스크립트
+READ_LOCAL_STORAGE_SCRIPT = """
+var data = {};
+for (var i = 0; i < localStorage.length; i++) {
+    var key = localStorage.key(i);
+    data[key] = localStorage.getItem(key);
+}
+return data;
+"""
+
+# CDP 쿠키에 사용할 수 있는 sameSite 값
+_SAME_SITE_VALUES = ("Strict", "Lax", "None")
+
+
+def _origin(url):
+    """URL의 origin (예: https://www.oliveyoung.co.kr)"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _load_sessions(path):
+    """세션 파일 읽기 (없거나 손상되었으면 빈 딕셔너리)"""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _to_cdp_cookie(cookie, origin):
+    """Selenium get_cookies() 형식을 CDP Network.setCookies 형식으로 변환"""
+    cdp_cookie = {
+        "name": cookie["name"],
+        "value": cookie["value"],
+        "domain": cookie.get("domain"),
+        "path": cookie.get("path", "/"),
+        "secure": cookie.get("secure", False),
+        "httpOnly": cookie.get("httpOnly", False),
+    }
+    if not cdp_cookie["domain"]:
+        cdp_cookie["url"] = origin
+        del cdp_cookie["domain"]
+    if cookie.get("expiry"):
+        cdp_cookie["expires"] = cookie["expiry"]
+    if cookie.get("sameSite") in _SAME_SITE_VALUES:
+        cdp_cookie["sameSite"] = cookie["sameSite"]
+    return cdp_cookie
+
+
+def save_session(driver, path=SESSION_FILE):
+    """
+    현재 페이지 사이트의 쿠키와 localStorage를 세션 파일에 저장합니다.
+    (Cloudflare 확인을 통과하고 페이지가 정상적으로 열린 뒤 호출)
+
+    Args:
+        driver: 웹드라이버
+        path: 세션 저장 파일
+
+    Returns:
+        bool: 저장 성공 여부
+    """
+    try:
+        origin = _origin(driver.current_url)
+        if not origin.startswith("http"):
+            return False
+
+        sessions = _load_sessions(path)
+        sessions[origin] = {
+            "saved_at": time.time(),
+            "cookies": driver.get_cookies(),
+            "local_storage": driver.execute_script(READ_LOCAL_STORAGE_SCRIPT) or {},
+        }
+
+        # 임시 파일에 쓴 뒤 교체 (저장 중 중단되어도 기존 세션 파일 유지)
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(sessions, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    except Exception as e:
+        print(f"✗ 브라우저 세션 저장 실패: {e}")
+        return False
+
+    print(f"✓ 브라우저 세션 저장: {origin} (쿠키 {len(sessions[origin]['cookies'])}개)")
+    return True
+
+
+def restore_session(driver, url, path=SESSION_FILE, max_age=SESSION_MAX_AGE):
+    """
+    저장된 세션을 새 브라우저에 복원합니다. (url 사이트로 이동하기 전에 호출)
+
+    Args:
+        driver: 웹드라이버
+        url: 크롤링할 사이트 URL
+        path: 세션 저장 파일
+        max_age: 복원할 세션의 최대 경과 시간 (초)
+
+    Returns:
+        bool: 복원 여부 (저장된 세션이 없거나 오래되었으면 False)
+    """
+    origin = _origin(url)
+    session = _load_sessions(path).get(origin)
+    if not session:
+        return False
+
+    age = time.time() - session.get("saved_at", 0)
+    if age > max_age:
+        print(f"저장된 브라우저 세션이 오래되어 복원하지 않습니다. ({int(age // 60)}분 경과)")
+        return False
+
+    try:
+        cookies = [_to_cdp_cookie(cookie, origin) for cookie in session.get("cookies", [])]
+        driver.execute_cdp_cmd("Network.enable", {})
+        if cookies:
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+
+        local_storage = session.get("local_storage") or {}
+        if local_storage:
+            # 해당 사이트 문서가 열릴 때 비어있는 키만 채움 (페이지가 새로 쓴 값은 유지)
+            script = (
+                f"if (location.origin === {json.dumps(origin)}) {{"
+                f"  var saved = {json.dumps(local_storage, ensure_ascii=False)};"
+                "  Object.keys(saved).forEach(function (key) {"
+                "    if (localStorage.getItem(key) === null) localStorage.setItem(key, saved[key]);"
+                "  });"
+                "}"
+            )
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": script})
+
+    except Exception as e:
+        print(f"✗ 브라우저 세션 복원 실패 (새 세션으로 진행): {e}")
+        return False
+
+    print(f"✓ 브라우저 세션 복원: {origin} (쿠키 {len(cookies)}개, localStorage {len(local_storage)}개)")
+    return True
@@ -4,6 +4,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
 import traceback
+from driver_factory import BLOCK_RESOURCES, add_blocking_preferences, apply_resource_blocking
 from file_transaction import FileTransaction
 from crawl import crawl_product_on_detail_page
 
@@ -25,8 +26,14 @@ def create_driver():
     options.add_argument(
         "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36")
 
+    # 이미지/폰트/동영상/트래커 요청 차단 (URL 속성은 DOM에 그대로 남음)
+    if BLOCK_RESOURCES:
+        add_blocking_preferences(options)
+
     # version_main 제거하여 자동 버전 매칭
     driver = uc.Chrome(options=options, use_subprocess=True)
+    if BLOCK_RESOURCES:
+        apply_resource_blocking(driver)
 
     # 페이지 로드 타임아웃 설정
     driver.set_page_load_timeout(60)
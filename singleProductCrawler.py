@@ -4,6 +4,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
 import traceback
+from driver_factory import BLOCK_RESOURCES, add_blocking_preferences, apply_resource_blocking
 from file_transaction import FileTransaction
 from crawl import crawl_product_on_detail_page
 
@@ -18,7 +19,15 @@ def create_driver():
     options.add_argument(
         "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36")
 
-    return uc.Chrome(options=options, version_main=143, use_subprocess=True)
+    # 이미지/폰트/동영상/트래커 요청 차단 (URL 속성은 DOM에 그대로 남음)
+    if BLOCK_RESOURCES:
+        add_blocking_preferences(options)
+
+    driver = uc.Chrome(options=options, version_main=143, use_subprocess=True)
+    if BLOCK_RESOURCES:
+        apply_resource_blocking(driver)
+
+    return driver
 
 
 def crawl_single_product(driver, product_url):
@@ -1,32 +1,36 @@
-import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
 import traceback
+from driver_factory import create_chrome_driver, get_driver_profile, USER_DATA_DIR
+from session_store import restore_session, save_session
+from page_extractor import PRODUCT_NAME_XPATH
+from page_wait import wait_for_xpath
 from file_transaction import FileTransaction
 from crawl import crawl_product_on_detail_page
 
+# 세션을 저장/복원할 사이트 (Cloudflare 확인을 통과한 세션을 다음 실행에서 재사용)
+SITE_URL = "https://www.oliveyoung.co.kr"
 
-def create_driver():
-    """드라이버 생성 함수"""
-    options = uc.ChromeOptions()
-    options.add_argument("--start-maximized")
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--no-sandbox")
-
-    # 추가 안정성 옵션
-    options.add_argument("--disable-gpu")
-    options.add_argument("--disable-software-rasterizer")
-    options.add_argument("--log-level=3")  # 로그 레벨 감소
-
-    options.add_argument(
-        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36")
 
+def create_driver():
+    """
+    드라이버 생성 함수
+    (headless / 페이지 로딩 전략 등은 driver_factory의 프로필로 선택, 환경 변수 CRAWL_DRIVER_PROFILE)
+    """
     print("Chrome 드라이버 초기화 중...")
     # version_main 제거하여 자동 버전 매칭
-    driver = uc.Chrome(options=options, use_subprocess=True)
+    # 프로필 디렉토리를 유지하여 실행 간 Cloudflare 통과 상태 재사용
+    driver = create_chrome_driver(extra_arguments=(
+        # 추가 안정성 옵션
+        "--disable-gpu",
+        "--disable-software-rasterizer",
+        "--log-level=3",  # 로그 레벨 감소
+    ), user_data_dir=USER_DATA_DIR)
+
+    # 저장된 세션(쿠키/localStorage) 복원
+    restore_session(driver, SITE_URL)
 
     # 드라이버 초기화 대기
     time.sleep(2)
@@ -40,8 +44,9 @@ def create_driver():
         print(f"✗ 드라이버 초기화 중 오류: {e}")
         raise
 
-    # 페이지 로드 타임아웃 설정
-    driver.set_page_load_timeout(60)
+    # 페이지 로드 타임아웃 설정 (프로필에 지정된 값이 없을 때)
+    if not get_driver_profile()["page_load_timeout"]:
+        driver.set_page_load_timeout(60)
 
     return driver
 
@@ -89,7 +94,10 @@ def crawl_single_product(driver, product_url):
 
         # Cloudflare 우회 및 페이지 로딩 대기
         print("Cloudflare 체크 및 페이지 안정화 대기 중... (최대 15초)")
-        time.sleep(10)  # 초기 대기 시간 증가
+        # 상품명이 나타나면 바로 진행 (복원한 세션이 유효하면 대기 없음)
+        if wait_for_xpath(driver, PRODUCT_NAME_XPATH, timeout=15):
+            # 확인을 통과한 세션 저장 (다음 실행에서 복원)
+            save_session(driver)
 
         # 페이지가 정상적으로 로드되었는지 확인
         try:
@@ -0,0 +1,102 @@
+"""
+SQL INSERT 파일 스트리밍 작성 모듈
+INSERT 헤더와 마지막 세미콜론을 별도의 틀(framing)로 다루어,
+기존 파일 내용을 다시 읽거나 쓰지 않고 새 VALUES 행만 파일 끝에 덧붙입니다.
+"""
+
+from typing import List
+
+from file_transaction import read_tail, write_tail
+
+# 파일 끝에서 한 번에 읽어볼 바이트 수
+TAIL_SCAN_SIZE = 256
+
+# 공백 문자 (파일 끝 정리용)
+WHITESPACE = b" \t\r\n"
+
+
+def find_append_position(file_path: str, transaction=None):
+    """
+    새 VALUES 행을 덧붙일 위치를 파일 끝부분만 읽어서 찾습니다.
+
+    Args:
+        file_path: SQL 파일 경로
+        transaction: FileTransaction 객체 (있으면 커밋 전 변경 내용 기준으로 확인)
+
+    Returns:
+        tuple: (offset, separator)
+               offset: 덮어쓰기를 시작할 바이트 위치 (파일이 없거나 비어있으면 None)
+               separator: 새 행 앞에 붙일 구분자 ("\\n" 또는 ",\\n")
+    """
+    reader = transaction.read_tail if transaction else read_tail
+    scan_size = TAIL_SCAN_SIZE
+
+    while True:
+        result = reader(file_path, scan_size)
+        if result is None:
+            return None, None
+
+        start, tail = result
+        stripped = tail.rstrip(WHITESPACE)
+
+        # 공백이 아닌 문자를 찾았거나 파일 처음까지 확인한 경우 종료
+        if stripped or start == 0:
+            break
+        scan_size *= 2
+
+    # 빈 파일 (또는 공백만 있는 파일)
+    if not stripped:
+        return None, None
+
+    # 마지막 세미콜론 제거
+    body = stripped
+    if body.endswith(b';'):
+        body = body[:-1].rstrip(WHITESPACE)
+
+    offset = start + len(body)
+
+    # 헤더만 있는 경우 (첫 데이터) 또는 이미 콤마로 끝난 경우
+    if body.upper().endswith(b'VALUES') or body.endswith(b','):
+        return offset, "\n"
+
+    # 기존 데이터가 있으므로 콤마 추가
+    return offset, ",\n"
+
+
+def append_sql_values(file_path: str, header: str, values: List[str], transaction=None,
+                      terminator: str = ";", encoding: str = 'utf-8') -> List[str]:
+    """
+    SQL 파일에 VALUES 행을 덧붙입니다.
+    파일 끝의 세미콜론만 구분자로 바꾸고 새 행을 추가하므로
+    파일이 아무리 커져도 작성 비용이 일정합니다.
+
+    Args:
+        file_path: SQL 파일 경로
+        header: 파일이 없거나 비어있을 때 작성할 INSERT 헤더 ("... VALUES"로 끝남)
+        values: 추가할 VALUES 행 리스트 (예: "(1, 'name')")
+        transaction: FileTransaction 객체 (없으면 파일에 직접 작성)
+        terminator: 마지막 행 뒤에 붙일 종료 문자열
+        encoding: 인코딩
+
+    Returns:
+        list: 추가된 VALUES 행 리스트
+    """
+    if not values:
+        return []
+
+    offset, separator = find_append_position(file_path, transaction)
+    rows = ",\n".join(values)
+
+    if offset is None:
+        # 파일이 없거나 비어있음 - 헤더부터 작성
+        offset = 0
+        content = header + "\n" + rows + terminator
+    else:
+        content = separator + rows + terminator
+
+    if transaction:
+        transaction.write_tail(file_path, offset, content, encoding=encoding)
+    else:
+        write_tail(file_path, offset, content, encoding=encoding)
+
+    return values
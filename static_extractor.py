@@ -0,0 +1,352 @@
+"""
+정적 HTML 상세 페이지 추출 모듈
+브라우저 없이 받아온 상세 페이지 HTML에서 상품 데이터를 읽습니다.
+
+표준 라이브러리 html.parser로 간단한 DOM 트리를 만들고,
+page_selectors 모듈의 XPath와 CSS 선택자 상수를 그대로 평가합니다.
+(지원 범위: '//*[@id="..."]/tag[n]/...' 형태의 XPath,
+ 태그 / #id / .class / [attr] / [attr="값"] / :nth-child(n) 와 자손 / '>' 결합자로 된 CSS 선택자)
+
+HTML에 임베디드 상태 JSON(__NEXT_DATA__)이 있으면 그 값을 먼저 사용하고 DOM은 빈 항목만 채웁니다.
+자바스크립트로 렌더링되는 영역(옵션 드롭다운 목록 등)은 정적 DOM에 없으므로
+missing_fields()로 빠진 항목을 확인하여 브라우저 수집으로 대체합니다.
+"""
+
+import re
+from html.parser import HTMLParser
+
+from page_selectors import (
+    OPTION_BUTTON_SELECTOR,
+    MAIN_PRODUCT_NAME_SELECTOR,
+    MAIN_PRODUCT_PRICE_SELECTOR,
+    CATEGORY_XPATH,
+    BRAND_LINK_XPATH,
+    BRAND_BUTTON_XPATH,
+    PRODUCT_NAME_XPATH,
+    DETAILINFO_TABLE_SELECTOR,
+)
+from page_extractor import MAIN_IMAGE_COUNT
+from option_normalizer import normalize_image_url, normalize_options
+from detailImg import DETAIL_IMAGE_SELECTOR
+from embedded_state import parse_embedded_state, extract_product_state, merge_pages
+
+# 메인 이미지 슬라이드 (상품 이미지 캐러셀 안의 swiper 슬라이드만)
+MAIN_SLIDE_SELECTOR = "div.GoodsDetailCarousel_visual-container__1kSZN div.swiper-slide"
+
+# 브라우저 없이 채워져야 하는 항목 (하나라도 비어있으면 브라우저 수집으로 대체)
+REQUIRED_FIELDS = ("category", "product_name", "main_image_urls", "detail_image_urls",
+                   "product_options", "detail_info")
+
+# 닫는 태그가 없는 요소
+_VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link",
+              "meta", "param", "source", "track", "wbr"}
+
+
+class Element:
+    """정적 DOM 요소"""
+
+    def __init__(self, tag, attrs=None, parent=None):
+        self.tag = tag
+        self.attrs = dict(attrs or {})
+        self.parent = parent
+        self.children = []  # Element 또는 str(텍스트)
+
+    @property
+    def elements(self):
+        """자식 요소 리스트 (텍스트 제외)"""
+        return [child for child in self.children if isinstance(child, Element)]
+
+    @property
+    def classes(self):
+        return (self.attrs.get("class") or "").split()
+
+    def get(self, name):
+        """속성값 (없으면 None)"""
+        return self.attrs.get(name)
+
+    def iter(self):
+        """자신을 제외한 모든 자손 요소 (문서 순서)"""
+        for child in self.elements:
+            yield child
+            yield from child.iter()
+
+    @property
+    def text(self):
+        """공백을 정리한 텍스트 (없으면 None)"""
+        parts = []
+
+        def collect(node):
+            for child in node.children:
+                if isinstance(child, Element):
+                    collect(child)
+                else:
+                    parts.append(child)
+
+        collect(self)
+        text = " ".join("".join(parts).split())
+        return text or None
+
+    def select(self, css):
+        """CSS 선택자에 해당하는 자손 요소 리스트 (문서 순서)"""
+        steps = _parse_css(css)
+        return [el for el in self.iter() if _matches(el, steps, len(steps) - 1)]
+
+    def select_one(self, css):
+        """CSS 선택자에 해당하는 첫 번째 자손 요소 (없으면 None)"""
+        steps = _parse_css(css)
+        for el in self.iter():
+            if _matches(el, steps, len(steps) - 1):
+                return el
+        return None
+
+    def xpath(self, xpath):
+        """
+        '//*[@id="..."]/tag[n]/...' 형태의 XPath에 해당하는 첫 번째 요소 (없으면 None)
+        (document.evaluate의 FIRST_ORDERED_NODE_TYPE과 같은 결과)
+        """
+        match = re.match(r'^//\*\[@id="([^"]+)"\](.*)$', xpath)
+        if not match:
+            raise ValueError(f"지원하지 않는 XPath입니다: {xpath}")
+
+        nodes = [el for el in self.iter() if el.get("id") == match.group(1)][:1]
+        for step in filter(None, match.group(2).split("/")):
+            tag, _, index = step.partition("[")
+            position = int(index.rstrip("]")) if index else None
+            next_nodes = []
+            for node in nodes:
+                same_tag = [child for child in node.elements if tag == "*" or child.tag == tag]
+                if position is None:
+                    next_nodes.extend(same_tag)
+                elif len(same_tag) >= position:
+                    next_nodes.append(same_tag[position - 1])
+            nodes = next_nodes
+
+        return nodes[0] if nodes else None
+
+
+class _TreeBuilder(HTMLParser):
+    """html.parser 이벤트로 Element 트리를 만듭니다."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Element("#document")
+        self.stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        element = Element(tag, attrs, parent=self.stack[-1])
+        self.stack[-1].children.append(element)
+        if tag not in _VOID_TAGS:
+            self.stack.append(element)
+
+    def handle_startendtag(self, tag, attrs):
+        element = Element(tag, attrs, parent=self.stack[-1])
+        self.stack[-1].children.append(element)
+
+    def handle_endtag(self, tag):
+        # 짝이 맞지 않는 닫는 태그는 가장 가까운 같은 태그까지 닫음 (없으면 무시)
+        for depth in range(len(self.stack) - 1, 0, -1):
+            if self.stack[depth].tag == tag:
+                del self.stack[depth:]
+                return
+
+    def handle_data(self, data):
+        self.stack[-1].children.append(data)
+
+
+def parse_html(html: str) -> Element:
+    """HTML 문자열을 정적 DOM 트리로 변환합니다."""
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+_CSS_PART = re.compile(r'#([\w-]+)|\.([\w-]+)|\[([\w-]+)(?:="([^"]*)")?\]|:nth-child\((\d+)\)')
+
+
+def _parse_compound(text):
+    """'div.a.b:nth-child(2)' 같은 단일 선택자를 조건 딕셔너리로 변환"""
+    match = re.match(r'^([\w-]+|\*)?', text)
+    tag = match.group(1) if match and match.group(1) != "*" else None
+    compound = {"tag": tag, "id": None, "classes": [], "attrs": [], "nth": None}
+
+    rest = text[match.end():] if match else text
+    for part in _CSS_PART.finditer(rest):
+        element_id, cls, attr, value, nth = part.groups()
+        if element_id:
+            compound["id"] = element_id
+        elif cls:
+            compound["classes"].append(cls)
+        elif attr:
+            compound["attrs"].append((attr, value))
+        elif nth:
+            compound["nth"] = int(nth)
+    return compound
+
+
+def _parse_css(css):
+    """CSS 선택자를 [(결합자, 조건), ...] 리스트로 변환 (결합자: ' ' 또는 '>')"""
+    steps = []
+    combinator = " "
+    for token in css.replace(">", " > ").split():
+        if token == ">":
+            combinator = ">"
+            continue
+        steps.append((combinator, _parse_compound(token)))
+        combinator = " "
+    return steps
+
+
+def _matches_compound(el, compound):
+    if compound["tag"] and el.tag != compound["tag"]:
+        return False
+    if compound["id"] and el.get("id") != compound["id"]:
+        return False
+    if any(cls not in el.classes for cls in compound["classes"]):
+        return False
+    for attr, value in compound["attrs"]:
+        if el.get(attr) is None or (value is not None and el.get(attr) != value):
+            return False
+    if compound["nth"] is not None:
+        siblings = el.parent.elements if el.parent else [el]
+        if siblings.index(el) + 1 != compound["nth"]:
+            return False
+    return True
+
+
+def _matches(el, steps, index):
+    """el이 steps[index]까지의 선택자와 일치하는지 확인 (오른쪽에서 왼쪽으로)"""
+    combinator, compound = steps[index]
+    if not _matches_compound(el, compound):
+        return False
+    if index == 0:
+        return True
+
+    ancestor = el.parent
+    if combinator == ">":
+        return ancestor is not None and _matches(ancestor, steps, index - 1)
+    while ancestor is not None:
+        if _matches(ancestor, steps, index - 1):
+            return True
+        ancestor = ancestor.parent
+    return False
+
+
+def _image_url(img):
+    """lazy loading 속성을 포함한 이미지 URL (data:image 자리표시자 제외)"""
+    if img is None:
+        return None
+    for attr in ("data-src", "data-original", "src"):
+        url = img.get(attr)
+        if url and not url.startswith("data:image"):
+            return url
+    return None
+
+
+def _main_image_urls(doc):
+    """
+    메인 이미지 슬라이드 URL (data-swiper-slide-index 순서)
+    loop 모드에서 앞뒤에 복제된 슬라이드는 같은 인덱스이므로 한 번만 사용합니다.
+    """
+    slides = {}
+    for position, slide in enumerate(doc.select(MAIN_SLIDE_SELECTOR)):
+        slide_index = slide.get("data-swiper-slide-index")
+        order = int(slide_index) if slide_index and slide_index.isdigit() else position
+        url = normalize_image_url(_image_url(slide.select_one("img")), None)
+        if url and order not in slides:
+            slides[order] = url
+
+    urls = []
+    for order in sorted(slides):
+        if slides[order] not in urls:
+            urls.append(slides[order])
+    return urls[:MAIN_IMAGE_COUNT]
+
+
+def _detail_info(doc):
+    """상품정보 제공고시 테이블 ({항목명: 값})"""
+    table = doc.select_one(DETAILINFO_TABLE_SELECTOR)
+    if table is None:
+        return {}
+
+    detail_info = {}
+    for row in table.select("tr"):
+        th, td = row.select_one("th"), row.select_one("td")
+        if th is not None and td is not None:
+            detail_info[th.text or ""] = td.text or ""
+    return detail_info
+
+
+def _single_option(doc, main_image_urls):
+    """
+    단일 상품 옵션 (옵션 드롭다운이 없는 상품)
+    옵션 드롭다운이 있으면 목록이 자바스크립트로 렌더링되므로 빈 리스트를 반환합니다.
+    """
+    if doc.select_one(OPTION_BUTTON_SELECTOR) is not None:
+        return []
+
+    name = doc.select_one(MAIN_PRODUCT_NAME_SELECTOR)
+    price = doc.select_one(MAIN_PRODUCT_PRICE_SELECTOR)
+    if price is None or not price.text:
+        return []
+
+    raw_option = {
+        "name": name.text if name is not None else None,
+        "price": price.text,
+        # 활성 슬라이드 표시는 브라우저에서 붙으므로 첫 번째 메인 이미지를 사용
+        "image_url": main_image_urls[0] if main_image_urls else None,
+        "is_soldout": False,
+    }
+    return normalize_options([raw_option], is_multi_option=False)
+
+
+def extract_product_html(html: str) -> dict:
+    """
+    상세 페이지 HTML에서 상품 데이터를 추출합니다.
+    임베디드 상태 JSON의 값을 우선 사용하고, 비어있는 항목은 DOM에서 읽습니다.
+
+    Args:
+        html: 상세 페이지 HTML 문자열
+
+    Returns:
+        dict: category, brand, product_name (없으면 None),
+              main_image_urls, detail_image_urls, product_options (없으면 빈 리스트),
+              detail_info ({항목명: 값}, 없으면 빈 딕셔너리)
+    """
+    doc = parse_html(html)
+
+    def xpath_text(xpath):
+        element = doc.xpath(xpath)
+        return element.text if element is not None else None
+
+    main_image_urls = _main_image_urls(doc)
+    detail_image_urls = [url for url in map(_image_url, doc.select(DETAIL_IMAGE_SELECTOR)) if url]
+
+    dom_page = {
+        "category": xpath_text(CATEGORY_XPATH),
+        "brand": xpath_text(BRAND_LINK_XPATH) or xpath_text(BRAND_BUTTON_XPATH),
+        "product_name": xpath_text(PRODUCT_NAME_XPATH),
+        "main_image_urls": main_image_urls,
+        "detail_image_urls": detail_image_urls,
+        "product_options": _single_option(doc, main_image_urls),
+        "detail_info": _detail_info(doc),
+    }
+
+    state_page = extract_product_state(parse_embedded_state(html))
+    page = merge_pages(state_page, dom_page)
+    page["main_image_urls"] = page["main_image_urls"][:MAIN_IMAGE_COUNT]
+    return page
+
+
+def missing_fields(page: dict) -> list:
+    """
+    브라우저 없이 채우지 못한 필수 항목 이름 리스트
+
+    Args:
+        page: extract_product_html()이 반환한 딕셔너리
+
+    Returns:
+        list of str: 비어있는 항목 이름 (모두 채워졌으면 빈 리스트)
+    """
+    return [field for field in REQUIRED_FIELDS if not page.get(field)]
+
@@ -0,0 +1,148 @@
+"""
+멀티 탭 상세 페이지 크롤러
+브라우저 하나에 탭 K개를 열어 두고 상세 페이지 로딩을 탭마다 돌아가며 맡깁니다.
+
+한 탭에서 데이터를 추출하는 동안 다른 탭들은 다음 상세 페이지를 백그라운드에서 불러오므로,
+브라우저 프로세스를 늘리지 않고도 네트워크 대기 시간과 추출 시간이 겹쳐집니다.
+모든 작업이 한 스레드에서 이루어지므로 저장 함수는 기존 방식 그대로 사용할 수 있습니다.
+"""
+
+from collections import deque
+
+from crawl import collect_product_record
+from page_extractor import PRODUCT_NAME_XPATH
+from page_wait import wait_until
+from driver_factory import prepare_new_tab
+
+# 기본 탭 수
+DEFAULT_NUM_TABS = 3
+
+# 탭 전환 후 상세 페이지가 준비될 때까지 기다리는 최대 시간 (초)
+TAB_LOAD_TIMEOUT = 20
+
+# 이전 페이지가 아직 남아있는지 구분하기 위한 표시 (새 문서에는 없음)
+_NAVIGATING_FLAG = "__crawlerNavigating"
+
+
+class MultiTabCrawler:
+    """
+    탭 라운드 로빈 방식의 상세 페이지 크롤러
+
+    사용 예:
+        crawler = MultiTabCrawler(driver, num_tabs=3)
+        crawler.run(product_urls, save=lambda record, counter: ..., is_duplicate=product_exists)
+    """
+
+    def __init__(self, driver, num_tabs=DEFAULT_NUM_TABS):
+        """
+        Args:
+            driver: 웹드라이버 (현재 탭을 첫 번째 탭으로 사용)
+            num_tabs: 동시에 열어 둘 탭 수
+        """
+        self.driver = driver
+        self.num_tabs = max(1, num_tabs)
+        self.tabs = []  # 탭 핸들 리스트
+
+    def _open_tabs(self, count):
+        """현재 탭을 포함하여 탭 count개를 준비합니다."""
+        self.tabs = [self.driver.current_window_handle]
+        for _ in range(count - 1):
+            self.driver.switch_to.new_window('tab')
+            prepare_new_tab(self.driver)  # 리소스 차단은 탭마다 적용
+            self.tabs.append(self.driver.current_window_handle)
+
+    def _close_extra_tabs(self):
+        """추가로 연 탭을 닫고 첫 번째 탭으로 돌아갑니다."""
+        for handle in self.tabs[1:]:
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except Exception:
+                pass
+        if self.tabs:
+            self.driver.switch_to.window(self.tabs[0])
+        self.tabs = []
+
+    def _start_loading(self, handle, url):
+        """탭에서 페이지 로딩을 시작만 하고 바로 돌아옵니다. (driver.get과 달리 로딩 완료를 기다리지 않음)"""
+        self.driver.switch_to.window(handle)
+        self.driver.execute_script(
+            f"window.{_NAVIGATING_FLAG} = true; window.location.href = arguments[0];", url
+        )
+
+    def _wait_for_new_page(self):
+        """
+        현재 탭에 새 상세 페이지가 준비될 때까지 기다립니다.
+        (이동 전 페이지에도 상품명이 있으므로 이동 표시가 사라진 새 문서인지 함께 확인)
+        """
+        script = (
+            f"if (window.{_NAVIGATING_FLAG}) return false;"
+            "return !!document.evaluate(arguments[0], document, null, "
+            "XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;"
+        )
+        return wait_until(
+            lambda: self.driver.execute_script(script, PRODUCT_NAME_XPATH),
+            TAB_LOAD_TIMEOUT, description="탭 상세 페이지 로딩"
+        )
+
+    def run(self, product_urls, save, is_duplicate=None, on_error=None):
+        """
+        모든 URL을 탭에 돌아가며 불러와 수집하고 저장합니다.
+
+        Args:
+            product_urls: [{"url": 상세 페이지 URL, ...}, ...]
+            save: save(record, product_counter) -> bool, 수집 결과 저장 함수
+            is_duplicate: 상품명을 받아 이미 저장된 상품인지 반환하는 함수
+            on_error: on_error(product_counter, product, error), 수집 실패 시 호출할 함수
+
+        Returns:
+            int: 저장에 성공한 상품 수
+        """
+        pending = deque(enumerate(product_urls, start=1))
+        if not pending:
+            return 0
+
+        self._open_tabs(min(self.num_tabs, len(pending)))
+        print(f"[MultiTab] 탭 {len(self.tabs)}개로 상품 {len(product_urls)}개 수집 시작")
+
+        # 탭마다 첫 페이지 로딩 시작 (탭 핸들 -> 담당 상품)
+        loading = deque()
+        for handle in self.tabs:
+            if not pending:
+                break
+            item = pending.popleft()
+            self._start_loading(handle, item[1]["url"])
+            loading.append((handle, item))
+
+        saved_count = 0
+
+        try:
+            while loading:
+                handle, (product_counter, product) = loading.popleft()
+                self.driver.switch_to.window(handle)
+
+                try:
+                    if not self._wait_for_new_page():
+                        raise ValueError(f"상세 페이지가 준비되지 않았습니다. ({product['url']})")
+                    record = collect_product_record(self.driver, product_counter, is_duplicate=is_duplicate)
+                except Exception as e:
+                    record = None
+                    if on_error:
+                        on_error(product_counter, product, e)
+                    else:
+                        print(f"✗ 상품 {product_counter} 수집 실패: {e}")
+
+                # 추출이 끝난 탭은 바로 다음 상품 로딩 시작 (저장하는 동안에도 로딩 진행)
+                if pending:
+                    item = pending.popleft()
+                    self._start_loading(handle, item[1]["url"])
+                    loading.append((handle, item))
+
+                if record is not None and save(record, product_counter):
+                    saved_count += 1
+
+        finally:
+            self._close_extra_tabs()
+
+        print(f"[MultiTab] 수집 완료: {saved_count}/{len(product_urls)}개 저장")
+        return saved_count
@@ -1,24 +1,111 @@
-import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
 import traceback
-from file_transaction import FileTransaction
-from crawl import crawl_product_on_detail_page
+from driver_factory import create_chrome_driver, USER_DATA_DIR
+from session_store import restore_session, save_session
+from file_transaction import FileTransaction, GroupCommit
+from crawl import crawl_product_on_detail_page, crawl_product_to_store, initialize_output_files, save_product_record, store_product_record
+from product_mapping import get_product_index, product_exists
+from worker_pool import DetailWorkerPool
+from tab_crawler import MultiTabCrawler
+from driver_supervisor import DriverSupervisor
+from page_fetcher import FallbackFetcher, HttpFetcher, SeleniumFetcher
+from catalog_store import CatalogStore
+from crawl_frontier import CrawlFrontier
+from product_record import is_duplicate_product_error
+from page_extractor import PRODUCT_NAME_XPATH
+from listing_paginator import ListingPaginator, PRODUCT_LINKS_JS, PRODUCT_LIST_XPATH
+from page_wait import wait_for_document_ready, wait_for_url_change, wait_for_xpath, wait_until
+
+# True면 JSON/SQL 파일 대신 SQLite 카탈로그 저장소(catalog.db)에 저장하고
+# 크롤링 후 sql_export/ 디렉토리에 INSERT 문 파일을 내보냅니다.
+USE_CATALOG_STORE = False
+
+# 상품 사이에 추가로 쉬는 시간 (초, 0이면 페이지 준비 즉시 다음 상품 진행)
+PRODUCT_DELAY = 0
+
+# 첫 페이지 접속 시 Cloudflare 확인이 끝나고 상품 목록이 나타날 때까지 기다리는 최대 시간 (초)
+START_PAGE_TIMEOUT = 30
+
+# True면 목록 페이지에서 상품 URL을 모두 모은 뒤(1단계) 상세 페이지로 직접 이동하여 크롤링(2단계)
+# False면 목록에서 상품을 하나씩 클릭하고 목록 페이지로 돌아오는 기존 방식
+TWO_PHASE_CRAWL = True
+
+# True면 2단계 크롤링의 목록 페이지 / 상품 처리 상태를 crawl_frontier.db에 저장하여
+# 중간에 종료되어도 다시 실행하면 수집하지 않은 목록 페이지, 저장하지 않은 상품부터 이어서 진행
+# (저장 완료한 상품은 상세 페이지를 다시 열지 않음, 같은 시작 URL로 실행해야 이어서 진행)
+USE_CRAWL_FRONTIER = True
+
+# True면 2단계 크롤링의 URL 수집 시 페이지 버튼 클릭 대신 pageIdx/rowsPerPage 파라미터로 페이지 이동
+USE_URL_PAGINATION = True
+
+# URL 페이지네이션 시 한 페이지에 표시할 상품 수
+ROWS_PER_PAGE = 48
+
+# 2단계 크롤링 시 상세 페이지를 동시에 수집할 브라우저 수 (1이면 현재 드라이버 하나로 순서대로 수집)
+# 수집은 워커마다 따로 하고, 파일/DB 저장과 ID 할당은 메인 스레드 하나에서만 수행
+NUM_WORKERS = 1
+
+# True면 2단계에서 상세 페이지를 먼저 HTTP로 받아 정적 HTML에서 추출하고,
+# 필요한 항목이 HTML에 없을 때만 브라우저로 수집 (NUM_WORKERS, NUM_TABS가 1일 때만 사용)
+USE_HTTP_FETCHER = False
+
+# 2단계 크롤링 시 브라우저 하나에서 번갈아 사용할 탭 수 (NUM_WORKERS가 1일 때만 사용)
+# 한 탭에서 추출하는 동안 다른 탭들이 다음 상세 페이지를 미리 불러옴
+NUM_TABS = 1
+
+# True면 Chrome 프로필 디렉토리를 유지하고 쿠키/localStorage를 저장/복원하여
+# Cloudflare 확인을 통과한 세션으로 바로 크롤링 시작 (워커 풀의 추가 브라우저에도 복원)
+USE_PERSISTENT_SESSION = True
+
+# True면 2단계 순차 크롤링 시 브라우저 상태(페이지 수 / 메모리 / 응답 시간)를 감시하여
+# 기준을 넘거나 응답이 없으면 브라우저를 재시작하고 현재 상품부터 이어서 진행 (USE_HTTP_FETCHER가 False일 때만 사용)
+USE_DRIVER_SUPERVISOR = True
+
+# 브라우저 하나로 연속 처리할 최대 상세 페이지 수 (이후 브라우저 재시작, 0이면 페이지 수로 재시작하지 않음)
+RECYCLE_AFTER_PAGES = 300
+
+# 세션을 저장/복원할 사이트
+SITE_URL = "https://www.oliveyoung.co.kr"
+
+# 멀티 탭 크롤링 시 백그라운드 탭의 로딩/타이머가 느려지지 않도록 하는 Chrome 옵션
+BACKGROUND_TAB_ARGUMENTS = (
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+)
+
+# 상세 페이지 URL (목록의 링크에 href가 없을 때 goodsNo로 생성)
+GOODS_DETAIL_URL = "https://www.oliveyoung.co.kr/store/goods/getGoodsDetail.do?goodsNo={goods_no}"
+
+# 페이지 번호 XPath
+CURRENT_PAGE_XPATH = '//*[@id="Container"]/div[2]/strong[@title="현재 페이지"]'
+
+
+def create_driver(persistent_profile=True):
+    """
+    드라이버 생성 함수
+    (headless / 페이지 로딩 전략 등은 driver_factory의 프로필로 선택, 환경 변수 CRAWL_DRIVER_PROFILE)
+
+    Args:
+        persistent_profile: True면 USER_DATA_DIR 프로필 사용 (동시에 브라우저 하나만 사용 가능)
+    """
+    user_data_dir = USER_DATA_DIR if USE_PERSISTENT_SESSION and persistent_profile else None
+    driver = create_chrome_driver(version_main=137, extra_arguments=BACKGROUND_TAB_ARGUMENTS,
+                                  user_data_dir=user_data_dir)
 
+    # 저장된 세션(쿠키/localStorage) 복원
+    if USE_PERSISTENT_SESSION:
+        restore_session(driver, SITE_URL)
 
-def create_driver():
-    """드라이버 생성 함수"""
-    options = uc.ChromeOptions()
-    options.add_argument("--start-maximized")
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--no-sandbox")
-    options.add_argument(
-        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36")
+    return driver
 
-    return uc.Chrome(options=options, version_main=137, use_subprocess=True)
+
+def create_worker_driver():
+    """워커 풀의 추가 브라우저 생성 함수 (임시 프로필 + 저장된 세션 복원)"""
+    return create_driver(persistent_profile=False)
 
 
 def go_back_to_original_page(driver, original_url):
@@ -36,7 +123,6 @@ def go_back_to_original_page(driver, original_url):
     print("GET 요청으로 직접 페이지 이동")
     try:
         driver.get(original_url)
-        time.sleep(3)  # 페이지 로딩 대기
 
         # 페이지가 완전히 로드될 때까지 대기
         try:
@@ -53,7 +139,7 @@ def go_back_to_original_page(driver, original_url):
         try:
             print("GET 요청 실패, 뒤로가기 시도")
             driver.execute_script("window.history.back();")
-            time.sleep(3)
+            wait_for_url_change(driver, current_url_before)
 
             # 경고창 처리 (양식 재제출 확인)
             try:
@@ -61,7 +147,6 @@ def go_back_to_original_page(driver, original_url):
                 print(f"경고창 발견: {alert.text}")
                 alert.accept()  # '계속' 버튼 클릭
                 print("경고창 처리 완료")
-                time.sleep(2)
             except:
                 # 경고창 없음
                 pass
@@ -79,8 +164,9 @@ def go_back_to_original_page(driver, original_url):
     except:
         print("페이지 제목을 가져올 수 없음")
 
-    # 페이지가 안정화될 때까지 추가 대기
-    time.sleep(2)
+    # 상품 목록이 나타날 때까지 대기
+    wait_for_document_ready(driver)
+    wait_for_xpath(driver, PRODUCT_LIST_XPATH)
 
     return True
 
@@ -88,7 +174,7 @@ def go_back_to_original_page(driver, original_url):
 def get_current_page_number(driver):
     """현재 페이지 번호를 가져오는 함수"""
     try:
-        current_page_element = driver.find_element(By.XPATH, '//*[@id="Container"]/div[2]/strong[@title="현재 페이지"]')
+        current_page_element = driver.find_element(By.XPATH, CURRENT_PAGE_XPATH)
         current_page = int(current_page_element.text.strip())
         return current_page
     except Exception as e:
@@ -96,6 +182,27 @@ def get_current_page_number(driver):
         return None
 
 
+def _wait_for_page_number(driver, current_page, timeout=10):
+    """
+    페이지 번호가 current_page보다 커지고 상품 목록이 나타날 때까지 기다립니다.
+
+    Returns:
+        bool: 페이지 이동 확인 여부
+    """
+    def page_advanced():
+        text = driver.execute_script(
+            "var el = document.evaluate(arguments[0], document, null, "
+            "XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;"
+            "return el ? el.textContent.trim() : null;",
+            CURRENT_PAGE_XPATH
+        )
+        return text and text.isdigit() and int(text) > current_page
+
+    if not wait_until(page_advanced, timeout, description="다음 페이지 이동"):
+        return False
+    return wait_for_xpath(driver, PRODUCT_LIST_XPATH, timeout)
+
+
 def click_next_page(driver, current_page):
     """
     다음 페이지로 이동하는 함수
@@ -123,7 +230,7 @@ def click_next_page(driver, current_page):
             )
             print(f"✓ {next_page}페이지 버튼 찾음 (data-page-no)")
             next_button.click()
-            time.sleep(3)
+            _wait_for_page_number(driver, current_page)
             return True
         except:
             print(f"{next_page}페이지 직접 버튼을 찾지 못함")
@@ -135,7 +242,7 @@ def click_next_page(driver, current_page):
             )
             print(f"✓ '다음 10 페이지' 버튼 찾음")
             next_10_button.click()
-            time.sleep(3)
+            _wait_for_page_number(driver, current_page)
             return True
         except:
             print("'다음 10 페이지' 버튼을 찾지 못함")
@@ -149,7 +256,7 @@ def click_next_page(driver, current_page):
                     if page_no and int(page_no) == next_page:
                         print(f"✓ {next_page}페이지 버튼 찾음 (순회)")
                         link.click()
-                        time.sleep(3)
+                        _wait_for_page_number(driver, current_page)
                         return True
                 except:
                     continue
@@ -201,7 +308,241 @@ def has_next_page(driver, current_page):
         return False
 
 
-def crawl_products_on_current_page(driver, original_url, max_products=0):
+def crawl_detail_page(driver, product_counter, group_commit=None, store=None):
+    """
+    현재 열려있는 상세 페이지를 크롤링하여 저장합니다.
+    예외는 출력만 하고 다시 발생시키지 않습니다. (트랜잭션은 자동으로 롤백됨)
+
+    Args:
+        driver: 웹드라이버 (상세 페이지가 열려있어야 함)
+        product_counter: 현재 상품 번호 (로깅용)
+        group_commit: GroupCommit 객체 (있으면 여러 상품을 묶어서 커밋)
+        store: CatalogStore 객체 (있으면 파일 대신 SQLite 저장소에 저장)
+
+    Returns:
+        bool or None: 저장 성공 여부 (이미 저장된 상품이라 건너뛰었으면 None)
+    """
+    # ========================================
+    # 상세페이지에서 데이터 크롤링 (트랜잭션 적용)
+    # ========================================
+    # 트랜잭션을 사용하여 원자성 보장
+    # (그룹 커밋 사용 시 상품별 세이브포인트만 두고 N개마다 한 번 커밋)
+    crawl_success = False
+    try:
+        if store:
+            # SQLite 저장소 사용 시 상품마다 하나의 DB 트랜잭션으로 저장
+            crawl_product_to_store(driver, store, product_counter)
+            crawl_success = True
+        else:
+            product_scope = group_commit.product() if group_commit else FileTransaction()
+            with product_scope as transaction:
+                # 상세 페이지 크롤링 함수 호출
+                crawl_product_on_detail_page(driver, transaction, product_counter)
+                # 예외가 없으면 자동으로 commit됨
+                crawl_success = True
+
+    except ValueError as ve:
+        # 비즈니스 로직 예외 (중복 상품, 필수 데이터 누락 등)
+        print(f"✗ 상품 {product_counter} 검증 오류: {ve}")
+        print("  → 이 상품은 건너뛰고 다음 상품으로 진행합니다.")
+        # 트랜잭션은 자동으로 rollback됨
+        if is_duplicate_product_error(ve):
+            return None
+
+    except Exception as detail_error:
+        # 일반 예외 (네트워크 오류, 크롤링 실패 등)
+        print(f"✗ 상품 {product_counter} 크롤링 중 오류: {detail_error}")
+        traceback.print_exc()
+
+        # 상세 페이지 크롤링 오류 스크린샷 저장
+        try:
+            driver.save_screenshot(f"error_detail_page_{product_counter}.png")
+            print(f"상세 페이지 오류 스크린샷 저장: error_detail_page_{product_counter}.png")
+        except:
+            pass
+
+        # 트랜잭션은 자동으로 rollback됨
+
+    # 크롤링 결과 요약
+    if crawl_success:
+        print(f"✓ 상품 {product_counter} 처리 완료 및 커밋됨")
+    else:
+        print(f"✗ 상품 {product_counter} 처리 실패 및 롤백됨")
+
+    return crawl_success
+
+
+def save_collected_record(record, product_counter, group_commit=None, store=None):
+    """
+    워커가 수집한 상품 데이터를 저장합니다. (워커 풀의 writer 스레드에서만 호출)
+    예외는 출력만 하고 다시 발생시키지 않습니다. (트랜잭션은 자동으로 롤백됨)
+
+    Args:
+        record: collect_product_record()가 반환한 상품 데이터
+        product_counter: 상품 번호 (로깅용)
+        group_commit: GroupCommit 객체 (있으면 여러 상품을 묶어서 커밋)
+        store: CatalogStore 객체 (있으면 파일 대신 SQLite 저장소에 저장)
+
+    Returns:
+        bool or None: 저장 성공 여부 (이미 저장된 상품이라 건너뛰었으면 None)
+    """
+    try:
+        if store:
+            store_product_record(record, store, product_counter)
+        else:
+            product_scope = group_commit.product() if group_commit else FileTransaction()
+            with product_scope as transaction:
+                save_product_record(record, transaction, product_counter)
+
+        print(f"✓ 상품 {product_counter} 저장 완료")
+        return True
+
+    except ValueError as ve:
+        print(f"✗ 상품 {product_counter} 검증 오류: {ve}")
+        if is_duplicate_product_error(ve):
+            return None
+    except Exception as e:
+        print(f"✗ 상품 {product_counter} 저장 중 오류: {e}")
+        traceback.print_exc()
+
+    return False
+
+
+def fetch_and_save_product(fetcher, url, product_counter, group_commit=None, store=None):
+    """
+    수집기(fetcher)로 상세 페이지 데이터를 수집하여 저장합니다.
+    예외는 출력만 하고 다시 발생시키지 않습니다.
+
+    Args:
+        fetcher: page_fetcher의 수집기 객체
+        url: 상세 페이지 URL
+        product_counter: 상품 번호 (로깅용)
+        group_commit: GroupCommit 객체
+        store: CatalogStore 객체
+
+    Returns:
+        bool or None: 저장 성공 여부 (이미 저장된 상품이라 건너뛰었으면 None)
+    """
+    try:
+        record = fetcher.fetch(url, product_counter, is_duplicate=store.has_product if store else product_exists)
+    except ValueError as ve:
+        print(f"✗ 상품 {product_counter} 검증 오류: {ve}")
+        print("  → 이 상품은 건너뛰고 다음 상품으로 진행합니다.")
+        return None if is_duplicate_product_error(ve) else False
+    except Exception as e:
+        print(f"✗ 상품 {product_counter} 수집 중 오류: {e}")
+        traceback.print_exc()
+        return False
+
+    if record is None:
+        print(f"✗ 상품 {product_counter} 수집 결과가 없습니다.")
+        return False
+
+    return save_collected_record(record, product_counter, group_commit, store)
+
+
+def record_product_result(frontier, product, success, group_commit=None, error=None):
+    """
+    상품 처리 결과를 frontier에 기록합니다.
+    그룹 커밋 사용 시 저장한 상품은 디스크 커밋이 끝난 뒤 완료로 표시합니다. (커밋 전 종료되면 다음 실행에서 다시 처리)
+    이미 저장된 상품은 실패가 아닌 건너뜀으로 기록하여 다음 실행에서 다시 열지 않습니다.
+
+    Args:
+        frontier: CrawlFrontier 객체 (None이면 아무것도 하지 않음)
+        product: 상품 정보 ({"goods_no": ..., ...})
+        success: 저장 성공 여부 (None이면 이미 저장된 상품이라 건너뜀)
+        group_commit: GroupCommit 객체
+        error: 실패 원인 (로깅용)
+    """
+    if frontier is None:
+        return
+
+    goods_no = product["goods_no"]
+    if success is None or is_duplicate_product_error(error):
+        frontier.mark_skipped(goods_no, error)
+    elif not success:
+        frontier.mark_failed(goods_no, error)
+    elif group_commit:
+        group_commit.call_after_commit(lambda: frontier.mark_done(goods_no))
+    else:
+        frontier.mark_done(goods_no)
+
+
+def _save_and_record(product_urls, group_commit=None, store=None, frontier=None):
+    """워커 풀 / 멀티 탭용 저장 함수 (저장 후 frontier에 결과 기록)"""
+    def save(record, product_counter):
+        success = save_collected_record(record, product_counter, group_commit, store)
+        record_product_result(frontier, product_urls[product_counter - 1], success, group_commit)
+        return success
+
+    return save
+
+
+def crawl_products_with_workers(driver, product_urls, num_workers, group_commit=None, store=None, frontier=None):
+    """
+    2단계를 워커 풀로 실행합니다.
+    워커마다 브라우저를 하나씩 띄워 상세 페이지를 동시에 수집하고, 저장은 이 스레드에서 순서대로 합니다.
+
+    Args:
+        driver: 웹드라이버 (첫 번째 워커가 그대로 사용)
+        product_urls: harvest_all_product_urls()가 반환한 상품 리스트
+        num_workers: 워커(브라우저) 수
+        group_commit: GroupCommit 객체
+        store: CatalogStore 객체
+        frontier: CrawlFrontier 객체 (있으면 상품별 처리 결과 기록)
+
+    Returns:
+        int: 저장에 성공한 상품 수
+    """
+    # 이미 저장된 상품명 (워커는 이 집합으로만 중복 확인, 인덱스/DB는 이 스레드만 사용)
+    known_names = store.product_names() if store else set(get_product_index().products)
+
+    pool = DetailWorkerPool(create_worker_driver, num_workers, known_names=known_names, reuse_driver=driver)
+
+    def on_error(product_counter, product, error):
+        if isinstance(error, ValueError):
+            print(f"✗ 상품 {product_counter} 검증 오류: {error}")
+        else:
+            print(f"✗ 상품 {product_counter} 수집 중 오류 ({product['url']}): {error}")
+        record_product_result(frontier, product, False, error=error)
+
+    return pool.run(
+        product_urls,
+        save=_save_and_record(product_urls, group_commit, store, frontier),
+        on_error=on_error
+    )
+
+
+def crawl_products_in_tabs(driver, product_urls, num_tabs, group_commit=None, store=None, frontier=None):
+    """
+    2단계를 브라우저 하나의 탭 여러 개로 실행합니다.
+
+    Args:
+        driver: 웹드라이버
+        product_urls: harvest_all_product_urls()가 반환한 상품 리스트
+        num_tabs: 탭 수
+        group_commit: GroupCommit 객체
+        store: CatalogStore 객체
+        frontier: CrawlFrontier 객체 (있으면 상품별 처리 결과 기록)
+
+    Returns:
+        int: 저장에 성공한 상품 수
+    """
+    crawler = MultiTabCrawler(driver, num_tabs)
+
+    def on_error(product_counter, product, error):
+        print(f"✗ 상품 {product_counter} 수집 실패: {error}")
+        record_product_result(frontier, product, False, error=error)
+
+    return crawler.run(
+        product_urls,
+        save=_save_and_record(product_urls, group_commit, store, frontier),
+        is_duplicate=store.has_product if store else product_exists,
+        on_error=on_error
+    )
+
+
+def crawl_products_on_current_page(driver, original_url, max_products=0, group_commit=None, store=None):
     """
     현재 페이지의 모든 상품을 크롤링하는 함수
 
@@ -209,6 +550,8 @@ def crawl_products_on_current_page(driver, original_url, max_products=0):
         driver: 웹드라이버
         original_url: 현재 페이지 URL
         max_products: 최대 크롤링할 상품 수 (0이면 모두)
+        group_commit: GroupCommit 객체 (있으면 여러 상품을 묶어서 커밋)
+        store: CatalogStore 객체 (있으면 파일 대신 SQLite 저장소에 저장)
 
     Returns:
         int: 처리한 상품 수
@@ -264,49 +607,17 @@ def crawl_products_on_current_page(driver, original_url, max_products=0):
 
                         # 상품 클릭
                         product_link.click()
-                        time.sleep(5)  # 상세 페이지 로딩 대기
+
+                        # 상세 페이지 로딩 대기 (상품명이 나타나면 바로 진행)
+                        wait_for_url_change(driver, original_url)
+                        wait_for_xpath(driver, PRODUCT_NAME_XPATH)
 
                         # 상세 페이지 URL 저장
                         detail_url = driver.current_url
                         print(f"상세 페이지 URL: {detail_url}")
 
-                        # ========================================
                         # 상세페이지에서 데이터 크롤링 (트랜잭션 적용)
-                        # ========================================
-                        # 트랜잭션을 사용하여 원자성 보장
-                        crawl_success = False
-                        try:
-                            with FileTransaction() as transaction:
-                                # 상세 페이지 크롤링 함수 호출
-                                crawl_product_on_detail_page(driver, transaction, product_counter)
-                                # 예외가 없으면 자동으로 commit됨
-                                crawl_success = True
-
-                        except ValueError as ve:
-                            # 비즈니스 로직 예외 (중복 상품, 필수 데이터 누락 등)
-                            print(f"✗ 상품 {product_counter} 검증 오류: {ve}")
-                            print("  → 이 상품은 건너뛰고 다음 상품으로 진행합니다.")
-                            # 트랜잭션은 자동으로 rollback됨
-
-                        except Exception as detail_error:
-                            # 일반 예외 (네트워크 오류, 크롤링 실패 등)
-                            print(f"✗ 상품 {product_counter} 크롤링 중 오류: {detail_error}")
-                            traceback.print_exc()
-
-                            # 상세 페이지 크롤링 오류 스크린샷 저장
-                            try:
-                                driver.save_screenshot(f"error_detail_page_{product_counter}.png")
-                                print(f"상세 페이지 오류 스크린샷 저장: error_detail_page_{product_counter}.png")
-                            except:
-                                pass
-
-                            # 트랜잭션은 자동으로 rollback됨
-
-                        # 크롤링 결과 요약
-                        if crawl_success:
-                            print(f"✓ 상품 {product_counter} 처리 완료 및 커밋됨")
-                        else:
-                            print(f"✗ 상품 {product_counter} 처리 실패 및 롤백됨")
+                        crawl_detail_page(driver, product_counter, group_commit, store)
 
                         # 트랜잭션 블록 밖에서 뒤로가기 (성공/실패 여부와 관계없이)
                         try:
@@ -319,15 +630,16 @@ def crawl_products_on_current_page(driver, original_url, max_products=0):
                             try:
                                 print("원본 페이지로 직접 이동 재시도...")
                                 driver.get(original_url)
-                                time.sleep(3)
+                                wait_for_xpath(driver, PRODUCT_LIST_XPATH)
                                 print("✓ 원본 페이지로 복귀 성공")
                             except Exception as navigate_error:
                                 print(f"✗ 원본 페이지 복귀 실패: {navigate_error}")
                                 # 이 경우에도 계속 진행하도록 함
                                 pass
 
-                        # 상품 간 약간의 대기 시간 추가
-                        time.sleep(2)
+                        # 상품 간 추가 대기 (설정한 경우만)
+                        if PRODUCT_DELAY:
+                            time.sleep(PRODUCT_DELAY)
 
                     except Exception as e:
                         print(f"상품 {product_counter} 처리 중 오류: {e}")
@@ -364,7 +676,193 @@ def crawl_products_on_current_page(driver, original_url, max_products=0):
     return product_counter
 
 
-def crawl_all_products(driver, start_url, max_products=0):
+def harvest_product_urls_on_current_page(driver):
+    """
+    현재 목록 페이지의 상품 링크를 스크립트 한 번으로 모두 가져옵니다.
+    (crawl_products_on_current_page와 같은 //*[@id="Contents"]/ul[2~]/li/div/a 링크, 상품번호가 있는 링크만)
+
+    Returns:
+        list of dict: [{"goods_no": 상품번호, "url": 상세 페이지 URL, "name": 상품명}, ...]
+    """
+    links = driver.execute_script("return " + PRODUCT_LINKS_JS + """.map(function (a) {
+            var href = a.href || '';
+            var match = href.match(/goodsNo=([A-Za-z0-9]+)/);
+            return {
+                goods_no: a.getAttribute('data-ref-goodsno') || (match ? match[1] : null),
+                url: href.indexOf('http') === 0 ? href : null,
+                name: (a.getAttribute('title') || a.textContent || '').trim()
+            };
+        });
+    """)
+
+    products = []
+    for link in links or []:
+        if not link.get("goods_no"):
+            continue
+        if not link.get("url"):
+            link["url"] = GOODS_DETAIL_URL.format(goods_no=link["goods_no"])
+        products.append(link)
+
+    return products
+
+
+def _iter_pages_by_click(driver):
+    """현재 목록 페이지부터 페이지 버튼을 클릭하며 페이지 번호를 돌려줍니다."""
+    while True:
+        current_page = get_current_page_number(driver)
+        if current_page is None:
+            print("현재 페이지 번호를 확인할 수 없습니다. URL 수집 중단.")
+            return
+
+        yield current_page
+
+        if not has_next_page(driver, current_page) or not click_next_page(driver, current_page):
+            return
+
+
+def harvest_all_product_urls(driver, max_products=0, paginator=None):
+    """
+    1단계: 첫 목록 페이지부터 마지막 페이지까지 이동하며 상품 상세 URL을 수집합니다.
+    같은 상품(goodsNo)은 한 번만 수집합니다.
+
+    Args:
+        driver: 웹드라이버 (paginator가 없으면 첫 목록 페이지가 열려있어야 함)
+        max_products: 최대 수집할 상품 수 (0이면 모두)
+        paginator: ListingPaginator 객체 (있으면 URL 파라미터로 페이지 이동, 없으면 버튼 클릭)
+
+    Returns:
+        list of dict: harvest_product_urls_on_current_page()와 같은 형식
+    """
+    product_urls = []
+    seen = set()
+
+    pages = paginator.iter_pages(driver) if paginator else _iter_pages_by_click(driver)
+
+    for current_page in pages:
+        page_products = harvest_product_urls_on_current_page(driver)
+        for product in page_products:
+            if product["goods_no"] in seen:
+                continue
+            seen.add(product["goods_no"])
+            product_urls.append(product)
+
+        print(f"페이지 {current_page}: 상품 URL {len(page_products)}개 수집 (누적 {len(product_urls)}개)")
+
+        if max_products > 0 and len(product_urls) >= max_products:
+            product_urls = product_urls[:max_products]
+            break
+
+    return product_urls
+
+
+def harvest_into_frontier(driver, frontier, max_products=0, paginator=None):
+    """
+    1단계 (진행 상태 저장): 이전 실행에서 수집하지 않은 목록 페이지부터 상품 URL을 수집하여 frontier에 추가하고,
+    아직 저장하지 않은 상품을 돌려줍니다.
+    목록을 이미 모두 수집했거나 처리할 상품이 max_products개 이상 남아있으면 목록 페이지를 열지 않습니다.
+    (페이지 버튼 클릭 방식은 페이지로 바로 이동할 수 없으므로 현재 페이지부터 다시 수집, 수집한 상품은 중복 추가되지 않음)
+
+    Args:
+        driver: 웹드라이버 (paginator가 없으면 첫 목록 페이지가 열려있어야 함)
+        frontier: CrawlFrontier 객체
+        max_products: 이번 실행에서 처리할 최대 상품 수 (0이면 모두)
+        paginator: ListingPaginator 객체 (있으면 URL 파라미터로 멈춘 페이지부터 이동)
+
+    Returns:
+        list of dict: 처리할 상품 (harvest_product_urls_on_current_page()와 같은 형식, 목록 순서)
+    """
+    def has_enough_products():
+        return max_products > 0 and len(frontier.pending_products(max_products)) >= max_products
+
+    if frontier.listing_complete or has_enough_products():
+        print(f"[Frontier] 저장된 상품 URL로 이어서 진행합니다. ({frontier.summary()})")
+        return frontier.pending_products(max_products)
+
+    start_page = frontier.next_listing_page() if paginator else 1
+    if start_page > 1:
+        print(f"[Frontier] {start_page}페이지부터 상품 URL 수집을 이어서 진행합니다. ({frontier.summary()})")
+
+    pages = paginator.iter_pages(driver, start_page) if paginator else _iter_pages_by_click(driver)
+
+    for current_page in pages:
+        page_products = harvest_product_urls_on_current_page(driver)
+        added = frontier.add_listing_page(current_page, page_products, paginator.last_page if paginator else None)
+        print(f"페이지 {current_page}: 상품 URL {len(page_products)}개 수집 (새 상품 {added}개)")
+
+        if has_enough_products():
+            break
+    else:
+        if paginator and not frontier.listing_complete:
+            if paginator.reached_end:
+                # 전체 상품 수를 모른 채 상품이 적거나 없는 페이지에서 멈춤 (다음 실행에서 목록 페이지를 열지 않음)
+                frontier.mark_listing_complete()
+            else:
+                # 목록 로딩 실패로 멈췄으면 다음 실행에서 이 페이지부터 다시 수집
+                frontier.mark_listing_page_failed(frontier.next_listing_page())
+
+    return frontier.pending_products(max_products)
+
+
+def crawl_product_urls(driver, product_urls, group_commit=None, store=None, fetcher=None, supervisor=None,
+                       frontier=None):
+    """
+    2단계: 수집한 상세 페이지 URL로 직접 이동하며 상품을 크롤링합니다.
+    (상품마다 목록 페이지를 다시 불러오지 않음)
+
+    Args:
+        driver: 웹드라이버
+        product_urls: harvest_all_product_urls()가 반환한 상품 리스트
+        group_commit: GroupCommit 객체 (있으면 여러 상품을 묶어서 커밋)
+        store: CatalogStore 객체 (있으면 파일 대신 SQLite 저장소에 저장)
+        fetcher: 상세 페이지 수집기 (있으면 driver로 직접 이동하지 않고 fetcher.fetch()로 수집)
+        supervisor: DriverSupervisor 객체 (있으면 상세 페이지 이동을 맡기고, 재시작되면 새 드라이버로 계속 진행)
+        frontier: CrawlFrontier 객체 (있으면 상품별 처리 상태 기록)
+
+    Returns:
+        int: 처리한 상품 수
+    """
+    product_counter = 0
+
+    for product in product_urls:
+        product_counter += 1
+        print(f"\n{'─' * 30}")
+        print(f"상품 {product_counter}/{len(product_urls)}: {product['name'] or product['goods_no']}")
+        print(f"상세 페이지 URL: {product['url']}")
+
+        if frontier:
+            frontier.mark_in_progress(product["goods_no"])
+
+        if fetcher:
+            success = fetch_and_save_product(fetcher, product["url"], product_counter, group_commit, store)
+            record_product_result(frontier, product, success, group_commit)
+            continue
+
+        try:
+            if supervisor:
+                # 필요하면 브라우저를 재시작한 뒤 이동 (현재 상품부터 이어서 진행)
+                driver = supervisor.open_page(product["url"], PRODUCT_NAME_XPATH)
+            else:
+                driver.get(product["url"])
+
+                # 상세 페이지 로딩 대기 (상품명이 나타나면 바로 진행)
+                wait_for_xpath(driver, PRODUCT_NAME_XPATH)
+        except Exception as e:
+            print(f"✗ 상품 {product_counter} 상세 페이지 이동 실패: {e}")
+            record_product_result(frontier, product, False, error=e)
+            continue
+
+        success = crawl_detail_page(driver, product_counter, group_commit, store)
+        record_product_result(frontier, product, success, group_commit)
+
+        # 상품 간 추가 대기 (설정한 경우만)
+        if PRODUCT_DELAY:
+            time.sleep(PRODUCT_DELAY)
+
+    return product_counter
+
+
+def crawl_all_products(driver, start_url, max_products=0, commit_batch_size=20, commit_interval=60, store=None,
+                       two_phase=TWO_PHASE_CRAWL, supervisor=None):
     """
     모든 페이지의 상품을 크롤링하는 메인 함수
 
@@ -372,14 +870,86 @@ def crawl_all_products(driver, start_url, max_products=0):
         driver: 웹드라이버
         start_url: 시작 URL
         max_products: 최대 크롤링할 상품 수 (0이면 모두)
+        commit_batch_size: 한 번에 커밋할 상품 수 (1이면 상품마다 커밋)
+        commit_interval: 마지막 커밋 이후 이 시간(초)이 지나면 커밋
+        store: CatalogStore 객체 (있으면 파일 대신 SQLite 저장소에 저장)
+        two_phase: True면 상품 URL을 먼저 모두 수집한 뒤 상세 페이지로 직접 이동 (TWO_PHASE_CRAWL)
+        supervisor: driver를 감시하는 DriverSupervisor 객체 (있으면 2단계 상세 페이지 이동을 맡김,
+                    재시작하면 supervisor.driver가 새 드라이버가 되며 종료는 호출한 쪽에서 supervisor.close()로)
     """
-    driver.get(start_url)
-    time.sleep(10)  # Cloudflare 우회 대기
+    # URL 페이지네이션 사용 시 첫 페이지부터 rowsPerPage를 적용한 URL로 접속
+    paginator = ListingPaginator(start_url, ROWS_PER_PAGE) if two_phase and USE_URL_PAGINATION else None
+    driver.get(paginator.page_url(1) if paginator else start_url)
+
+    # Cloudflare 우회 대기 (상품 목록이 나타나면 바로 진행, 복원한 세션이 유효하면 대기 없음)
+    if wait_for_xpath(driver, PRODUCT_LIST_XPATH, timeout=START_PAGE_TIMEOUT) and USE_PERSISTENT_SESSION:
+        # 확인을 통과한 세션 저장 (다음 실행과 워커 풀의 다른 브라우저에서 복원)
+        save_session(driver)
 
     print("페이지 제목:", driver.title)
 
     total_products_crawled = 0
 
+    # 그룹 커밋 (상품별 세이브포인트, N개 또는 T초마다 디스크 커밋)
+    group_commit = GroupCommit(batch_size=commit_batch_size, interval=commit_interval)
+
+    # 진행 상태 (목록 페이지 / 상품별 처리 상태, 다시 실행하면 이어서 진행)
+    frontier = CrawlFrontier(start_url, ROWS_PER_PAGE if paginator else None) if two_phase and USE_CRAWL_FRONTIER \
+        else None
+
+    try:
+        if two_phase:
+            print("\n[1단계] 목록 페이지에서 상품 URL 수집 중...")
+            if frontier:
+                product_urls = harvest_into_frontier(driver, frontier, max_products, paginator)
+                print(f"✓ 처리할 상품 {len(product_urls)}개 ({frontier.summary()})")
+            else:
+                product_urls = harvest_all_product_urls(driver, max_products, paginator)
+                print(f"✓ 상품 URL {len(product_urls)}개 수집 완료")
+
+            print("\n[2단계] 상세 페이지 크롤링 시작...")
+            if NUM_WORKERS > 1:
+                total_products_crawled = crawl_products_with_workers(
+                    driver, product_urls, NUM_WORKERS, group_commit, store, frontier
+                )
+            elif NUM_TABS > 1:
+                total_products_crawled = crawl_products_in_tabs(
+                    driver, product_urls, NUM_TABS, group_commit, store, frontier
+                )
+            else:
+                fetcher = FallbackFetcher(HttpFetcher(), SeleniumFetcher(driver)) if USE_HTTP_FETCHER else None
+                total_products_crawled = crawl_product_urls(
+                    driver, product_urls, group_commit, store, fetcher, None if fetcher else supervisor, frontier
+                )
+                if fetcher:
+                    print(f"수집 방식별 상품 수: {fetcher.counts}")
+        else:
+            total_products_crawled = _crawl_pages(driver, max_products, group_commit, store)
+    finally:
+        # 남은 상품 커밋 (커밋 후 frontier에 완료 기록)
+        group_commit.close()
+        if frontier:
+            print(f"[Frontier] {frontier.summary()}")
+            frontier.close()
+
+    print(f"\n{'=' * 60}")
+    print(f"크롤링 완료!")
+    final_page = None if two_phase else get_current_page_number(driver)
+    if final_page:
+        print(f"마지막 처리 페이지: {final_page}")
+    print(f"총 처리한 상품 수: {total_products_crawled}")
+    print(f"{'=' * 60}")
+
+
+def _crawl_pages(driver, max_products, group_commit, store=None):
+    """
+    현재 페이지부터 다음 페이지로 이동하며 상품을 크롤링합니다.
+
+    Returns:
+        int: 처리한 상품 수
+    """
+    total_products_crawled = 0
+
     while True:
         # 현재 페이지 번호 확인
         current_page = get_current_page_number(driver)
@@ -398,7 +968,7 @@ def crawl_all_products(driver, start_url, max_products=0):
         # 현재 페이지의 상품 크롤링
         remaining_products = max_products - total_products_crawled if max_products > 0 else 0
         products_crawled = crawl_products_on_current_page(
-            driver, current_page_url, remaining_products
+            driver, current_page_url, remaining_products, group_commit, store
         )
 
         total_products_crawled += products_crawled
@@ -424,9 +994,6 @@ def crawl_all_products(driver, start_url, max_products=0):
             print(f"✗ 다음 페이지로 이동 실패. 크롤링 중단.")
             break
 
-        # 페이지 로딩 대기
-        time.sleep(3)
-
         # 페이지 이동 확인
         new_page = get_current_page_number(driver)
         if new_page and new_page > current_page:
@@ -435,28 +1002,30 @@ def crawl_all_products(driver, start_url, max_products=0):
             print(f"✗ 페이지 이동 실패 또는 페이지 번호 확인 불가")
             # 재시도
             driver.refresh()
-            time.sleep(3)
+            wait_for_xpath(driver, CURRENT_PAGE_XPATH)
             new_page = get_current_page_number(driver)
             if not new_page or new_page <= current_page:
                 print("재시도 실패. 크롤링 중단.")
                 break
 
-    print(f"\n{'=' * 60}")
-    print(f"크롤링 완료!")
-    final_page = get_current_page_number(driver)
-    if final_page:
-        print(f"마지막 처리 페이지: {final_page}")
-    print(f"총 처리한 상품 수: {total_products_crawled}")
-    print(f"{'=' * 60}")
+    return total_products_crawled
 
 
 def main():
     """메인 실행 함수"""
     driver = None
+    supervisor = None
 
     try:
         # 드라이버 생성
         driver = create_driver()
+        if USE_DRIVER_SUPERVISOR:
+            # 브라우저 재시작을 맡기고 종료도 supervisor가 담당
+            # (재시작 전에 세션을 저장해 두면 새 브라우저가 Cloudflare 확인 없이 이어서 진행)
+            supervisor = DriverSupervisor(
+                create_driver, driver=driver, max_pages=RECYCLE_AFTER_PAGES,
+                before_quit=save_session if USE_PERSISTENT_SESSION else None
+            )
 
         # 시작 URL
         # 클렌징 비누
@@ -513,13 +1082,23 @@ def main():
             print(f"{max_products}개의 상품을 크롤링합니다...")
 
         # 크롤링 실행
-        crawl_all_products(driver, url, max_products)
+        if USE_CATALOG_STORE:
+            with CatalogStore() as store:
+                crawl_all_products(driver, url, max_products, store=store, supervisor=supervisor)
+                store.export_sql()
+        else:
+            initialize_output_files()
+            crawl_all_products(driver, url, max_products, supervisor=supervisor)
 
     except Exception as e:
         print(f"메인 실행 중 오류: {e}")
         traceback.print_exc()
 
     finally:
+        # 브라우저를 재시작했으면 처음 만든 드라이버는 이미 종료됨 (현재 드라이버로 마무리)
+        if supervisor:
+            driver = supervisor.driver
+
         # 드라이버 종료
         if driver:
             print("\n드라이버 종료 시도 중...")
@@ -531,28 +1110,34 @@ def main():
             except:
                 pass
 
-            try:
-                # 1. 먼저 모든 창 닫기
-                for handle in driver.window_handles:
-                    try:
-                        driver.switch_to.window(handle)
-                        driver.close()
-                        time.sleep(0.1)
-                    except:
-                        pass
+            if supervisor:
+                # 종료는 supervisor 한 곳에서 (세션 저장 후 현재 드라이버 quit)
+                print(f"[Supervisor] {supervisor.summary()}")
+                supervisor.close()
+                print("✓ 드라이버 종료 프로세스 완료")
+            else:
+                try:
+                    # 1. 먼저 모든 창 닫기
+                    for handle in driver.window_handles:
+                        try:
+                            driver.switch_to.window(handle)
+                            driver.close()
+                            time.sleep(0.1)
+                        except:
+                            pass
 
-                # 2. 명시적으로 드라이버 참조 제거 (메모리 해제)
-                driver_ref = driver
-                del driver
+                    # 2. 명시적으로 드라이버 참조 제거 (메모리 해제)
+                    driver_ref = driver
+                    del driver
 
-                # 3. garbage collection 강제 실행
-                import gc
-                gc.collect()
+                    # 3. garbage collection 강제 실행
+                    import gc
+                    gc.collect()
 
-                print("✓ 드라이버 종료 프로세스 완료")
+                    print("✓ 드라이버 종료 프로세스 완료")
 
-            except Exception as e:
-                print(f"✗ 드라이버 종료 중 오류 발생 (무시): {e}")
+                except Exception as e:
+                    print(f"✗ 드라이버 종료 중 오류 발생 (무시): {e}")
 
             print("프로그램 완전 종료")
 
@@ -0,0 +1,27 @@
+"""
+공통 테스트 픽스처
+모든 테스트는 임시 디렉토리(tmp_path)에서 실행하여 저장소에 데이터 파일을 남기지 않습니다.
+"""
+
+import pytest
+
+from id_sequence import IdSequence
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def get_sequence(tmp_path):
+    """임시 디렉토리의 데이터베이스를 사용하는 id_sequence.get_sequence 대체 함수 (프로세스 공유 시퀀스 대체)"""
+    sequences = {}
+
+    def get_sequence(name, seed=None):
+        if name not in sequences:
+            sequences[name] = IdSequence(name, seed=seed, block_size=10, db_path=str(tmp_path / "id_sequences.db"))
+        return sequences[name]
+
+    return get_sequence
@@ -0,0 +1,136 @@
+"""
+CatalogStore 테스트 (인메모리 SQLite)
+상품 저장 트랜잭션, 중복 확인, 기존 JSON 데이터 가져오기, SQL 내보내기를 확인합니다.
+"""
+
+import json
+
+import pytest
+
+import catalog_store
+import product_mapping
+from catalog_store import CatalogStore
+from file_transaction import FileTransaction
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(monkeypatch, get_sequence):
+    # 프로세스에 캐시된 상품명 인덱스를 비워 임시 디렉토리의 파일을 읽게 함
+    monkeypatch.setattr(product_mapping, "_product_index", None)
+    # 파일 저장 방식과 같은 공유 시퀀스를 임시 디렉토리의 데이터베이스로 사용
+    monkeypatch.setattr(catalog_store, "get_sequence", get_sequence)
+    monkeypatch.setattr(product_mapping, "get_sequence", get_sequence)
+
+
+@pytest.fixture
+def store():
+    with CatalogStore(":memory:") as store:
+        yield store
+
+
+def make_record(product_name, brand="라운드랩", options=None):
+    return {
+        "brand": brand,
+        "category_id": 60,
+        "product_name": product_name,
+        "main_image_urls": ["https://img.example/main1.jpg", "https://img.example/main2.jpg"],
+        "detail_info": {"내용물의 용량 또는 중량": "200ml", "제조국": "대한민국"},
+        "detail_image_urls": ["https://img.example/detail1.jpg"],
+        "product_options": options or [
+            {"name": "200ml", "price": "15000", "image_url": "https://img.example/opt.jpg", "is_soldout": False},
+        ],
+    }
+
+
+def test_save_product_writes_all_tables(store):
+    product_id = store.save_product(make_record("독도 토너 200ml"))
+
+    assert product_id == 1
+    assert store.has_product("독도 토너 200ml")
+    assert store.counts() == {
+        "brands": 1, "products": 1, "product_detail_info": 1, "product_main_images": 2,
+        "product_detail_images": 1, "product_options": 1,
+    }
+
+
+def test_brand_is_reused_and_ids_advance(store):
+    store.save_product(make_record("상품 A"))
+    second_id = store.save_product(make_record("상품 B"))
+    store.save_product(make_record("상품 C", brand="토리든"))
+
+    assert second_id == 2
+    assert store.counts()["brands"] == 2
+    assert store.product_names() == {"상품 A", "상품 B", "상품 C"}
+
+
+def test_duplicate_product_is_rejected_without_partial_rows(store):
+    store.save_product(make_record("독도 토너 200ml"))
+    before = store.counts()
+
+    with pytest.raises(ValueError, match="이미 존재하는 제품명"):
+        store.save_product(make_record("독도 토너 200ml", brand="새 브랜드"))
+
+    assert store.counts() == before
+
+
+def test_failed_product_is_rolled_back(store):
+    # 옵션 행을 만들다가 실패하면 앞에서 넣은 상품/이미지 행도 함께 롤백
+    with pytest.raises(AttributeError):
+        store.save_product(make_record("깨진 상품", options=[None]))
+
+    assert not store.has_product("깨진 상품")
+    assert store.counts()["products"] == 0
+    assert store.save_product(make_record("정상 상품")) == 1
+
+
+def test_seeds_ids_and_names_from_legacy_json(workdir):
+    (workdir / "brand_data.json").write_text(json.dumps({"brands": {"라운드랩": 7}, "next_id": 8}),
+                                             encoding="utf-8")
+    (workdir / "detailinfo_data.json").write_text(json.dumps({"last_id": 40, "next_id": 41}), encoding="utf-8")
+    (workdir / "product_data.json").write_text(json.dumps({"products": {"기존 상품": 99}, "next_id": 100}),
+                                               encoding="utf-8")
+
+    with CatalogStore(":memory:") as store:
+        assert store.has_product("기존 상품")
+        assert store.save_product(make_record("새 상품")) == 100
+        brand_id, detail_info_id = store.conn.execute(
+            "SELECT brand_id, product_detail_info_id FROM products WHERE id = 100"
+        ).fetchone()
+
+    assert (brand_id, detail_info_id) == (7, 41)
+
+
+def test_export_sql_batches_insert_statements(store, workdir):
+    for number in range(3):
+        store.save_product(make_record(f"상품 {number}"))
+
+    results = store.export_sql(output_dir="export", batch_size=2)
+
+    assert results["product_data_sql.txt"] == 3
+    assert results["brand_sql.txt"] == 1
+    products_sql = (workdir / "export" / "product_data_sql.txt").read_text(encoding="utf-8")
+    assert products_sql.count("INSERT INTO") == 2
+    assert products_sql.rstrip().endswith(";")
+    assert "'상품 2'" in products_sql
+
+
+def test_ids_do_not_overlap_with_file_backend(store):
+    store.save_product(make_record("저장소 상품"))
+
+    # 같은 실행에서 파일 저장 방식으로 상품 ID를 할당해도 공유 시퀀스를 사용
+    with FileTransaction() as transaction:
+        file_id = product_mapping.create_product_id_with_transaction("파일 상품", transaction)
+    second_id = store.save_product(make_record("저장소 상품 2"))
+
+    assert len({1, file_id, second_id}) == 3
+
+
+def test_existing_catalog_ids_are_not_reused(workdir):
+    db_path = str(workdir / "catalog.db")
+    with CatalogStore(db_path) as store:
+        # 공유 시퀀스를 사용하기 전에 저장된 상품
+        store.conn.execute("INSERT INTO products (id, product_detail_info_id, brand_id, category_id, product_name, "
+                           "created_at) VALUES (50, 50, NULL, 60, '이전 상품', '2024-01-01 00:00:00')")
+
+    with CatalogStore(db_path) as store:
+        assert store.save_product(make_record("새 상품")) == 51
@@ -0,0 +1,120 @@
+"""
+CrawlFrontier 테스트
+데이터베이스를 다시 열어 중단된 크롤링을 이어가는 경우(목록 페이지, 처리 중 상품, 실패 재시도)를 확인합니다.
+"""
+
+import pytest
+
+import crawl_frontier
+from crawl_frontier import DONE, FAILED, IN_PROGRESS, PENDING, SKIPPED, CrawlFrontier
+
+START_URL = ("https://www.oliveyoung.co.kr/store/display/getMCategoryList.do"
+             "?dispCatNo=100000100010013&pageIdx=1&rowsPerPage=48")
+OTHER_URL = "https://www.oliveyoung.co.kr/store/display/getMCategoryList.do?dispCatNo=100000100010014"
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "crawl_frontier.db")
+
+
+def products(*numbers):
+    return [{"goods_no": f"A{number:03d}", "url": f"https://example.com/goods/{number}", "name": f"상품 {number}"}
+            for number in numbers]
+
+
+def goods_numbers(frontier):
+    return [product["goods_no"] for product in frontier.pending_products()]
+
+
+def test_resumes_after_last_collected_page(db_path):
+    with CrawlFrontier(START_URL, rows_per_page=48, db_path=db_path) as frontier:
+        assert frontier.next_listing_page() == 1
+        assert frontier.add_listing_page(1, products(1, 2)) == 2
+        frontier.add_listing_page(2, products(3))
+        frontier.mark_listing_page_failed(3)
+
+    # 페이지 파라미터만 다른 URL도 같은 목록
+    with CrawlFrontier(START_URL.replace("pageIdx=1", "pageIdx=7"), rows_per_page=48, db_path=db_path) as frontier:
+        assert frontier.next_listing_page() == 3
+        assert not frontier.listing_complete
+        assert goods_numbers(frontier) == ["A001", "A002", "A003"]
+
+
+def test_listing_is_complete_at_last_page_or_end(db_path):
+    with CrawlFrontier(START_URL, rows_per_page=48, db_path=db_path) as frontier:
+        frontier.add_listing_page(1, products(1), last_page=2)
+        assert not frontier.listing_complete
+        frontier.add_listing_page(2, products(2), last_page=2)
+        assert frontier.listing_complete
+
+    with CrawlFrontier(OTHER_URL, rows_per_page=48, db_path=db_path) as frontier:
+        frontier.add_listing_page(1, products(3))
+        frontier.mark_listing_complete()
+        assert frontier.listing_complete
+        assert "목록 완료" in frontier.summary()
+
+
+def test_rows_per_page_change_restarts_listing(db_path):
+    with CrawlFrontier(START_URL, rows_per_page=24, db_path=db_path) as frontier:
+        frontier.add_listing_page(1, products(1), last_page=1)
+        frontier.mark_done("A001")
+
+    with CrawlFrontier(START_URL, rows_per_page=48, db_path=db_path) as frontier:
+        assert frontier.next_listing_page() == 1
+        assert not frontier.listing_complete
+        # 상품 상태는 유지
+        assert frontier.counts()[DONE] == 1
+
+
+def test_in_progress_products_are_recovered_on_reopen(db_path):
+    with CrawlFrontier(START_URL, db_path=db_path) as frontier:
+        frontier.add_listing_page(1, products(1, 2))
+        frontier.mark_in_progress("A001")
+        assert frontier.counts()[IN_PROGRESS] == 1
+
+    with CrawlFrontier(START_URL, db_path=db_path) as frontier:
+        assert frontier.counts()[IN_PROGRESS] == 0
+        assert goods_numbers(frontier) == ["A001", "A002"]
+
+
+def test_failed_products_are_retried_until_max_attempts(db_path, monkeypatch):
+    monkeypatch.setattr(crawl_frontier, "MAX_ATTEMPTS", 2)
+
+    with CrawlFrontier(START_URL, db_path=db_path) as frontier:
+        frontier.add_listing_page(1, products(1))
+        for attempt in range(1, 3):
+            assert goods_numbers(frontier) == ["A001"]
+            # 처리 시작만으로는 시도 횟수가 늘지 않음
+            frontier.mark_in_progress("A001")
+            frontier.mark_failed("A001", ValueError(f"{attempt}번째 실패"))
+
+        assert goods_numbers(frontier) == []
+        assert frontier.counts()[FAILED] == 1
+        attempts, last_error = frontier.conn.execute(
+            "SELECT attempts, last_error FROM products WHERE goods_no = 'A001'").fetchone()
+        assert (attempts, last_error) == (2, "2번째 실패")
+
+
+def test_done_and_skipped_products_are_not_returned(db_path):
+    with CrawlFrontier(START_URL, db_path=db_path) as frontier:
+        frontier.add_listing_page(1, products(1, 2, 3))
+        frontier.mark_done("A001")
+        frontier.mark_skipped("A002", "이미 존재하는 제품명입니다.")
+
+        assert goods_numbers(frontier) == ["A003"]
+        assert frontier.counts() == {PENDING: 1, IN_PROGRESS: 0, DONE: 1, SKIPPED: 1, FAILED: 0}
+        assert "건너뜀 1개" in frontier.summary()
+        assert frontier.pending_products(limit=1) == products(3)
+
+
+def test_product_shared_between_listings_keeps_its_status(db_path):
+    with CrawlFrontier(START_URL, db_path=db_path) as frontier:
+        frontier.add_listing_page(1, products(1, 2))
+        frontier.mark_done("A002")
+
+    with CrawlFrontier(OTHER_URL, db_path=db_path) as frontier:
+        # 이미 있는 상품은 새로 추가되지 않고 다른 목록에서 저장한 상품은 다시 열지 않음
+        assert frontier.add_listing_page(1, products(2, 3)) == 1
+        assert goods_numbers(frontier) == ["A003"]
+        assert frontier.counts()[DONE] == 1
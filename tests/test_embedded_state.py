@@ -0,0 +1,98 @@
+"""
+embedded_state 오프라인 테스트
+저장해 둔 상태 JSON(fixtures/product_state.json)을 __NEXT_DATA__ script 태그에 넣어 브라우저 없이 파싱합니다.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from embedded_state import (IMAGE_BASE_URL, extract_product_state, merge_pages, parse_embedded_state,
+                            read_embedded_state)
+
+FIXTURE = Path(__file__).parent / "fixtures" / "product_state.json"
+IMAGE_PATH = "10/0000/0018/A0000001842280{}ko.jpg"
+
+
+@pytest.fixture
+def state_json():
+    return FIXTURE.read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def state(state_json):
+    return json.loads(state_json)
+
+
+def page_html(body):
+    return f'<html><body><div id="__next"></div><script id="__NEXT_DATA__" type="application/json">{body}</script></body></html>'
+
+
+class FakeStateDriver:
+    """상태 JSON 문자열만 돌려주는 가짜 드라이버"""
+
+    def __init__(self, text):
+        self.text = text
+
+    def execute_script(self, script, *args):
+        return self.text
+
+
+def test_parse_embedded_state(state_json, state):
+    assert parse_embedded_state(page_html(state_json)) == state
+    assert parse_embedded_state("<html><body></body></html>") is None
+    assert parse_embedded_state(page_html("{깨진 JSON")) is None
+
+
+def test_read_embedded_state(state_json, state):
+    assert read_embedded_state(FakeStateDriver(state_json)) == state
+    assert read_embedded_state(FakeStateDriver(None)) is None
+
+
+def test_extract_product_state(state):
+    page = extract_product_state(state)
+
+    # 1~3차 카테고리명 중 카테고리 매핑에 있는 이름 사용
+    assert page["category"] == "스킨/토너"
+    assert page["brand"] == "라운드랩"
+    assert page["product_name"] == "라운드랩 1025 독도 토너 200ml"
+    # 상대 경로와 "//" 경로를 절대 URL로 변환, 중복 이미지 제거
+    assert page["main_image_urls"] == [IMAGE_BASE_URL + IMAGE_PATH.format(1), IMAGE_BASE_URL + IMAGE_PATH.format(2)]
+    # lazy loading 속성(data-src) 우선, data:image 자리표시자 제외
+    assert page["detail_image_urls"] == ["https://image.oliveyoung.co.kr/detail1.jpg",
+                                         "https://image.oliveyoung.co.kr/detail2.jpg"]
+    assert page["product_options"] == [
+        {"index": 1, "name": "[단독] 독도 토너 200ml", "price": "15000",
+         "image_url": "https://image.oliveyoung.co.kr/opt1.jpg", "is_soldout": False},
+        {"index": 2, "name": "독도 토너 500ml", "price": "25900",
+         "image_url": "https://image.oliveyoung.co.kr/opt2.jpg", "is_soldout": True},
+    ]
+    assert page["detail_info"] == {"내용물의 용량 또는 중량": "200ml", "제조국": "대한민국"}
+
+
+def test_detail_image_list_is_preferred_over_html(state):
+    goods = state["props"]["pageProps"]["goods"]
+    goods["detailImageList"] = [{"url": "detail/a.jpg"}]
+
+    assert extract_product_state(state)["detail_image_urls"] == [IMAGE_BASE_URL + "detail/a.jpg"]
+
+
+def test_state_without_product_model_is_empty():
+    page = extract_product_state({"props": {"pageProps": {"goodsName": "상품번호 없는 객체"}}})
+
+    assert page["product_name"] is None
+    assert page["product_options"] == []
+    assert extract_product_state(None)["detail_info"] == {}
+
+
+def test_merge_pages_fills_only_empty_fields(state):
+    primary = extract_product_state(state)
+    primary["detail_info"] = {}
+    secondary = {"category": "토너", "detail_info": {"제조국": "한국"}, "product_name": "DOM 상품명"}
+
+    merged = merge_pages(primary, secondary)
+
+    assert merged["category"] == "스킨/토너"
+    assert merged["product_name"] == "라운드랩 1025 독도 토너 200ml"
+    assert merged["detail_info"] == {"제조국": "한국"}
@@ -0,0 +1,203 @@
+"""
+FileTransaction 커밋 / 롤백 / 비정상 종료 복구 테스트
+임시 디렉토리(tmp_path)에서 실제 파일로 실행합니다.
+"""
+
+import base64
+import json
+import os
+
+import pytest
+
+import file_transaction
+from file_transaction import FileTransaction, recover_transactions
+
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def write(path, content):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+def journals(backup_dir=".transaction_backup"):
+    return [name for name in os.listdir(backup_dir) if name.endswith(file_transaction.JOURNAL_SUFFIX)]
+
+
+def test_commit_writes_files_and_removes_journal():
+    write("log.txt", "첫 줄\n")
+
+    with FileTransaction() as transaction:
+        transaction.append_file("log.txt", "둘째 줄\n")
+        transaction.write_json("data.json", {"next_id": 2})
+        # 커밋 전에는 디스크에 기록하지 않고 버퍼에서 읽음
+        assert read("log.txt") == "첫 줄\n"
+        assert transaction.read_file("log.txt") == "첫 줄\n둘째 줄\n"
+
+    assert read("log.txt") == "첫 줄\n둘째 줄\n"
+    assert json.loads(read("data.json")) == {"next_id": 2}
+    assert journals() == []
+    assert not [name for name in os.listdir(".") if name.endswith(".tmp")]
+
+
+def test_rollback_leaves_files_untouched():
+    write("log.txt", "원본\n")
+
+    with pytest.raises(RuntimeError):
+        with FileTransaction() as transaction:
+            transaction.append_file("log.txt", "추가\n")
+            transaction.write_file("new.txt", "새 파일\n")
+            raise RuntimeError("실패")
+
+    assert read("log.txt") == "원본\n"
+    assert not os.path.exists("new.txt")
+    assert journals() == []
+
+
+def test_crash_after_commit_record_is_rolled_forward(monkeypatch):
+    write("log.txt", "원본\n")
+
+    # 저널에 커밋 기록을 남긴 직후 (파일 반영 전) 종료된 상황
+    def crash(records):
+        raise SystemExit("crash")
+
+    publish_records = file_transaction._publish_records
+    monkeypatch.setattr(file_transaction, "_publish_records", crash)
+    transaction = FileTransaction()
+    transaction.begin()
+    transaction.append_file("log.txt", "추가\n")
+    transaction.write_file("new.txt", "새 파일\n")
+    with pytest.raises(SystemExit):
+        transaction.commit()
+    monkeypatch.setattr(file_transaction, "_publish_records", publish_records)
+
+    assert read("log.txt") == "원본\n"
+    assert len(journals()) == 1
+
+    assert recover_transactions() == 1
+    assert read("log.txt") == "원본\n추가\n"
+    assert read("new.txt") == "새 파일\n"
+    assert journals() == []
+
+
+def test_crash_before_commit_record_is_rolled_back():
+    write("log.txt", "원본\n")
+
+    # 끝부분을 덮어쓴 뒤 커밋 기록 없이 종료된 상황 (백업 모드)
+    transaction = FileTransaction(journal=False)
+    transaction.begin()
+    transaction.append_file("log.txt", "추가\n")
+    transaction.write_file("new.txt", "새 파일\n")
+    assert read("log.txt") == "원본\n추가\n"
+
+    assert recover_transactions() == 1
+    assert read("log.txt") == "원본\n"
+    assert not os.path.exists("new.txt")
+    assert journals() == []
+
+
+def test_truncated_journal_line_is_ignored():
+    write("log.txt", "원본\n깨진 내용")
+    os.makedirs(".transaction_backup")
+    with open(os.path.join(".transaction_backup", "dead.journal"), "w", encoding="utf-8") as f:
+        f.write(json.dumps({"type": "begin", "transaction_id": "dead"}) + "\n")
+        f.write(json.dumps({"type": "undo", "path": "log.txt", "offset": len("원본\n".encode()),
+                            "old_tail": ""}) + "\n")
+        f.write('{"type": "com')  # 기록 도중 종료
+
+    assert recover_transactions() == 1
+    assert read("log.txt") == "원본\n"
+
+
+def test_journal_of_running_process_is_skipped():
+    os.makedirs(".transaction_backup")
+    path = os.path.join(".transaction_backup", "other.journal")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"type": "begin", "transaction_id": "other", "pid": os.getppid()}) + "\n")
+
+    assert recover_transactions() == 0
+    assert os.path.exists(path)
+
+
+def published_records(monkeypatch):
+    """커밋 시 반영되는 저널 기록을 모아두는 리스트"""
+    records = []
+    publish_records = file_transaction._publish_records
+
+    def capture(journal_records):
+        records.extend(journal_records)
+        publish_records(journal_records)
+
+    monkeypatch.setattr(file_transaction, "_publish_records", capture)
+    return records
+
+
+def test_concurrent_appends_are_not_overwritten():
+    write("log.txt", "원본\n")
+
+    # 먼저 시작한 트랜잭션이 나중에 커밋 (다른 프로세스 대신 두 번째 트랜잭션 사용)
+    first = FileTransaction()
+    first.begin()
+    first.append_file("log.txt", "A1\n")
+
+    with FileTransaction() as second:
+        second.append_file("log.txt", "B1\n")
+
+    first.commit()
+    assert read("log.txt") == "원본\nB1\nA1\n"
+
+
+def test_read_before_append_keeps_disk_prefix(monkeypatch):
+    write("log.txt", "원본\n")
+    records = published_records(monkeypatch)
+
+    first = FileTransaction()
+    first.begin()
+    assert first.read_file("log.txt") == "원본\n"
+    first.append_file("log.txt", "A1\n")
+    assert first.read_file("log.txt") == "원본\nA1\n"
+
+    with FileTransaction() as second:
+        second.append_file("log.txt", "B1\n")
+
+    first.commit()
+    # 읽어둔 앞부분을 다시 쓰지 않고 추가한 내용만 기록
+    assert read("log.txt") == "원본\nB1\nA1\n"
+    assert [record["type"] for record in records if record["type"] not in ("begin", "commit")] == ["append"] * 2
+
+
+def test_write_tail_after_read_writes_only_tail(monkeypatch):
+    write("data.sql", "INSERT INTO t VALUES\n(1);\n")
+    records = published_records(monkeypatch)
+    offset = len("INSERT INTO t VALUES\n(1)".encode())
+
+    with FileTransaction() as transaction:
+        assert transaction.read_file("data.sql").endswith("(1);\n")
+        transaction.write_tail("data.sql", offset, ",\n(2);\n")
+        assert transaction.read_file("data.sql") == "INSERT INTO t VALUES\n(1),\n(2);\n"
+
+    assert read("data.sql") == "INSERT INTO t VALUES\n(1),\n(2);\n"
+    [undo] = [record for record in records if record["type"] == "undo"]
+    assert undo["offset"] == offset
+
+
+def test_rolled_forward_append_keeps_later_appends():
+    write("log.txt", "원본\n")
+    os.makedirs(".transaction_backup")
+    with open(os.path.join(".transaction_backup", "dead.journal"), "w", encoding="utf-8") as f:
+        f.write(json.dumps({"type": "begin", "transaction_id": "dead"}) + "\n")
+        f.write(json.dumps({"type": "append", "path": "log.txt", "offset": len("원본\n".encode()),
+                            "data": base64.b64encode("A1\n".encode()).decode("ascii")}) + "\n")
+        f.write(json.dumps({"type": "commit"}) + "\n")
+    # 커밋 기록 후 파일에 반영하기 전에 종료되었고, 그 사이 다른 프로세스가 추가함
+    with open("log.txt", "a", encoding="utf-8") as f:
+        f.write("B1\n")
+
+    assert recover_transactions() == 1
+    assert read("log.txt") == "원본\nB1\nA1\n"
+    # 다시 복구해도 같은 결과 (이미 추가된 내용은 그대로 둠)
+    assert file_transaction.append_at("log.txt", len("원본\nB1\n".encode()), "A1\n") == len("원본\nB1\n".encode())
+    assert read("log.txt") == "원본\nB1\nA1\n"
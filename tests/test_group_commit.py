@@ -0,0 +1,101 @@
+"""
+GroupCommit / 세이브포인트 테스트
+상품별 세이브포인트 롤백, N개 단위 커밋, 커밋 후 콜백 순서를 확인합니다.
+"""
+
+import os
+
+import pytest
+
+from file_transaction import FileTransaction, GroupCommit
+
+
+def read(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def test_savepoint_rolls_back_only_later_changes():
+    rolled_back = []
+
+    with FileTransaction() as transaction:
+        transaction.append_file("log.txt", "상품 1\n")
+        savepoint = transaction.savepoint()
+        transaction.append_file("log.txt", "상품 2\n")
+        transaction.on_rollback(lambda: rolled_back.append(2))
+        transaction.rollback_to_savepoint(savepoint)
+
+        assert transaction.read_file("log.txt") == "상품 1\n"
+        assert rolled_back == [2]
+
+    assert read("log.txt") == "상품 1\n"
+
+
+def test_failed_product_is_rolled_back_and_others_committed():
+    with GroupCommit(batch_size=10, interval=3600) as group:
+        with group.product() as transaction:
+            transaction.append_file("log.txt", "상품 1\n")
+
+        with pytest.raises(ValueError):
+            with group.product() as transaction:
+                transaction.append_file("log.txt", "상품 2\n")
+                raise ValueError("중복 상품")
+
+        with group.product() as transaction:
+            transaction.append_file("log.txt", "상품 3\n")
+
+        # 배치가 차지 않았으므로 아직 디스크에 기록되지 않음
+        assert read("log.txt") is None
+        assert group.pending_count == 2
+
+    assert read("log.txt") == "상품 1\n상품 3\n"
+
+
+def test_flushes_every_batch_size_products():
+    group = GroupCommit(batch_size=2, interval=3600)
+
+    for number in range(1, 4):
+        with group.product() as transaction:
+            transaction.append_file("log.txt", f"상품 {number}\n")
+        if number == 2:
+            assert read("log.txt") == "상품 1\n상품 2\n"
+
+    assert group.pending_count == 1
+    group.close()
+    assert read("log.txt") == "상품 1\n상품 2\n상품 3\n"
+    assert not group.transaction.is_active
+
+
+def test_call_after_commit_waits_for_flush():
+    done = []
+    group = GroupCommit(batch_size=10, interval=3600)
+
+    # 커밋을 기다리는 상품이 없으면 바로 실행
+    group.call_after_commit(lambda: done.append("즉시"))
+    assert done == ["즉시"]
+
+    with group.product() as transaction:
+        transaction.append_file("log.txt", "상품 1\n")
+    group.call_after_commit(lambda: done.append("상품 1"))
+    assert done == ["즉시"]
+
+    group.flush()
+    assert done == ["즉시", "상품 1"]
+
+
+def test_commit_callback_of_rolled_back_product_is_dropped():
+    committed = []
+    group = GroupCommit(batch_size=10, interval=3600)
+
+    with pytest.raises(ValueError):
+        with group.product() as transaction:
+            transaction.on_commit(lambda: committed.append("실패한 상품"))
+            raise ValueError("검증 오류")
+
+    with group.product() as transaction:
+        transaction.on_commit(lambda: committed.append("저장한 상품"))
+
+    group.close()
+    assert committed == ["저장한 상품"]
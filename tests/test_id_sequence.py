@@ -0,0 +1,96 @@
+"""
+IdSequence 블록 임대 테스트
+두 객체가 같은 시퀀스 데이터베이스를 사용하는 경우를 여러 프로세스 대신 확인합니다.
+"""
+
+import json
+
+import pytest
+
+import productDetailInfoProvided
+from file_transaction import FileTransaction
+from id_sequence import IdSequence
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "id_sequences.db")
+
+
+def test_ids_come_from_leased_blocks(db_path):
+    first = IdSequence("products", block_size=3, db_path=db_path)
+    second = IdSequence("products", block_size=3, db_path=db_path)
+
+    assert [first.next(), first.next()] == [1, 2]
+    # 다른 프로세스는 다음 블록을 받으므로 ID가 겹치지 않음
+    assert second.next() == 4
+    assert [first.next(), first.next()] == [3, 7]
+
+
+def test_seed_raises_the_sequence(db_path):
+    sequence = IdSequence("brands", seed=lambda: 715, block_size=10, db_path=db_path)
+    assert sequence.next() == 715
+
+    # 시드가 시퀀스보다 작으면 시퀀스 값 유지
+    other = IdSequence("brands", seed=lambda: 1, block_size=10, db_path=db_path)
+    assert other.next() == 725
+
+
+def test_ensure_minimum_skips_rest_of_leased_block(db_path):
+    sequence = IdSequence("products", block_size=10, db_path=db_path)
+    assert sequence.next() == 1
+
+    sequence.ensure_minimum(51)
+    assert sequence.next() == 51
+    # 이미 최솟값 이상이면 그대로
+    sequence.ensure_minimum(10)
+    assert sequence.next() == 52
+
+
+def test_release_reuses_only_the_last_id(db_path):
+    sequence = IdSequence("products", block_size=10, db_path=db_path)
+    ids = [sequence.next() for _ in range(3)]
+
+    sequence.release(ids[0])
+    assert sequence.next() == 4
+
+    sequence.release(4)
+    assert sequence.next() == 4
+
+
+def test_close_returns_unused_ids(db_path):
+    sequence = IdSequence("products", block_size=10, db_path=db_path)
+    sequence.next()
+    sequence.next()
+    sequence.close()
+
+    assert IdSequence("products", block_size=10, db_path=db_path).next() == 3
+
+
+def test_close_keeps_gap_when_next_block_was_leased(db_path):
+    first = IdSequence("products", block_size=10, db_path=db_path)
+    second = IdSequence("products", block_size=10, db_path=db_path)
+    first.next()
+    second.next()
+    first.close()
+
+    # 첫 번째 블록의 남은 ID는 반납되지 않고 세 번째 블록은 21부터
+    assert IdSequence("products", block_size=10, db_path=db_path).next() == 21
+
+
+def test_detailinfo_next_id_advances_only_on_commit(tmp_path, monkeypatch, db_path):
+    sequence = IdSequence("product_detail_info", seed=lambda: 41, block_size=10, db_path=db_path)
+    monkeypatch.setattr(productDetailInfoProvided, "get_sequence", lambda name, seed=None: sequence)
+
+    with pytest.raises(ValueError):
+        with FileTransaction() as transaction:
+            assert productDetailInfoProvided.get_next_detailinfo_id(transaction) == 41
+            raise ValueError("검증 오류")
+    assert not (tmp_path / "detailinfo_data.json").exists()
+
+    with FileTransaction() as transaction:
+        # 롤백된 ID는 반납되어 다시 할당
+        assert productDetailInfoProvided.get_next_detailinfo_id(transaction) == 41
+
+    data = json.loads((tmp_path / "detailinfo_data.json").read_text(encoding="utf-8"))
+    assert data == {"last_id": 41, "next_id": 42}
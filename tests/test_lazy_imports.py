@@ -0,0 +1,22 @@
+"""
+Selenium 지연 임포트 테스트
+Selenium이 설치되지 않은 환경에서도 크롤러 모듈을 임포트할 수 있는지 확인합니다. (별도 프로세스에서 실행)
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# sys.modules에 None을 넣으면 해당 패키지 임포트가 ImportError로 실패 (설치되지 않은 환경과 같음)
+BLOCK_SELENIUM = "import sys; sys.modules['selenium'] = sys.modules['undetected_chromedriver'] = None; "
+
+
+@pytest.mark.parametrize("module", ["crawl", "worker_pool", "tab_crawler", "mainImgCol", "option", "productInfo"])
+def test_module_imports_without_selenium(module):
+    result = subprocess.run([sys.executable, "-c", BLOCK_SELENIUM + f"import {module}"],
+                            cwd=ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
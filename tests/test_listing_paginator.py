@@ -0,0 +1,109 @@
+"""
+ListingPaginator 테스트
+브라우저 대신 페이지별 상품 수만 돌려주는 가짜 드라이버로 페이지 URL과 이동 순서를 확인합니다.
+"""
+
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+import listing_paginator
+from listing_paginator import PRODUCT_LINKS_JS, ListingPaginator
+
+START_URL = ("https://www.oliveyoung.co.kr/store/display/getMCategoryList.do"
+             "?dispCatNo=100000100010013&prdSort=01&pageIdx=3&rowsPerPage=24&checkBrnds=A%2CB")
+
+
+class FakeListingDriver:
+    """pageIdx별 상품 수를 돌려주는 가짜 드라이버 (상품이 없는 페이지는 목록 요소도 없음)"""
+
+    def __init__(self, counts, total_text=""):
+        self.counts = counts
+        self.total_text = total_text
+        self.current_url = None
+        self.visited = []
+
+    @property
+    def page_idx(self):
+        return int(parse_qs(urlsplit(self.current_url).query)["pageIdx"][0])
+
+    def get(self, url):
+        self.current_url = url
+        self.visited.append(self.page_idx)
+
+    def execute_script(self, script):
+        if script == f"return {PRODUCT_LINKS_JS}.length;":
+            return self.counts.get(self.page_idx, 0)
+        if "getElementById('Contents') !== null" in script:
+            return True
+        if "innerText" in script:
+            return self.total_text
+        raise AssertionError(f"예상하지 못한 스크립트: {script}")
+
+
+@pytest.fixture(autouse=True)
+def instant_wait(monkeypatch):
+    # 상품 목록 요소는 상품이 있는 페이지에만 나타남
+    monkeypatch.setattr(listing_paginator, "wait_for_xpath",
+                        lambda driver, xpath, timeout=10: driver.counts.get(driver.page_idx, 0) > 0)
+
+
+def test_page_url_replaces_only_paging_parameters():
+    paginator = ListingPaginator(START_URL, rows_per_page=48)
+    params = parse_qs(urlsplit(paginator.page_url(5)).query)
+
+    assert params["pageIdx"] == ["5"]
+    assert params["rowsPerPage"] == ["48"]
+    assert params["dispCatNo"] == ["100000100010013"]
+    assert params["checkBrnds"] == ["A,B"]
+
+
+def test_last_page_from_total_count():
+    paginator = ListingPaginator(START_URL, rows_per_page=48)
+    with pytest.raises(ValueError):
+        paginator.page_urls()
+
+    paginator.total_count = 97
+    assert paginator.last_page == 3
+    assert len(paginator.page_urls()) == 3
+
+    paginator.total_count = 0
+    assert paginator.last_page == 1
+
+
+def test_iter_pages_stops_at_last_page_from_total_count():
+    driver = FakeListingDriver({1: 48, 2: 48, 3: 1}, total_text="총 97개의 상품이 등록되어 있습니다.")
+    paginator = ListingPaginator(START_URL, rows_per_page=48)
+
+    assert list(paginator.iter_pages(driver)) == [1, 2, 3]
+    assert paginator.total_count == 97
+    assert paginator.reached_end
+    assert driver.visited == [1, 2, 3]
+
+
+def test_iter_pages_stops_after_short_page_without_total_count():
+    driver = FakeListingDriver({1: 48, 2: 48, 3: 10, 4: 48})
+    paginator = ListingPaginator(START_URL, rows_per_page=48)
+
+    assert list(paginator.iter_pages(driver, start_page=2)) == [2, 3]
+    assert paginator.reached_end
+    assert driver.visited == [2, 3]
+
+
+def test_empty_page_past_the_end_is_end_of_listing():
+    driver = FakeListingDriver({1: 48, 2: 48})
+    paginator = ListingPaginator(START_URL, rows_per_page=48)
+
+    assert list(paginator.iter_pages(driver, timeout=0)) == [1, 2]
+    assert paginator.reached_end
+    assert driver.visited == [1, 2, 3]
+
+
+def test_load_failure_is_not_end_of_listing(monkeypatch):
+    driver = FakeListingDriver({1: 48, 2: 48})
+    paginator = ListingPaginator(START_URL, rows_per_page=48)
+    # 목록 영역 자체가 없는 페이지 (Cloudflare 확인 페이지 등)
+    monkeypatch.setattr(ListingPaginator, "is_empty_page", lambda self, driver: False)
+
+    assert list(paginator.iter_pages(driver, timeout=0)) == [1, 2]
+    assert not paginator.reached_end
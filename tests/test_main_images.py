@@ -0,0 +1,62 @@
+"""
+메인 이미지 일괄 수집 테스트
+슬라이드 속성 목록을 돌려주는 가짜 드라이버로 lazy loading 자리표시자와 loop 모드 복제 슬라이드 처리를 확인합니다.
+"""
+
+import pytest
+
+import mainImgCol
+from mainImgCol import get_main_image_urls, slide_image_src
+
+PLACEHOLDER = "data:image/gif;base64,R0lGODlhAQABAAAAACw="
+IMAGE_BASE = "https://image.oliveyoung.co.kr/cfimages/cf-goods/uploads/images/thumbnails/10/0000/0018/"
+
+
+class FakeSlideDriver:
+    """READ_SLIDES_SCRIPT 결과([index, src, data-src, alt] 리스트)만 돌려주는 가짜 드라이버"""
+
+    def __init__(self, slides):
+        self.slides = slides
+
+    def execute_script(self, script):
+        assert script == mainImgCol.READ_SLIDES_SCRIPT
+        return self.slides
+
+
+@pytest.fixture(autouse=True)
+def instant_wait(monkeypatch):
+    monkeypatch.setattr(mainImgCol, "wait_for_image_src", lambda driver, css_selector, timeout=10: True)
+
+
+def test_slide_image_src_skips_placeholder():
+    assert slide_image_src(PLACEHOLDER, IMAGE_BASE + "a.jpg") == IMAGE_BASE + "a.jpg"
+    assert slide_image_src(IMAGE_BASE + "a.jpg", IMAGE_BASE + "b.jpg") == IMAGE_BASE + "a.jpg"
+    assert slide_image_src(None, None, IMAGE_BASE + "c.jpg") == IMAGE_BASE + "c.jpg"
+    assert slide_image_src(PLACEHOLDER, None, "상품 이미지") is None
+
+
+def test_lazy_loaded_slides_use_data_src():
+    driver = FakeSlideDriver([
+        # loop 모드 앞쪽 복제 슬라이드 (마지막 슬라이드)
+        ["2", PLACEHOLDER, IMAGE_BASE + "c.jpg", None],
+        ["0", IMAGE_BASE + "a.jpg?l=ko&QT=85&SF=webp", None, None],
+        # 아직 로드되지 않은 슬라이드는 src가 자리표시자
+        ["1", PLACEHOLDER, "//image.oliveyoung.co.kr/cfimages/cf-goods/uploads/images/thumbnails/10/0000/0018/b.jpg",
+         None],
+        ["2", PLACEHOLDER, IMAGE_BASE + "c.jpg", None],
+        ["0", IMAGE_BASE + "a.jpg?l=ko&QT=85&SF=webp", None, None],
+    ])
+
+    assert get_main_image_urls(driver, num_images=3) == [
+        IMAGE_BASE + "a.jpg?l=ko", IMAGE_BASE + "b.jpg", IMAGE_BASE + "c.jpg",
+    ]
+
+
+def test_placeholder_does_not_take_the_slide_index():
+    # 먼저 나온 복제 슬라이드에 자리표시자만 있어도 같은 인덱스의 실제 URL을 사용
+    driver = FakeSlideDriver([
+        ["0", PLACEHOLDER, None, None],
+        ["0", PLACEHOLDER, IMAGE_BASE + "a.jpg", None],
+    ])
+
+    assert get_main_image_urls(driver, num_images=3) == [IMAGE_BASE + "a.jpg"]
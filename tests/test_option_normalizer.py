@@ -0,0 +1,31 @@
+"""option_normalizer 테스트"""
+
+from option_normalizer import normalize_image_url, normalize_options
+
+
+def test_normalize_image_url():
+    assert normalize_image_url("//img.example/a.jpg?QT=85&SF=webp", None) == "https://img.example/a.jpg"
+    assert normalize_image_url("https://img.example/a.jpg?x=1&sharpen=on", None) == "https://img.example/a.jpg?x=1"
+    assert normalize_image_url("data:image/gif;base64,x", "기본값") == "기본값"
+    assert normalize_image_url(None, "기본값") == "기본값"
+
+
+def test_normalize_multi_options():
+    options = normalize_options([
+        {"name": "01 라이트", "price": "12,900원", "image_url": "//img.example/1.jpg", "is_soldout": True},
+        {"name": None, "price": None, "image_url": None},
+    ], is_multi_option=True)
+
+    assert options == [
+        {"index": 1, "name": "01 라이트", "price": "12900", "image_url": "https://img.example/1.jpg",
+         "is_soldout": True},
+        {"index": 2, "name": "옵션명 추출 실패", "price": "가격 추출 실패", "image_url": "이미지 요소 없음",
+         "is_soldout": False},
+    ]
+
+
+def test_normalize_single_option_defaults():
+    options = normalize_options([{}], is_multi_option=False)
+    assert options[0]["name"] == "단일 상품명"
+    assert options[0]["price"] == "0"
+    assert options[0]["image_url"] == "URL 추출 실패"
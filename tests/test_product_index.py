@@ -0,0 +1,150 @@
+"""
+ProductIndex 테스트
+스냅샷 + 추가 전용 로그 재생, 로그 압축(스냅샷 병합), 트랜잭션 롤백 시 인덱스 복원을 확인합니다.
+"""
+
+import json
+import os
+
+import pytest
+
+import product_mapping
+from file_transaction import FileTransaction
+from product_mapping import ProductIndex
+
+
+@pytest.fixture(autouse=True)
+def index_settings(monkeypatch, get_sequence):
+    monkeypatch.setattr(product_mapping, "get_sequence", get_sequence)
+    monkeypatch.setattr(product_mapping, "COMPACT_THRESHOLD", 3)
+
+
+def new_index():
+    index = ProductIndex(snapshot_path="product_data.json", log_path="product_data.log")
+    index.load()
+    return index
+
+
+def log_lines():
+    with open("product_data.log", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_log_is_replayed_on_load():
+    with open("product_data.json", "w", encoding="utf-8") as f:
+        json.dump({"products": {"기존 상품": 5}, "next_id": 6}, f)
+
+    index = new_index()
+    assert index.allocate("새 상품") == 6
+
+    reloaded = new_index()
+    assert reloaded.products == {"기존 상품": 5, "새 상품": 6}
+    assert reloaded.next_id == 7
+    assert log_lines() == [{"name": "새 상품", "id": 6}]
+
+
+def test_log_is_compacted_into_snapshot_at_threshold():
+    index = new_index()
+    for number in range(1, 3):
+        index.allocate(f"상품 {number}")
+    assert len(log_lines()) == 2
+    assert not os.path.exists("product_data.json")
+
+    index.allocate("상품 3")
+
+    assert log_lines() == []
+    with open("product_data.json", encoding="utf-8") as f:
+        snapshot = json.load(f)
+    assert snapshot == {"products": {"상품 1": 1, "상품 2": 2, "상품 3": 3}, "next_id": 4}
+    assert index.log_entries == 0
+    assert new_index().products == snapshot["products"]
+
+
+def test_other_instance_reloads_after_compaction():
+    writer = new_index()
+    reader = new_index()
+    for number in range(1, 4):
+        writer.allocate(f"상품 {number}")
+
+    # 로그 파일이 교체되었으므로 스냅샷부터 다시 읽음
+    reader.refresh()
+    assert reader.contains("상품 3")
+    assert reader.next_id == 4
+
+
+def test_incomplete_last_log_line_is_read_later():
+    index = new_index()
+    with open("product_data.log", "w", encoding="utf-8") as f:
+        f.write('{"name": "상품 1", "id": 1}\n{"name": "상품')
+
+    index.refresh()
+    assert index.products == {"상품 1": 1}
+
+    with open("product_data.log", "a", encoding="utf-8") as f:
+        f.write(' 2", "id": 2}\n')
+    index.refresh()
+    assert index.products == {"상품 1": 1, "상품 2": 2}
+
+
+def test_rollback_removes_name_and_reuses_id():
+    index = new_index()
+
+    with pytest.raises(ValueError):
+        with FileTransaction() as transaction:
+            assert index.allocate("실패한 상품", transaction) == 1
+            assert index.contains("실패한 상품")
+            raise ValueError("검증 오류")
+
+    assert not index.contains("실패한 상품")
+    assert not os.path.exists("product_data.log")
+
+    with FileTransaction() as transaction:
+        assert index.allocate("저장한 상품", transaction) == 1
+
+    assert log_lines() == [{"name": "저장한 상품", "id": 1}]
+
+
+def test_concurrent_allocations_are_all_logged():
+    first = new_index()
+    second = new_index()
+
+    # 다른 프로세스 대신 두 번째 인덱스가 먼저 커밋
+    transaction = FileTransaction()
+    transaction.begin()
+    first_id = first.allocate("상품 A", transaction)
+    with FileTransaction() as other:
+        second_id = second.allocate("상품 B", other)
+    transaction.commit()
+
+    assert first_id != second_id
+    assert sorted(entry["name"] for entry in log_lines()) == ["상품 A", "상품 B"]
+    assert new_index().products == {"상품 A": first_id, "상품 B": second_id}
+
+
+def test_allocation_committed_after_other_compaction():
+    writer = new_index()
+    transaction = FileTransaction()
+    transaction.begin()
+    pending_id = writer.allocate("대기 상품", transaction)
+
+    # 커밋 전에 다른 인덱스가 로그를 압축 (로그 파일 교체)
+    other = new_index()
+    for number in range(1, 4):
+        other.allocate(f"상품 {number}")
+    transaction.commit()
+
+    with open("product_data.log", "rb") as f:
+        assert b"\0" not in f.read()
+    assert log_lines() == [{"name": "대기 상품", "id": pending_id}]
+    assert len(new_index().products) == 4
+
+
+def test_compact_includes_entries_of_other_instances():
+    stale = new_index()
+    writer = new_index()
+    writer.allocate("다른 프로세스 상품")
+
+    stale.compact()
+
+    with open("product_data.json", encoding="utf-8") as f:
+        assert "다른 프로세스 상품" in json.load(f)["products"]
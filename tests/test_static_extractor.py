@@ -0,0 +1,71 @@
+"""
+static_extractor / page_fetcher 오프라인 테스트
+저장해 둔 상세 페이지 HTML(fixtures/product_detail.html)을 브라우저 없이 파싱합니다.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from page_fetcher import HttpFetcher
+from static_extractor import extract_product_html, missing_fields, parse_html
+
+FIXTURE = Path(__file__).parent / "fixtures" / "product_detail.html"
+IMAGE_BASE = "https://image.oliveyoung.co.kr/cfimages/cf-goods/uploads/images/thumbnails/10/0000/0016/"
+DETAIL_BASE = "https://image.oliveyoung.co.kr/cfimages/cf-goods/uploads/images/html/crop/A000000162325/"
+
+
+@pytest.fixture
+def html():
+    return FIXTURE.read_text(encoding="utf-8")
+
+
+def test_http_path_does_not_import_selenium():
+    assert not [name for name in sys.modules if name.startswith(("selenium", "undetected_chromedriver"))]
+
+
+def test_extract_product_html(html):
+    page = extract_product_html(html)
+
+    assert page["category"] == "스킨/토너"
+    assert page["brand"] == "라운드랩"
+    assert page["product_name"] == "독도 토너 200ml"
+    # 슬라이드 인덱스 순서, 복제 슬라이드 제거, 이미지 쿼리 파라미터(QT) 정리
+    assert page["main_image_urls"] == [IMAGE_BASE + "a.jpg", IMAGE_BASE + "b.jpg?a=1"]
+    # lazy loading 속성(data-src) 우선, data:image 자리표시자 제외
+    assert page["detail_image_urls"] == [DETAIL_BASE + "1.jpg", DETAIL_BASE + "2.jpg"]
+    assert page["product_options"] == [{
+        "index": 1, "name": "독도 토너 200ml", "price": "15000",
+        "image_url": IMAGE_BASE + "a.jpg", "is_soldout": False,
+    }]
+    assert page["detail_info"] == {"용량": "200ml", "제조국": "한국"}
+    assert missing_fields(page) == []
+
+
+def test_missing_fields_when_rendered_by_script():
+    page = extract_product_html("<html><body><div id='main'></div></body></html>")
+    assert set(missing_fields(page)) == {"category", "product_name", "main_image_urls", "detail_image_urls",
+                                         "product_options", "detail_info"}
+
+
+def test_http_fetcher_parse(html):
+    record = HttpFetcher().parse(html, product_counter=1)
+
+    assert record["category_id"] == 60
+    assert record["product_name"] == "독도 토너 200ml"
+    assert len(record["main_image_urls"]) == 2
+
+
+def test_http_fetcher_parse_rejects_duplicate(html):
+    with pytest.raises(ValueError):
+        HttpFetcher().parse(html, product_counter=1, is_duplicate=lambda name: name == "독도 토너 200ml")
+
+
+def test_xpath_and_css_selectors():
+    doc = parse_html('<div id="a"><p>x</p><p class="k v">y</p><p data-i="2">z</p></div>')
+
+    assert doc.xpath('//*[@id="a"]/p[2]').text == "y"
+    assert doc.select_one("#a > p.k.v").text == "y"
+    assert doc.select_one('p[data-i="2"]').text == "z"
+    assert [p.text for p in doc.select("div p:nth-child(3)")] == ["z"]
@@ -0,0 +1,150 @@
+"""
+상세 페이지 크롤링 워커 풀
+워커 스레드마다 자신의 브라우저(드라이버)를 가지고 공유 큐에서 상세 페이지 URL을 꺼내 데이터를 수집합니다.
+
+워커는 collect_product_record()로 수집만 하고 파일/DB에는 쓰지 않습니다.
+수집 결과는 결과 큐로 모이고, run()을 호출한 스레드 하나(writer)만 저장 함수를 실행하므로
+SQL 출력 파일, 트랜잭션, ID 할당은 기존처럼 한 곳에서만 다뤄집니다.
+"""
+
+import queue
+import threading
+import traceback
+
+from crawl import collect_product_record
+from page_extractor import PRODUCT_NAME_XPATH
+from page_wait import wait_for_xpath
+
+# 기본 워커 수 (브라우저 수)
+DEFAULT_NUM_WORKERS = 4
+
+# 워커 종료 표시
+_DONE = object()
+
+
+class DetailWorkerPool:
+    """
+    상세 페이지 수집 워커 풀
+
+    사용 예:
+        pool = DetailWorkerPool(create_driver, num_workers=4, known_names=existing_names)
+        pool.run(product_urls, save=lambda record, counter: ...)
+    """
+
+    def __init__(self, driver_factory, num_workers=DEFAULT_NUM_WORKERS, known_names=None, reuse_driver=None):
+        """
+        Args:
+            driver_factory: 새 드라이버를 만드는 함수 (워커마다 한 번 호출)
+            num_workers: 워커(브라우저) 수
+            known_names: 이미 저장된 상품명 집합 (워커가 상세 정보 수집 전에 중복 상품을 거름)
+            reuse_driver: 첫 번째 워커가 그대로 사용할 기존 드라이버 (풀이 종료하지 않음)
+        """
+        self.driver_factory = driver_factory
+        self.num_workers = max(1, num_workers)
+        self.known_names = known_names if known_names is not None else set()
+        self.reuse_driver = reuse_driver
+        self._launch_lock = threading.Lock()  # 드라이버 실행 파일 패치가 겹치지 않도록 한 번에 하나씩 생성
+
+    def _is_duplicate(self, product_name):
+        """워커용 중복 확인 (writer가 저장한 상품명 포함, 최종 확인은 저장 시 수행)"""
+        return product_name in self.known_names
+
+    def _worker(self, worker_id, url_queue, result_queue):
+        """URL 큐가 빌 때까지 상세 페이지를 열어 데이터를 수집합니다."""
+        driver = None
+        owns_driver = False
+
+        try:
+            if worker_id == 0 and self.reuse_driver is not None:
+                driver = self.reuse_driver
+            else:
+                with self._launch_lock:
+                    driver = self.driver_factory()
+                owns_driver = True
+            print(f"[Worker {worker_id}] 드라이버 준비 완료")
+
+            while True:
+                item = url_queue.get()
+                if item is _DONE:
+                    break
+
+                product_counter, product = item
+                try:
+                    driver.get(product["url"])
+                    wait_for_xpath(driver, PRODUCT_NAME_XPATH)
+                    record = collect_product_record(driver, product_counter, is_duplicate=self._is_duplicate)
+                    result_queue.put((product_counter, product, record, None))
+                except Exception as e:
+                    result_queue.put((product_counter, product, None, e))
+
+        except Exception as e:
+            print(f"[Worker {worker_id}] ✗ 워커 오류로 종료: {e}")
+            traceback.print_exc()
+
+        finally:
+            if owns_driver and driver:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+            result_queue.put(_DONE)
+
+    def run(self, product_urls, save, on_error=None):
+        """
+        모든 URL을 워커에 나눠 수집하고, 수집 결과를 이 스레드에서 하나씩 저장합니다.
+
+        Args:
+            product_urls: [{"url": 상세 페이지 URL, ...}, ...]
+            save: save(record, product_counter) -> bool, 수집 결과 저장 함수 (writer 스레드에서만 실행)
+            on_error: on_error(product_counter, product, error), 수집 실패 시 호출할 함수
+
+        Returns:
+            int: 저장에 성공한 상품 수
+        """
+        url_queue = queue.Queue()
+        result_queue = queue.Queue()
+
+        for product_counter, product in enumerate(product_urls, start=1):
+            url_queue.put((product_counter, product))
+
+        num_workers = min(self.num_workers, len(product_urls)) or 1
+        for _ in range(num_workers):
+            url_queue.put(_DONE)
+
+        threads = [
+            threading.Thread(target=self._worker, args=(worker_id, url_queue, result_queue),
+                             name=f"crawl-worker-{worker_id}", daemon=True)
+            for worker_id in range(num_workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        print(f"[WorkerPool] 워커 {num_workers}개로 상품 {len(product_urls)}개 수집 시작")
+
+        saved_count = 0
+        finished_workers = 0
+
+        while finished_workers < num_workers:
+            item = result_queue.get()
+            if item is _DONE:
+                finished_workers += 1
+                continue
+
+            product_counter, product, record, error = item
+
+            if error is not None:
+                if on_error:
+                    on_error(product_counter, product, error)
+                else:
+                    print(f"✗ 상품 {product_counter} 수집 실패: {error}")
+                continue
+
+            if save(record, product_counter):
+                saved_count += 1
+                self.known_names.add(record["product_name"])
+
+        for thread in threads:
+            thread.join()
+
+        print(f"[WorkerPool] 수집 완료: {saved_count}/{len(product_urls)}개 저장")
+        return saved_count